@@ -7,6 +7,8 @@ from sentence_transformers import SentenceTransformer
 import faiss
 import psutil
 import logging
+import hashlib
+from itertools import compress
 
 # Configure logging
 logging.basicConfig(
@@ -15,8 +17,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("EmbeddingService")
 
+# IVFPQ trains 256 centroids per sub-quantizer; FAISS wants ~39 training points per centroid
+IVFPQ_MIN_DOCS = 39 * 256
+
 class EmbeddingService:
-    def __init__(self, model_name, use_mps=True, use_quantization=False):
+    def __init__(self, model_name, use_mps=True, use_quantization=False, index_type="auto",
+                 use_compile=False):
         """
         Initialize the embedding service
         
@@ -24,55 +30,56 @@ class EmbeddingService:
             model_name: Name of the SentenceTransformer model to use
             use_mps: Whether to use MPS acceleration (if available)
             use_quantization: Whether to use quantized model
+            index_type: FAISS index for the CPU path: 'flat', 'sq8', 'hnsw', 'ivfpq' or 'auto'
+                        (flat below 1K docs, HNSW up to 100K, IVFPQ beyond).
+                        'flat' stores vectors in FP16, 'sq8' in 8 bits; 'ivfpq' on a corpus
+                        too small to train it falls back to the 'auto' choice
+            use_compile: Whether to torch.compile the encoder forward pass
         """
         self.model_name = model_name
         self.use_mps = use_mps and torch.backends.mps.is_available()
         self.use_quantization = use_quantization
+        self.index_type = index_type
+        self.use_compile = use_compile
         
         logger.info(f"Initializing Embedding Service with model: {model_name}")
         logger.info(f"MPS acceleration: {'Enabled' if self.use_mps else 'Disabled'}")
         logger.info(f"Quantization: {'Enabled' if self.use_quantization else 'Disabled'}")
+        logger.info(f"torch.compile: {'Enabled' if self.use_compile else 'Disabled'}")
         
-        # Record initial memory usage
+        # Record initial memory usage (one psutil handle reused for every snapshot)
+        self._proc = psutil.Process(os.getpid())
         self.initial_memory = self._get_memory_usage()
         
         # Load model
         self._load_model()
         
-        # Create FAISS index
+        # Create FAISS index (CPU) or FP16 corpus tensor (MPS)
         self.index = None
+        self.corpus_t = None
         self.corpus = []
+        self.corpus_arr = np.array([], dtype=object)
         self.corpus_embeddings = None
     
     def _load_model(self):
         """Load the SentenceTransformer model with appropriate configurations"""
         start_time = time.time()
         
-        # Set default device if using MPS
-        if self.use_mps:
-            logger.info("Setting default device to MPS")
-            torch.set_default_device('mps')
-        
-        # Load the model
-        self.model = SentenceTransformer(self.model_name)
-        
-        # Try quantization if requested
-        if self.use_quantization:
-            try:
-                logger.info("Attempting to quantize model...")
-                # Try built-in quantization if available
-                self.model = self.model.to_device(device='cpu', to_8bit=True)
-                logger.info("Model quantized successfully using built-in method")
-            except Exception as e:
-                logger.warning(f"Built-in quantization failed: {e}")
-                logger.info("Falling back to manual quantization using bitsandbytes")
-                try:
-                    import bitsandbytes as bnb
-                    # Manual quantization could be implemented here
-                    # This is just a placeholder
-                    logger.info("Manual quantization with bitsandbytes is not implemented yet")
-                except ImportError:
-                    logger.warning("bitsandbytes not available for manual quantization")
+        # Place the model explicitly; encode() moves its inputs to the same device
+        self.device = 'mps' if self.use_mps else 'cpu'
+        logger.info(f"Loading model on {self.device}")
+        
+        # Load the model (8-bit weights via bitsandbytes on the GPU path)
+        model_kwargs = self._8bit_model_kwargs() if self.use_quantization and self.use_mps else None
+        self.model = SentenceTransformer(self.model_name, device=self.device, model_kwargs=model_kwargs)
+        self.model.eval()
+        
+        # INT8 dynamic quantization on the CPU path
+        if self.use_quantization and not self.use_mps:
+            self._quantize_dynamic_int8()
+        
+        if self.use_compile:
+            self._compile_model()
         
         # Log memory usage after model loading
         load_time = time.time() - start_time
@@ -82,41 +89,197 @@ class EmbeddingService:
         logger.info(f"Model loaded in {load_time:.2f} seconds")
         logger.info(f"Model memory usage: {model_memory:.2f} MB")
     
+    def _quantize_dynamic_int8(self):
+        """Convert the encoder's Linear layers to INT8 for the CPU inference path"""
+        try:
+            logger.info("Applying INT8 dynamic quantization to Linear layers...")
+            engines = torch.backends.quantized.supported_engines
+            torch.backends.quantized.engine = 'fbgemm' if 'fbgemm' in engines else 'qnnpack'
+            self.model[0].auto_model = torch.ao.quantization.quantize_dynamic(
+                self.model[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info(f"Model quantized successfully using {torch.backends.quantized.engine}")
+        except Exception as e:
+            logger.warning(f"Dynamic quantization failed, using FP32 model: {e}")
+    
+    def _compile_model(self, batch_size=64):
+        """Compile the encoder into a fused graph, falling back to eager mode if unsupported"""
+        eager_model = self.model[0].auto_model
+        try:
+            logger.info("Compiling encoder with torch.compile (mode='reduce-overhead')...")
+            self.model[0].auto_model = torch.compile(eager_model, mode='reduce-overhead', dynamic=False)
+            # Compilation is lazy; warm up once so the first real encode isn't charged for it
+            with torch.inference_mode():
+                self.model.encode(["warm-up"] * batch_size, batch_size=batch_size)
+            logger.info("Encoder compiled successfully")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager model: {e}")
+            self.model[0].auto_model = eager_model
+    
+    def _8bit_model_kwargs(self):
+        """Build model_kwargs that load 8-bit weights with bitsandbytes, if available"""
+        try:
+            import bitsandbytes  # noqa: F401
+            from transformers import BitsAndBytesConfig
+            logger.info("Loading model in 8-bit with bitsandbytes")
+            return {"quantization_config": BitsAndBytesConfig(load_in_8bit=True)}
+        except ImportError:
+            logger.warning("bitsandbytes not available for 8-bit loading, using FP32 model")
+            return None
+    
     def _get_memory_usage(self):
         """Get current memory usage in MB"""
-        process = psutil.Process(os.getpid())
-        return process.memory_info().rss / (1024 * 1024)
+        return self._proc.memory_info().rss / (1024 * 1024)
     
-    def build_index(self, corpus, batch_size=64):
+    def build_index(self, corpus, batch_size=64, cache_dir=None):
         """
         Build a FAISS index from a corpus of texts
         
         Args:
             corpus: List of strings to index
             batch_size: Batch size for encoding
+            cache_dir: Directory to persist embeddings and the FAISS index in, keyed
+                       by a hash of the model and corpus; later runs skip encoding
         """
         self.corpus = corpus
+        self.corpus_arr = np.asarray(corpus, dtype=object)
         logger.info(f"Building index with {len(corpus)} documents")
         
-        # Encode corpus
-        start_time = time.time()
-        self.corpus_embeddings = self.encode(corpus, batch_size=batch_size)
-        encode_time = time.time() - start_time
-        logger.info(f"Corpus encoded in {encode_time:.2f} seconds")
+        cache_path = self._corpus_cache_path(corpus, cache_dir) if cache_dir else None
+        index_path = f"{cache_path}_{self.index_type}.faiss" if cache_path else None
         
-        # Create FAISS index
-        embedding_dim = self.corpus_embeddings.shape[1]
         start_time = time.time()
-        self.index = faiss.IndexFlatIP(embedding_dim)  # Inner product for cosine similarity
-        self.index.add(self.corpus_embeddings)
-        index_time = time.time() - start_time
-        logger.info(f"FAISS index built in {index_time:.2f} seconds with {self.index.ntotal} vectors")
+        if self.use_mps:
+            # Keep the corpus on the GPU in half precision; search becomes an FP16 GEMM
+            self.corpus_t = self._encode_corpus(corpus, batch_size, cache_path,
+                                                device=self.device, dtype=torch.float16)
+            index_time = time.time() - start_time
+            logger.info(f"MPS FP16 index built in {index_time:.2f} seconds with {self.corpus_t.shape[0]} vectors")
+        elif index_path and os.path.exists(index_path):
+            # Memory-map the persisted index; pages are faulted in lazily on search
+            self.index = self._read_faiss_index(index_path)
+            index_time = time.time() - start_time
+            logger.info(f"FAISS {type(self.index).__name__} loaded from {index_path} in {index_time:.2f} seconds")
+        else:
+            # Create FAISS index (FAISS needs host memory)
+            self.corpus_embeddings = self._encode_corpus(corpus, batch_size, cache_path).numpy()
+            self.index = self._create_faiss_index(self.corpus_embeddings)
+            self.index.add(self.corpus_embeddings)
+            if index_path:
+                faiss.write_index(self.index, index_path)
+            index_time = time.time() - start_time
+            logger.info(f"FAISS {type(self.index).__name__} built in {index_time:.2f} seconds with {self.index.ntotal} vectors")
         
         # Log memory usage
         current_memory = self._get_memory_usage()
         total_memory = current_memory - self.initial_memory
         logger.info(f"Total memory usage after indexing: {total_memory:.2f} MB")
     
+    def _corpus_cache_path(self, corpus, cache_dir):
+        """
+        Path prefix for the artifacts persisted for this model and corpus
+        
+        The key also covers quantization and the device (which decides FP16 storage
+        on MPS), since those change the embeddings the model produces
+        """
+        digest = hashlib.sha1(f"{self.model_name}\0{self.use_quantization}\0{self.device}".encode())
+        for doc in corpus:
+            digest.update(doc.encode())
+            digest.update(b"\0")
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, digest.hexdigest()[:16])
+    
+    @torch.inference_mode()
+    def _encode_corpus(self, corpus, batch_size, cache_path=None, device='cpu', dtype=torch.float32):
+        """
+        Encode the corpus into a (device, dtype) tensor, reusing embeddings saved by a
+        previous run when available
+        """
+        embeddings_path = f"{cache_path}.npy" if cache_path else None
+        if embeddings_path and os.path.exists(embeddings_path):
+            logger.info(f"Loading cached corpus embeddings from {embeddings_path}")
+            # Memory-mapped copy-on-write: pages are read on first access, and torch
+            # gets the writable array it requires without the file being modified
+            return torch.from_numpy(np.load(embeddings_path, mmap_mode='c')).to(device, dtype=dtype)
+        
+        # Stream chunks into a preallocated buffer: peak memory is one embedding
+        # matrix plus one chunk, instead of two full matrices
+        start_time = time.time()
+        chunk_size = batch_size * 16
+        embedding_dim = self.model.get_sentence_embedding_dimension()
+        corpus_t = torch.empty((len(corpus), embedding_dim), device=device, dtype=dtype)
+        for start in range(0, len(corpus), chunk_size):
+            # Normalized here once, so inner product == cosine similarity
+            chunk = self.model.encode(
+                corpus[start:start + chunk_size],
+                batch_size=batch_size,
+                convert_to_tensor=True,
+                normalize_embeddings=True
+            )
+            # Both tensors are on the same device: a plain copy into the buffer (and cast to its dtype)
+            corpus_t[start:start + len(chunk)].copy_(chunk)
+            del chunk
+            logger.info(f"Encoded {min(start + chunk_size, len(corpus))}/{len(corpus)} documents")
+        if self.use_mps:
+            torch.mps.synchronize()
+        
+        encode_time = time.time() - start_time
+        logger.info(f"Corpus encoded in {encode_time:.2f} seconds ({len(corpus)/encode_time:.1f} texts/sec)")
+        
+        if embeddings_path:
+            np.save(embeddings_path, corpus_t.float().cpu().numpy())
+        return corpus_t
+    
+    def _read_faiss_index(self, index_path):
+        """Read a persisted FAISS index, memory-mapped where the index type supports it"""
+        try:
+            index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP)
+        except RuntimeError:
+            index = faiss.read_index(index_path)
+        
+        # Search-time parameters are not stored with the index
+        if hasattr(index, "hnsw"):
+            index.hnsw.efSearch = 64
+        if hasattr(index, "nprobe"):
+            index.nprobe = 16
+        return index
+    
+    def _create_faiss_index(self, embeddings):
+        """Create (and train, if needed) the inner-product FAISS index for the corpus"""
+        num_docs, embedding_dim = embeddings.shape
+        index_type = self.index_type
+        if index_type == "ivfpq" and num_docs < IVFPQ_MIN_DOCS:
+            logger.warning(f"Too few documents ({num_docs}) to train IVFPQ, choosing the index automatically")
+            index_type = "auto"
+        if index_type == "auto":
+            if num_docs < 1000:
+                index_type = "flat"
+            elif num_docs <= 100000:
+                index_type = "hnsw"
+            else:
+                index_type = "ivfpq"
+        
+        if index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(embedding_dim, 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            index.hnsw.efSearch = 64
+        elif index_type == "ivfpq":
+            nlist = max(1, min(4096, num_docs // 39))
+            # About 4 dimensions per sub-quantizer; their number must divide the dimension
+            m = next(m for m in range(max(1, embedding_dim // 4), 0, -1) if embedding_dim % m == 0)
+            quantizer = faiss.IndexFlatIP(embedding_dim)
+            index = faiss.IndexIVFPQ(quantizer, embedding_dim, nlist, m, 8,
+                                     faiss.METRIC_INNER_PRODUCT)
+            index.train(embeddings)
+            index.nprobe = 16
+        else:
+            # Flat inner-product scan over FP16 (or 8-bit) storage: half the memory traffic of FP32
+            qtype = faiss.ScalarQuantizer.QT_8bit if index_type == "sq8" else faiss.ScalarQuantizer.QT_fp16
+            index = faiss.IndexScalarQuantizer(embedding_dim, qtype, faiss.METRIC_INNER_PRODUCT)
+            index.train(embeddings)
+        return index
+    
+    @torch.inference_mode()
     def encode(self, texts, batch_size=64):
         """
         Encode texts into embeddings
@@ -126,20 +289,21 @@ class EmbeddingService:
             batch_size: Batch size for encoding
         
         Returns:
-            numpy array of embeddings
+            L2-normalized torch.Tensor of embeddings on the model's device
         """
         if not texts:
-            return np.array([])
+            return torch.empty(0)
         
         logger.info(f"Encoding {len(texts)} texts with batch size {batch_size}")
         start_time = time.time()
         
-        # Use MPS for intermediate operations if enabled
+        # Keep embeddings on the active device; callers convert to NumPy only if needed
         embeddings = self.model.encode(
             texts, 
             batch_size=batch_size,
             show_progress_bar=len(texts) > 100,
-            convert_to_numpy=True
+            convert_to_tensor=True,
+            normalize_embeddings=True
         )
         
         encode_time = time.time() - start_time
@@ -147,6 +311,7 @@ class EmbeddingService:
         
         return embeddings
     
+    @torch.inference_mode()
     def search(self, query, top_k=5):
         """
         Search for similar documents in the index
@@ -158,7 +323,7 @@ class EmbeddingService:
         Returns:
             List of tuples (score, document)
         """
-        if self.index is None:
+        if self.index is None and self.corpus_t is None:
             logger.error("Index not built. Call build_index first.")
             return []
         
@@ -172,19 +337,24 @@ class EmbeddingService:
         
         # Search
         start_time = time.time()
-        scores, indices = self.index.search(query_embeddings, top_k)
+        if self.corpus_t is not None:
+            q = query_embeddings.to(dtype=torch.float16)
+            scores_t = q @ self.corpus_t.T
+            vals, idx = torch.topk(scores_t, min(top_k, self.corpus_t.shape[0]), dim=1)
+            scores, indices = vals.float().cpu().numpy(), idx.cpu().numpy()
+        else:
+            scores, indices = self.index.search(query_embeddings.cpu().numpy(), top_k)
         search_time = time.time() - start_time
         
         logger.info(f"Query encoded in {encode_time:.4f}s, search completed in {search_time:.4f}s")
         
-        # Format results
-        results = []
-        for i, (query_scores, query_indices) in enumerate(zip(scores, indices)):
-            query_results = []
-            for score, idx in zip(query_scores, query_indices):
-                if idx < len(self.corpus):  # Ensure index is valid
-                    query_results.append((float(score), self.corpus[idx]))
-            results.append(query_results)
+        # Format results: FAISS pads missing neighbours with -1, mask those out vectorially
+        valid = (indices >= 0) & (indices < len(self.corpus))
+        docs = self.corpus_arr[np.where(valid, indices, 0)]
+        results = [
+            list(compress(zip(query_scores, query_docs), query_valid))
+            for query_scores, query_docs, query_valid in zip(scores.tolist(), docs.tolist(), valid.tolist())
+        ]
         
         return results[0] if len(query) == 1 else results
 
@@ -197,26 +367,38 @@ def demo():
                         help='Disable MPS acceleration')
     parser.add_argument('--quantize', action='store_true', 
                         help='Enable model quantization')
+    parser.add_argument('--compile', action='store_true',
+                        help='Compile the encoder with torch.compile')
     parser.add_argument('--corpus-size', type=int, default=1000, 
                         help='Size of the demo corpus')
+    parser.add_argument('--index-type', type=str, default='auto',
+                        choices=['auto', 'flat', 'sq8', 'hnsw', 'ivfpq'],
+                        help='FAISS index type for the CPU search path')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                        help='Directory to persist corpus embeddings/index between runs')
     args = parser.parse_args()
     
     # Create embedding service
     service = EmbeddingService(
         model_name=args.model,
         use_mps=not args.no_mps,
-        use_quantization=args.quantize
+        use_quantization=args.quantize,
+        index_type=args.index_type,
+        use_compile=args.compile
     )
     
     # Create demo corpus
     logger.info(f"Creating demo corpus with {args.corpus_size} documents")
-    corpus = [
-        f"Document {i} about topic {i % 10} with some additional text to make it longer and more realistic" 
-        for i in range(args.corpus_size)
-    ]
+    # Build the variable parts as integer arrays and format them in one vectorized pass
+    ids = np.arange(args.corpus_size)
+    corpus = np.char.add(
+        np.char.add(np.char.add("Document ", ids.astype(str)), " about topic "),
+        np.char.add((ids % 10).astype(str),
+                    " with some additional text to make it longer and more realistic")
+    ).tolist()
     
     # Build index
-    service.build_index(corpus)
+    service.build_index(corpus, cache_dir=args.cache_dir)
     
     # Test queries
     test_queries = [
@@ -228,10 +410,11 @@ def demo():
     logger.info("\n" + "="*50)
     logger.info("Running test queries")
     
-    for query in test_queries:
+    # Encode and search all queries in one batch
+    all_results = service.search(test_queries, top_k=3)
+    
+    for query, results in zip(test_queries, all_results):
         logger.info(f"\nQuery: {query}")
-        results = service.search(query, top_k=3)
-        
         logger.info("Top matches:")
         for score, doc in results:
             logger.info(f"Score: {score:.4f}, Document: {doc}")
@@ -3,14 +3,22 @@ import time
 import psutil
 import os
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import SentenceTransformer
+import faiss
 import matplotlib.pyplot as plt
 
+_PROCESS = psutil.Process(os.getpid())
+
 def memory_usage():
     """Get current memory usage in MB"""
-    process = psutil.Process(os.getpid())
-    return process.memory_info().rss / (1024 * 1024)
+    return _PROCESS.memory_info().rss / (1024 * 1024)
+
+def synchronize(device):
+    """Wait for queued kernels on the device to finish (no-op on CPU)"""
+    if device == "mps":
+        torch.mps.synchronize()
 
+@torch.inference_mode()
 def test_device_performance(model_name, devices, batch_sizes, sequence_length=64):
     """Test model performance across different devices and batch sizes"""
     results = {}
@@ -18,8 +26,7 @@ def test_device_performance(model_name, devices, batch_sizes, sequence_length=64
     print(f"Testing {model_name} on different devices with varying batch sizes")
     print("=" * 70)
     
-    # Generate synthetic sentences of consistent length for fair comparison
-    # Using a fixed sequence length to ensure consistent testing
+    # Generate a synthetic sentence, padded to a fixed sequence length for fair comparison
     base_text = "This is a test sentence for benchmarking performance with MPS acceleration on Apple Silicon"
     words = base_text.split()
     text = " ".join(words[:sequence_length//8]) if sequence_length <= 512 else base_text  # ~8 chars per word
@@ -30,33 +37,37 @@ def test_device_performance(model_name, devices, batch_sizes, sequence_length=64
         print(f"\nLoading model on {device_name}...")
         start_mem = memory_usage()
         
-        # Load model and move to appropriate device if needed
-        if device_name == "mps" and torch.backends.mps.is_available():
-            model = SentenceTransformer(model_name)
-            # Set PyTorch to use MPS for various tensor operations
-            # This doesn't move the model to MPS but helps with intermediate calculations
-            torch.set_default_device('mps')
-        else:
-            model = SentenceTransformer(model_name)
-            torch.set_default_device('cpu')
+        # Load model directly onto the device under test
+        device = "mps" if device_name == "mps" and torch.backends.mps.is_available() else "cpu"
+        model = SentenceTransformer(model_name, device=device)
+        model.eval()
         
         end_mem = memory_usage()
         mem_usage = end_mem - start_mem
         
         print(f"Model loaded on {device_name}. Memory usage: {mem_usage:.2f} MB")
         
+        # Every sentence in a batch is identical, so tokenize once and broadcast the
+        # token tensors; the timed region then measures only the encoder forward pass
+        features = model.tokenizer(text, return_tensors="pt", padding="max_length",
+                                   truncation=True, max_length=sequence_length).to(device)
+        encoder = model[0].auto_model
+        
         for batch_size in batch_sizes:
-            # Create a batch of sentences with consistent length
-            sentences = [text] * batch_size
+            batch = {name: tensor.expand(batch_size, -1) for name, tensor in features.items()}
             
-            # Warm up
-            _ = model.encode(sentences[:min(batch_size, 8)])
+            # Warm up at the measured batch size so kernel compilation for this
+            # shape happens outside the timed region
+            _ = encoder(**batch)
+            synchronize(device)
             
             # Benchmark
             print(f"  Testing batch size {batch_size}...", end="", flush=True)
-            start_time = time.time()
-            _ = model.encode(sentences)
-            end_time = time.time()
+            synchronize(device)
+            start_time = time.perf_counter()
+            _ = encoder(**batch)
+            synchronize(device)
+            end_time = time.perf_counter()
             
             encoding_time = end_time - start_time
             mem_used = memory_usage() - start_mem
@@ -104,6 +115,7 @@ def plot_comparison(results, save_path="sbert_performance.png"):
     plt.savefig(save_path)
     print(f"\nPerformance plot saved as '{save_path}'")
 
+@torch.inference_mode()
 def demonstrate_similarity_search(model_name, corpus_size=1000, query_count=5):
     """Demonstrate a realistic use case: similarity search with MPS acceleration"""
     print("\n" + "=" * 70)
@@ -117,55 +129,57 @@ def demonstrate_similarity_search(model_name, corpus_size=1000, query_count=5):
     
     # Create corpus of sentences
     print(f"Generating corpus of {corpus_size} sentences...")
-    corpus = [
-        f"This is sentence {i} about topic {i % 10} with some additional text to make it longer" 
-        for i in range(corpus_size)
-    ]
+    # Build the variable parts as integer arrays and format them in one vectorized pass
+    ids = np.arange(corpus_size)
+    corpus = np.char.add(
+        np.char.add(np.char.add("This is sentence ", ids.astype(str)), " about topic "),
+        np.char.add((ids % 10).astype(str), " with some additional text to make it longer")
+    ).tolist()
     
     # Create queries
-    queries = [
-        f"Looking for information about topic {i}" 
-        for i in range(query_count)
-    ]
+    queries = np.char.add("Looking for information about topic ",
+                          np.arange(query_count).astype(str)).tolist()
     
     # Load model
     print("Loading model...")
-    model = SentenceTransformer(model_name)
-    if use_mps:
-        torch.set_default_device('mps')
+    model = SentenceTransformer(model_name, device=device)
+    model.eval()
     
     # Encode corpus
     print("Encoding corpus...")
-    start_time = time.time()
-    corpus_embeddings = model.encode(corpus, show_progress_bar=True)
-    corpus_encoding_time = time.time() - start_time
+    start_time = time.perf_counter()
+    corpus_embeddings = model.encode(corpus, show_progress_bar=True,
+                                     convert_to_tensor=True, normalize_embeddings=True)
+    corpus_encoding_time = time.perf_counter() - start_time
     print(f"Corpus encoded in {corpus_encoding_time:.2f} seconds")
     
     # Encode queries
     print("Encoding queries...")
-    start_time = time.time()
-    query_embeddings = model.encode(queries)
-    query_encoding_time = time.time() - start_time
+    start_time = time.perf_counter()
+    query_embeddings = model.encode(queries, convert_to_tensor=True, normalize_embeddings=True)
+    query_encoding_time = time.perf_counter() - start_time
     print(f"Queries encoded in {query_encoding_time:.2f} seconds")
     
-    # Find top matches
-    print("\nFinding top 3 matches for each query...")
+    # Embeddings are unit-length, so a plain inner product is the cosine similarity
+    top_k = 3
+    print(f"\nFinding top {top_k} matches for each query...")
+    start_time = time.perf_counter()
+    if use_mps:
+        # On the GPU one large matmul + topk is fastest (MPS picks its own tiling)
+        top_scores, top_indices = torch.topk(query_embeddings @ corpus_embeddings.T, k=top_k, dim=1)
+    else:
+        # On CPU, faiss.knn runs a blocked GEMM with a size-k heap per query and
+        # never materializes the full query x corpus score matrix
+        top_scores, top_indices = faiss.knn(query_embeddings.numpy(), corpus_embeddings.numpy(),
+                                            top_k, metric=faiss.METRIC_INNER_PRODUCT)
+    search_time = time.perf_counter() - start_time
+    print(f"Search for {len(queries)} queries completed in {search_time:.4f} seconds")
+    
     for i, query in enumerate(queries):
         print(f"\nQuery: {query}")
+        print("Top matches:")
         
-        start_time = time.time()
-        # Calculate cosine similarity
-        cos_scores = util.cos_sim(query_embeddings[i], corpus_embeddings)[0]
-        
-        # Get top k results
-        top_k = 3
-        top_results = torch.topk(cos_scores, k=top_k)
-        search_time = time.time() - start_time
-        
-        print(f"Search completed in {search_time:.4f} seconds")
-        print("\nTop matches:")
-        
-        for score, idx in zip(top_results[0], top_results[1]):
+        for score, idx in zip(top_scores[i], top_indices[i]):
             print(f"Score: {score:.4f}, Text: {corpus[idx]}")
 
 if __name__ == "__main__":
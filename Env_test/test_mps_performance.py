@@ -3,11 +3,24 @@ import time
 import numpy as np
 import matplotlib.pyplot as plt
 
-def test_matrix_multiplication(sizes):
+MPS_ITERS = 50
+CPU_ITERS = 5
+
+def bench(fn, iters, device="mps"):
+    """Average wall time of fn() in seconds, amortized over iters runs"""
+    sync = torch.mps.synchronize if device == "mps" else (lambda: None)
+    sync()
+    t0 = time.perf_counter_ns()
+    for _ in range(iters):
+        fn()
+    sync()
+    return (time.perf_counter_ns() - t0) / iters / 1e9
+
+def test_matrix_multiplication(sizes, dtype=torch.float16):
     mps_times = []
     cpu_times = []
     
-    print("Testing matrix multiplication performance on MPS vs CPU")
+    print(f"Testing matrix multiplication performance on MPS ({dtype}) vs CPU (float32)")
     print("=" * 60)
     print(f"{'Size':>10} | {'MPS Time (s)':>12} | {'CPU Time (s)':>12} | {'Speedup':>10}")
     print("-" * 60)
@@ -25,25 +38,20 @@ def test_matrix_multiplication(sizes):
         a_cpu = torch.rand(size, size, device=cpu_device)
         b_cpu = torch.rand(size, size, device=cpu_device)
         
-        # Copy to MPS
-        a_mps = a_cpu.to(mps_device)
-        b_mps = b_cpu.to(mps_device)
+        # Copy to MPS in reduced precision to engage the GPU matrix units
+        a_mps = a_cpu.to(mps_device, dtype=dtype)
+        b_mps = b_cpu.to(mps_device, dtype=dtype)
         
         # Warm up MPS
         _ = torch.matmul(a_mps, b_mps)
         torch.mps.synchronize()
         
         # Test MPS performance
-        start_time = time.time()
-        c_mps = torch.matmul(a_mps, b_mps)
-        torch.mps.synchronize()  # Ensure computation is complete
-        mps_time = time.time() - start_time
+        mps_time = bench(lambda: torch.matmul(a_mps, b_mps), MPS_ITERS)
         mps_times.append(mps_time)
         
         # Test CPU performance
-        start_time = time.time()
-        c_cpu = torch.matmul(a_cpu, b_cpu)
-        cpu_time = time.time() - start_time
+        cpu_time = bench(lambda: torch.matmul(a_cpu, b_cpu), CPU_ITERS, device="cpu")
         cpu_times.append(cpu_time)
         
         # Calculate speedup
@@ -80,8 +88,8 @@ def plot_results(sizes, mps_times, cpu_times):
     plt.savefig('mps_performance.png')
     print("\nPerformance plot saved as 'mps_performance.png'")
 
-def test_batch_processing():
-    print("\nTesting batch processing performance on MPS vs CPU")
+def test_batch_processing(dtype=torch.float16):
+    print(f"\nTesting batch processing performance on MPS ({dtype}) vs CPU (float32)")
     print("=" * 60)
     
     if not torch.backends.mps.is_available():
@@ -106,25 +114,20 @@ def test_batch_processing():
         batch_cpu = torch.rand(batch_size, feature_size, device=cpu_device)
         weights_cpu = torch.rand(feature_size, feature_size, device=cpu_device)
         
-        # Copy to MPS
-        batch_mps = batch_cpu.to(mps_device)
-        weights_mps = weights_cpu.to(mps_device)
+        # Copy to MPS in reduced precision to engage the GPU matrix units
+        batch_mps = batch_cpu.to(mps_device, dtype=dtype)
+        weights_mps = weights_cpu.to(mps_device, dtype=dtype)
         
         # Warm up MPS
         _ = torch.matmul(batch_mps, weights_mps)
         torch.mps.synchronize()
         
         # Test MPS performance
-        start_time = time.time()
-        output_mps = torch.matmul(batch_mps, weights_mps)
-        torch.mps.synchronize()
-        mps_time = time.time() - start_time
+        mps_time = bench(lambda: torch.matmul(batch_mps, weights_mps), MPS_ITERS)
         mps_times.append(mps_time)
         
         # Test CPU performance
-        start_time = time.time()
-        output_cpu = torch.matmul(batch_cpu, weights_cpu)
-        cpu_time = time.time() - start_time
+        cpu_time = bench(lambda: torch.matmul(batch_cpu, weights_cpu), CPU_ITERS, device="cpu")
         cpu_times.append(cpu_time)
         
         # Calculate speedup
@@ -140,10 +143,16 @@ if __name__ == "__main__":
     matrix_sizes = [512, 1024, 2048, 4096, 6144, 8192]
     mps_times, cpu_times, sizes = test_matrix_multiplication(matrix_sizes)
     
+    print("\n--- Testing Square Matrix Multiplication (BF16) ---")
+    test_matrix_multiplication(matrix_sizes, dtype=torch.bfloat16)
+    
     # Test batch processing
     print("\n--- Testing Batch Processing ---")
     batch_sizes, batch_mps_times, batch_cpu_times = test_batch_processing()
     
+    print("\n--- Testing Batch Processing (BF16) ---")
+    test_batch_processing(dtype=torch.bfloat16)
+    
     # Plot results
     try:
         plot_results(sizes, mps_times, cpu_times)
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """
 Script to add Indeed jobs data to the vector database.
-This imports data from indeed_jobs_detailed.csv into the FAISS vector store.
+This imports data from indeed_jobs_detailed.csv.gz into the FAISS vector store.
 """
 
+import gzip
 import os
 import shutil
 import sys
@@ -28,7 +29,9 @@ def fix_csv_file(source_file, fixed_file):
     
     try:
         # Read the file as text first to detect and fix issues
-        with open(source_file, 'r', encoding='utf-8') as file:
+        # The scraper writes its output gzipped
+        opener = gzip.open if source_file.endswith('.gz') else open
+        with opener(source_file, 'rt', encoding='utf-8') as file:
             lines = file.readlines()
         
         # Expected number of columns based on the header
@@ -97,7 +100,7 @@ def load_csv_safely(file_path):
 
 def main():
     # Configuration
-    source_file = "indeed_jobs_detailed.csv"
+    source_file = "indeed_jobs_detailed.csv.gz"
     data_dir = "../adzuna_data"
     vector_dir = "../vector_store"
     
@@ -117,7 +120,7 @@ def main():
     else:
         log(f"Warning: Could not fix CSV format issues")
         # Copy the original file as fallback
-        dest_file = os.path.join(data_dir, "indeed_jobs_detailed.csv")
+        dest_file = os.path.join(data_dir, os.path.basename(source_file))
         shutil.copy2(source_file, dest_file)
         fixed_file = dest_file
     
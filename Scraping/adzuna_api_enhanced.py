@@ -1,13 +1,37 @@
+import asyncio
+import aiohttp
 import requests
 import json
 import os
+import sys
 import time
 import csv
+import hashlib
+import math
+import random
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Charts are only saved to disk; skip GUI backend setup
 import matplotlib.pyplot as plt
-from typing import Dict, List, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+# orjson parses the large nested search responses several times faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 class AdzunaAPI:
     """
@@ -16,8 +40,29 @@ class AdzunaAPI:
     geodata, and history.
     """
     
+    # Seconds a cached response stays fresh, by endpoint type
+    CACHE_TTL = {
+        "categories": 7 * 24 * 3600,
+        "histogram": 24 * 3600,
+        "history": 24 * 3600,
+        "top_companies": 24 * 3600,
+        "search": 3600,
+    }
+    DEFAULT_CACHE_TTL = 3600
+    
+    # Rate limiting and transient server errors are retried with backoff
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 6
+    RETRY_BACKOFF = 0.5
+    # API calls in flight at once, unless run_full_analysis is given another limit
+    MAX_CONCURRENT = 8
+    
+    LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+    
     def __init__(self, app_id: str, app_key: str, country: str = "ma", 
-                 fallback_countries: List[str] = None, output_dir: str = "adzuna_data"):
+                 fallback_countries: List[str] = None, output_dir: str = "adzuna_data",
+                 cache_dir: Optional[str] = None, use_cache: bool = True,
+                 log_level: str = "INFO"):
         """
         Initialize the Adzuna API client.
         
@@ -27,29 +72,87 @@ class AdzunaAPI:
             country: Primary country code to search (default: "ma" for Morocco)
             fallback_countries: List of country codes to try if primary fails
             output_dir: Directory to save output files
+            cache_dir: Directory for cached API responses (default: <output_dir>/cache)
+            use_cache: Whether to serve repeat requests from the on-disk cache
+            log_level: Minimum level of messages to print (DEBUG, INFO, WARN, ERROR)
         """
-        self.app_id = "e1ad5111"
-        self.app_key = "1ff882c979b3403a7e2c47cfdc6a6578"
+        self.app_id = app_id
+        self.app_key = app_key
         self.primary_country = country
         self.fallback_countries = fallback_countries or ["fr", "gb"]
         self.current_country = country
         self.base_url = "https://api.adzuna.com/v1/api"
-        self.output_dir = output_dir
+        self.output_dir = Path(output_dir)
         self.categories = None
+        self.use_cache = use_cache
+        
+        # Logging state: the formatted timestamp is reused within the same second
+        self._log_level = self.LOG_LEVELS[log_level]
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        # Shared by every file written during one run_full_analysis call
+        self._run_timestamp = None
+        self.cache_dir = Path(cache_dir) if cache_dir else self.output_dir / "cache"
+        
+        # One Figure/Axes reused (cleared) by every visualize_* call
+        self._fig, self._ax = plt.subplots(figsize=(12, 8))
+        
+        # Stale cache entries are served immediately and refreshed in the background
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2)
+        self._refreshing = set()
+        # Bounds concurrent async API calls; created on first use in each event loop
+        self._semaphore = None
+        self._semaphore_loop = None
+        
+        # Async requests currently on the wire, so concurrent duplicates share one call
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
         
-        # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-            os.makedirs(os.path.join(output_dir, "charts"), exist_ok=True)
+        # Reuse pooled keep-alive connections instead of a new TCP+TLS handshake per call
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=self.MAX_RETRIES, backoff_factor=self.RETRY_BACKOFF,
+                              status_forcelist=self.RETRY_STATUSES,
+                              allowed_methods=["GET"],
+                              respect_retry_after_header=True)
+        ))
+        # Authentication parameters are sent with every request made by the session
+        self.session.params = {"app_id": self.app_id, "app_key": self.app_key}
+        self.session.headers["Accept"] = "application/json"
+        
+        # Create the output and chart directories if they don't exist
+        (self.output_dir / "charts").mkdir(parents=True, exist_ok=True)
+    
+    def __enter__(self) -> "AdzunaAPI":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Wait for background cache refreshes and release connections and the chart figure."""
+        self._refresh_executor.shutdown(wait=True)
+        self.session.close()
+        plt.close(self._fig)
         
     def log(self, message: str, level: str = "INFO") -> None:
         """Log a message with timestamp and level."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] [{level}] {message}")
+        if self.LOG_LEVELS.get(level, 20) < self._log_level:
+            return
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        sys.stdout.write(f"[{self._last_ts_str}] [{level}] {message}\n")
+    
+    def _file_timestamp(self) -> str:
+        """Timestamp for output file names: the current run's, or now outside a run."""
+        return self._run_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """
-        Make a request to the Adzuna API.
+        Make a request to the Adzuna API, served from the on-disk cache when possible.
         
         Args:
             endpoint: API endpoint to call
@@ -58,24 +161,25 @@ class AdzunaAPI:
         Returns:
             JSON response or None if request failed
         """
-        if params is None:
-            params = {}
-            
-        # Add authentication parameters
-        params.update({
-            "app_id": self.app_id,
-            "app_key": self.app_key,
-            "content-type": "application/json"
-        })
+        cache_path = self._cache_path(endpoint, params)
+        cached = self._cached_response(endpoint, params, cache_path)
+        if cached is not None:
+            return cached
         
+        data = self._fetch(endpoint, params)
+        self._write_cache(cache_path, data)
+        return data
+    
+    def _fetch(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
+        """Call the Adzuna API over the pooled requests session."""
         url = f"{self.base_url}/{endpoint}"
         self.log(f"Calling API: {url}")
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params, timeout=(5, 30))
             
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             elif response.status_code == 404:
                 self.log(f"API endpoint not found: {url}", "ERROR")
                 return None
@@ -90,6 +194,147 @@ class AdzunaAPI:
             self.log(f"Invalid JSON response", "ERROR")
             return None
     
+    async def _make_request_async(self, session: aiohttp.ClientSession, endpoint: str,
+                                  params: Dict = None) -> Optional[Dict]:
+        """
+        Make a request to the Adzuna API without blocking the event loop, served
+        from the on-disk cache when possible.
+        
+        Identical requests issued while one is already in flight wait for its
+        result instead of calling the API again (single-flight).
+        
+        Args:
+            session: Shared aiohttp session
+            endpoint: API endpoint to call
+            params: Query parameters
+            
+        Returns:
+            JSON response or None if request failed
+        """
+        key = (endpoint, frozenset((params or {}).items()))
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await pending
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        data = None
+        try:
+            cache_path = self._cache_path(endpoint, params)
+            data = self._cached_response(endpoint, params, cache_path)
+            if data is None:
+                data = await self._fetch_async(session, endpoint, params)
+                self._write_cache(cache_path, data)
+        finally:
+            del self._inflight[key]
+            future.set_result(data)
+        return data
+    
+    async def _fetch_async(self, session: aiohttp.ClientSession, endpoint: str,
+                           params: Dict = None) -> Optional[Dict]:
+        """Call the Adzuna API over the shared aiohttp session."""
+        url = f"{self.base_url}/{endpoint}"
+        # aiohttp only accepts string query values
+        query = {key: str(value) for key, value in {**self.session.params, **(params or {})}.items()}
+        
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT)
+            self._semaphore_loop = loop
+        for attempt in range(self.MAX_RETRIES + 1):
+            # The semaphore bounds concurrent calls to respect Adzuna rate limits
+            async with self._semaphore:
+                if attempt == 0:
+                    self.log(f"Calling API: {url}")
+                retry_after = None
+                try:
+                    async with session.get(url, params=query) as response:
+                        if response.status == 200:
+                            return _json_loads(await response.read())
+                        elif response.status == 404:
+                            self.log(f"API endpoint not found: {url}", "ERROR")
+                            return None
+                        elif response.status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                            reason = f"HTTP {response.status}"
+                            retry_after = response.headers.get("Retry-After")
+                        else:
+                            self.log(f"API error: {response.status} - {await response.text()}", "ERROR")
+                            return None
+                            
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt == self.MAX_RETRIES:
+                        self.log(f"Request exception: {str(e)}", "ERROR")
+                        return None
+                    reason = str(e) or type(e).__name__
+                except aiohttp.ClientError as e:
+                    self.log(f"Request exception: {str(e)}", "ERROR")
+                    return None
+                except json.JSONDecodeError:
+                    self.log(f"Invalid JSON response", "ERROR")
+                    return None
+            
+            # Back off outside the semaphore so other requests keep flowing
+            delay = self._retry_delay(attempt, retry_after)
+            self.log(f"{reason} from {url}, retrying in {delay:.1f}s", "WARN")
+            await asyncio.sleep(delay)
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Seconds to wait before a retry: Retry-After if given, else jittered exponential backoff."""
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return random.uniform(0, self.RETRY_BACKOFF * 2 ** attempt)
+    
+    def _cache_path(self, endpoint: str, params: Dict = None) -> Optional[Path]:
+        """
+        Path of the cache file for a request, or None if caching is disabled.
+        
+        Credentials live in the session parameters, so they never enter the key.
+        """
+        if not self.use_cache:
+            return None
+        query = urllib.parse.urlencode(sorted((params or {}).items()))
+        key = hashlib.blake2b(f"{endpoint}?{query}".encode(), digest_size=16).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def _cached_response(self, endpoint: str, params: Optional[Dict],
+                         cache_path: Optional[Path]) -> Optional[Dict]:
+        """
+        Return the cached response for a request, if any.
+        
+        Stale entries are still returned, and a background refresh is scheduled
+        (stale-while-revalidate).
+        """
+        if not cache_path:
+            return None
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+            with open(cache_path, "rb") as f:
+                data = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        parts = endpoint.split("/")
+        kind = parts[2] if len(parts) > 2 else endpoint
+        if age >= self.CACHE_TTL.get(kind, self.DEFAULT_CACHE_TTL) and cache_path not in self._refreshing:
+            self._refreshing.add(cache_path)
+            future = self._refresh_executor.submit(self._refresh_cache, endpoint, params, cache_path)
+            future.add_done_callback(lambda _: self._refreshing.discard(cache_path))
+        return data
+    
+    def _refresh_cache(self, endpoint: str, params: Optional[Dict], cache_path: Path) -> None:
+        """Re-fetch a stale cache entry."""
+        self._write_cache(cache_path, self._fetch(endpoint, params))
+    
+    def _write_cache(self, cache_path: Optional[Path], data: Optional[Dict]) -> None:
+        """Atomically store a successful response in the cache."""
+        if not cache_path or data is None:
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp_path, cache_path)
+    
     def try_countries(self, endpoint: str, params: Dict = None) -> Tuple[Optional[Dict], str]:
         """
         Try calling an endpoint with different countries if primary fails.
@@ -158,13 +403,30 @@ class AdzunaAPI:
         Returns:
             Dictionary with search results
         """
+        endpoint, params = self._search_params(what, country, location, category,
+                                               page, results_per_page)
+        return self._search_result(self._make_request(endpoint, params))
+    
+    async def search_jobs_async(self, session: aiohttp.ClientSession, what: str,
+                                country: str = None, location: str = None,
+                                category: str = None, page: int = 1,
+                                results_per_page: int = 50) -> Dict:
+        """Asynchronous variant of search_jobs using a shared aiohttp session."""
+        endpoint, params = self._search_params(what, country, location, category,
+                                               page, results_per_page)
+        return self._search_result(await self._make_request_async(session, endpoint, params))
+    
+    def _search_params(self, what: str, country: Optional[str], location: Optional[str],
+                       category: Optional[str], page: int,
+                       results_per_page: int) -> Tuple[str, Dict]:
+        """Build the endpoint and query parameters for a job search."""
         country = country or self.current_country
         endpoint = f"jobs/{country}/search/{page}"
         
         # Prepare parameters
         params = {
             "results_per_page": results_per_page,
-            "what": urllib.parse.quote(what)
+            "what": what
         }
         
         # Add optional parameters
@@ -172,9 +434,10 @@ class AdzunaAPI:
             params["where"] = location
         if category:
             params["category"] = category
-            
-        # Make request
-        data = self._make_request(endpoint, params)
+        return endpoint, params
+    
+    def _search_result(self, data: Optional[Dict]) -> Dict:
+        """Normalize a search response, logging the number of jobs found."""
         if data:
             self.log(f"Found {len(data.get('results', []))} jobs (Total: {data.get('count', 0)})")
             return data
@@ -193,19 +456,27 @@ class AdzunaAPI:
         Returns:
             Dictionary with histogram data
         """
+        endpoint, params = self._histogram_params(what, country, location)
+        return self._make_request(endpoint, params) or {}
+    
+    async def get_histogram_async(self, session: aiohttp.ClientSession, what: str = None,
+                                  country: str = None, location: str = None) -> Dict:
+        """Asynchronous variant of get_histogram using a shared aiohttp session."""
+        endpoint, params = self._histogram_params(what, country, location)
+        return await self._make_request_async(session, endpoint, params) or {}
+    
+    def _histogram_params(self, what: Optional[str], country: Optional[str],
+                          location: Optional[str]) -> Tuple[str, Dict]:
+        """Build the endpoint and query parameters for a salary histogram."""
         country = country or self.current_country
         endpoint = f"jobs/{country}/histogram"
         
         params = {}
         if what:
-            params["what"] = urllib.parse.quote(what)
+            params["what"] = what
         if location:
             params["where"] = location
-            
-        data = self._make_request(endpoint, params)
-        if data:
-            return data
-        return {}
+        return endpoint, params
         
     def get_top_companies(self, what: str, country: str = None, 
                           location: str = None) -> List[Dict]:
@@ -220,19 +491,29 @@ class AdzunaAPI:
         Returns:
             List of top companies
         """
+        endpoint, params = self._top_companies_params(what, country, location)
+        data = self._make_request(endpoint, params)
+        return data.get("leaderboard", []) if data else []
+    
+    async def get_top_companies_async(self, session: aiohttp.ClientSession, what: str,
+                                      country: str = None, location: str = None) -> List[Dict]:
+        """Asynchronous variant of get_top_companies using a shared aiohttp session."""
+        endpoint, params = self._top_companies_params(what, country, location)
+        data = await self._make_request_async(session, endpoint, params)
+        return data.get("leaderboard", []) if data else []
+    
+    def _top_companies_params(self, what: str, country: Optional[str],
+                              location: Optional[str]) -> Tuple[str, Dict]:
+        """Build the endpoint and query parameters for a top companies lookup."""
         country = country or self.current_country
         endpoint = f"jobs/{country}/top_companies"
         
         params = {
-            "what": urllib.parse.quote(what)
+            "what": what
         }
         if location:
             params["where"] = location
-            
-        data = self._make_request(endpoint, params)
-        if data and "leaderboard" in data:
-            return data["leaderboard"]
-        return []
+        return endpoint, params
         
     def get_geodata(self, what: str = None, country: str = None) -> Dict:
         """
@@ -250,7 +531,7 @@ class AdzunaAPI:
         
         params = {}
         if what:
-            params["what"] = urllib.parse.quote(what)
+            params["what"] = what
             
         data = self._make_request(endpoint, params)
         if data:
@@ -270,19 +551,33 @@ class AdzunaAPI:
         Returns:
             Dictionary with historical data
         """
+        endpoint, params = self._history_params(what, country, location)
+        return self._make_request(endpoint, params) or {}
+    
+    async def get_history_async(self, session: aiohttp.ClientSession, what: str = None,
+                                country: str = None, location: str = None) -> Dict:
+        """Asynchronous variant of get_history using a shared aiohttp session."""
+        endpoint, params = self._history_params(what, country, location)
+        return await self._make_request_async(session, endpoint, params) or {}
+    
+    def _history_params(self, what: Optional[str], country: Optional[str],
+                        location: Optional[str]) -> Tuple[str, Dict]:
+        """Build the endpoint and query parameters for historical salary data."""
         country = country or self.current_country
         endpoint = f"jobs/{country}/history"
         
         params = {}
         if what:
-            params["what"] = urllib.parse.quote(what)
+            params["what"] = what
         if location:
             params["where"] = location
-            
-        data = self._make_request(endpoint, params)
-        if data:
-            return data
-        return {}
+        return endpoint, params
+    
+    JOB_FIELDNAMES = [
+        "title", "company", "location", "description", 
+        "salary_min", "salary_max", "contract_type",
+        "created", "redirect_url", "category", "country", "specialty"
+    ]
     
     def save_jobs_to_csv(self, jobs: List[Dict], filename: str, 
                          specialty: str = None, country: str = None) -> str:
@@ -301,47 +596,88 @@ class AdzunaAPI:
         if not jobs:
             self.log(f"No jobs to save", "WARN")
             return None
-            
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        if specialty and country:
-            full_filename = f"{filename}_{specialty}_{country}_{timestamp}.csv"
-        else:
-            full_filename = f"{filename}_{timestamp}.csv"
-            
-        filepath = os.path.join(self.output_dir, full_filename)
+        filepath = self._jobs_output_path(filename, specialty, country, "csv")
+        self.log(f"Saving {len(jobs)} jobs to {filepath}")
         
-        fieldnames = [
-            "title", "company", "location", "description", 
-            "salary_min", "salary_max", "contract_type",
-            "created", "redirect_url", "category", "country", "specialty"
-        ]
+        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(self.JOB_FIELDNAMES)
+            writer.writerows(self._job_rows(jobs, specialty, country))
+        
+        self.log(f"Successfully saved jobs to {filepath}")
+        return str(filepath)
+    
+    def save_jobs_to_parquet(self, jobs: List[Dict], filename: str,
+                             specialty: str = None, country: str = None) -> str:
+        """
+        Save jobs to a Parquet file (columnar and much smaller than CSV; needs pyarrow).
         
+        Args:
+            jobs: List of job dictionaries
+            filename: Base filename
+            specialty: Job specialty (optional)
+            country: Country code (optional)
+            
+        Returns:
+            Path to saved file
+        """
+        if not jobs:
+            self.log(f"No jobs to save", "WARN")
+            return None
+        
+        filepath = self._jobs_output_path(filename, specialty, country, "parquet")
         self.log(f"Saving {len(jobs)} jobs to {filepath}")
         
-        with open(filepath, mode="w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for job in jobs:
-                row = {
-                    "title": job.get("title", "").strip(),
-                    "company": job.get("company", {}).get("display_name", "").strip(),
-                    "location": job.get("location", {}).get("display_name", "").strip(),
-                    "description": job.get("description", "").strip(),
-                    "salary_min": job.get("salary_min", ""),
-                    "salary_max": job.get("salary_max", ""),
-                    "contract_type": job.get("contract_type", ""),
-                    "created": job.get("created", ""),
-                    "redirect_url": job.get("redirect_url", ""),
-                    "category": job.get("category", {}).get("label", ""),
-                    "country": country or self.current_country,
-                    "specialty": specialty or ""
-                }
-                writer.writerow(row)
+        self._jobs_dataframe(jobs, specialty, country).to_parquet(filepath, index=False)
         
         self.log(f"Successfully saved jobs to {filepath}")
-        return filepath
+        return str(filepath)
+    
+    def _jobs_output_path(self, filename: str, specialty: Optional[str],
+                          country: Optional[str], extension: str) -> Path:
+        """Build a timestamped output path for a jobs export."""
+        timestamp = self._file_timestamp()
+        
+        if specialty and country:
+            full_filename = f"{filename}_{specialty}_{country}_{timestamp}.{extension}"
+        else:
+            full_filename = f"{filename}_{timestamp}.{extension}"
+            
+        return self.output_dir / full_filename
+    
+    def _job_rows(self, jobs: List[Dict], specialty: Optional[str],
+                  country: Optional[str]) -> Iterator[Tuple]:
+        """Yield one tuple per job, in JOB_FIELDNAMES order."""
+        country = country or self.current_country
+        specialty = specialty or ""
+        for job in jobs:
+            yield (
+                job.get("title", "").strip(),
+                (job.get("company") or {}).get("display_name", "").strip(),
+                (job.get("location") or {}).get("display_name", "").strip(),
+                job.get("description", "").strip(),
+                job.get("salary_min", ""),
+                job.get("salary_max", ""),
+                job.get("contract_type", ""),
+                job.get("created", ""),
+                job.get("redirect_url", ""),
+                (job.get("category") or {}).get("label", ""),
+                country,
+                specialty
+            )
+    
+    def _jobs_dataframe(self, jobs: List[Dict], specialty: Optional[str],
+                        country: Optional[str]) -> pd.DataFrame:
+        """Build a DataFrame of job rows for columnar exports."""
+        return pd.DataFrame.from_records(self._job_rows(jobs, specialty, country),
+                                         columns=self.JOB_FIELDNAMES)
+    
+    def _reset_axes(self, figsize: Tuple[float, float]) -> plt.Axes:
+        """Clear the shared chart axes and resize the figure for the next chart."""
+        self._ax.clear()
+        self._fig.set_size_inches(*figsize)
+        return self._ax
     
     def visualize_salary_histogram(self, histogram_data: Dict, 
                                    title: str = "Salary Distribution") -> str:
@@ -360,44 +696,30 @@ class AdzunaAPI:
             return None
             
         try:
-            # Extract data
-            bins = []
-            counts = []
-            
-            for item in histogram_data["histogram"]:
-                bins.append(f"{item['from']}-{item['to']}")
-                counts.append(item['count'])
-                
-            # Create dataframe
-            df = pd.DataFrame({
-                'salary_range': bins,
-                'count': counts
-            })
-            
-            # Sort by salary range
-            df['from'] = df['salary_range'].apply(lambda x: int(x.split('-')[0]))
-            df = df.sort_values('from')
+            # Sort by the numeric lower bound, then project the columns
+            items = sorted(histogram_data["histogram"], key=lambda d: d["from"])
+            bins = [f"{d['from']}-{d['to']}" for d in items]
+            counts = [d["count"] for d in items]
             
             # Create plot
-            plt.figure(figsize=(10, 6))
-            plt.bar(df['salary_range'], df['count'])
-            plt.title(title)
-            plt.xlabel('Salary Range')
-            plt.ylabel('Number of Jobs')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax = self._reset_axes((10, 6))
+            ax.bar(bins, counts)
+            ax.set_title(title)
+            ax.set_xlabel('Salary Range')
+            ax.set_ylabel('Number of Jobs')
+            ax.tick_params(axis='x', labelrotation=45)
+            self._fig.tight_layout()
             
             # Save figure
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._file_timestamp()
             safe_title = title.replace(' ', '_').lower()
             filename = f"salary_histogram_{safe_title}_{timestamp}.png"
-            filepath = os.path.join(self.output_dir, "charts", filename)
+            filepath = self.output_dir / "charts" / filename
             
-            plt.savefig(filepath)
-            plt.close()
+            self._fig.savefig(filepath)
             
             self.log(f"Saved salary histogram to {filepath}")
-            return filepath
+            return str(filepath)
             
         except Exception as e:
             self.log(f"Error visualizing histogram: {str(e)}", "ERROR")
@@ -430,23 +752,22 @@ class AdzunaAPI:
                 counts = counts[:15]
                 
             # Create plot
-            plt.figure(figsize=(12, 8))
-            plt.barh(names, counts)
-            plt.title(title)
-            plt.xlabel('Number of Job Postings')
-            plt.tight_layout()
+            ax = self._reset_axes((12, 8))
+            ax.barh(names, counts)
+            ax.set_title(title)
+            ax.set_xlabel('Number of Job Postings')
+            self._fig.tight_layout()
             
             # Save figure
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._file_timestamp()
             safe_title = title.replace(' ', '_').lower()
             filename = f"top_companies_{safe_title}_{timestamp}.png"
-            filepath = os.path.join(self.output_dir, "charts", filename)
+            filepath = self.output_dir / "charts" / filename
             
-            plt.savefig(filepath)
-            plt.close()
+            self._fig.savefig(filepath)
             
             self.log(f"Saved top companies chart to {filepath}")
-            return filepath
+            return str(filepath)
             
         except Exception as e:
             self.log(f"Error visualizing top companies: {str(e)}", "ERROR")
@@ -486,43 +807,77 @@ class AdzunaAPI:
             df = df.sort_values('month')
             
             # Create plot
-            plt.figure(figsize=(12, 6))
-            plt.plot(df['month'], df['average_salary'], marker='o')
-            plt.title(title)
-            plt.xlabel('Month')
-            plt.ylabel('Average Salary')
-            plt.grid(True)
-            plt.tight_layout()
+            ax = self._reset_axes((12, 6))
+            ax.plot(df['month'], df['average_salary'], marker='o')
+            ax.set_title(title)
+            ax.set_xlabel('Month')
+            ax.set_ylabel('Average Salary')
+            ax.grid(True)
+            self._fig.tight_layout()
             
             # Save figure
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._file_timestamp()
             safe_title = title.replace(' ', '_').lower()
             filename = f"salary_history_{safe_title}_{timestamp}.png"
-            filepath = os.path.join(self.output_dir, "charts", filename)
+            filepath = self.output_dir / "charts" / filename
             
-            plt.savefig(filepath)
-            plt.close()
+            self._fig.savefig(filepath)
             
             self.log(f"Saved historical salary chart to {filepath}")
-            return filepath
+            return str(filepath)
             
         except Exception as e:
             self.log(f"Error visualizing historical data: {str(e)}", "ERROR")
             return None
 
     def run_full_analysis(self, specialty_keywords: Dict[str, List[str]], 
-                         max_pages: int = 3) -> Dict:
+                         max_pages: int = 3, max_concurrent: int = 8,
+                         combined_parquet: bool = False) -> Dict:
         """
         Run a full analysis including search, top companies, histogram, and history
         for each specialty and keyword.
         
+        Synchronous wrapper around run_full_analysis_async.
+        
+        Args:
+            specialty_keywords: Dictionary of specialties and keywords
+            max_pages: Maximum pages to fetch per keyword
+            max_concurrent: Maximum number of API calls in flight at once
+            combined_parquet: Also save the combined jobs as a Parquet file
+            
+        Returns:
+            Dictionary with analysis results
+        """
+        return asyncio.run(self.run_full_analysis_async(specialty_keywords, max_pages,
+                                                        max_concurrent, combined_parquet))
+    
+    async def run_full_analysis_async(self, specialty_keywords: Dict[str, List[str]],
+                                      max_pages: int = 3, max_concurrent: int = 8,
+                                      combined_parquet: bool = False) -> Dict:
+        """
+        Run a full analysis, issuing the API calls for all keywords of a specialty
+        concurrently.
+        
         Args:
             specialty_keywords: Dictionary of specialties and keywords
             max_pages: Maximum pages to fetch per keyword
+            max_concurrent: Maximum number of API calls in flight at once
+            combined_parquet: Also save the combined jobs as a Parquet file
             
         Returns:
             Dictionary with analysis results
         """
+        self._run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        try:
+            return await self._run_full_analysis(specialty_keywords, max_pages,
+                                                 max_concurrent, combined_parquet)
+        finally:
+            self._run_timestamp = None
+    
+    async def _run_full_analysis(self, specialty_keywords: Dict[str, List[str]],
+                                 max_pages: int, max_concurrent: int,
+                                 combined_parquet: bool) -> Dict:
+        """Body of run_full_analysis_async; all files it writes share one run timestamp."""
         results = {
             "job_count": 0,
             "specialties": {},
@@ -541,111 +896,42 @@ class AdzunaAPI:
             if "results" in categories_data:
                 self.categories = categories_data["results"]
                 self.log(f"Found {len(self.categories)} job categories")
+        
+        # Bound in-flight calls instead of sleeping between them
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._semaphore_loop = asyncio.get_running_loop()
+        connector = aiohttp.TCPConnector(limit=max_concurrent)
+        timeout = aiohttp.ClientTimeout(total=30, sock_connect=5)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers={"Accept": "application/json"}) as session:
+            # For each specialty
+            for specialty, keywords in specialty_keywords.items():
+                self.log(f"\n🔍 Analyzing specialty: {specialty.replace('_', ' ').title()}")
+                specialty_results = {
+                    "jobs": [],
+                    "top_companies": {},
+                    "visualizations": []
+                }
                 
-        # For each specialty
-        for specialty, keywords in specialty_keywords.items():
-            self.log(f"\n🔍 Analyzing specialty: {specialty.replace('_', ' ').title()}")
-            specialty_results = {
-                "jobs": [],
-                "top_companies": {},
-                "visualizations": []
-            }
-            
-            # For each keyword
-            for keyword in keywords:
-                self.log(f"🔎 Analyzing keyword: {keyword}")
-                all_jobs = []
-                
-                # Search jobs
-                for page in range(1, max_pages + 1):
-                    search_results = self.search_jobs(keyword, page=page)
-                    if "results" in search_results:
-                        jobs = search_results["results"]
-                        if jobs:
-                            # Add specialty and keyword info
-                            for job in jobs:
-                                job["specialty"] = specialty
-                                job["search_keyword"] = keyword
-                            all_jobs.extend(jobs)
-                            
-                            # If we got fewer results than we asked for, no need for more pages
-                            if len(jobs) < 50:
-                                break
-                        else:
-                            break
-                    time.sleep(1)  # Pause to avoid rate limiting
-                
-                self.log(f"Found {len(all_jobs)} jobs for keyword '{keyword}'")
-                
-                if all_jobs:
-                    # Save jobs for this keyword
-                    self.save_jobs_to_csv(all_jobs, f"jobs_{specialty}", 
-                                         specialty=specialty, 
-                                         country=self.current_country)
-                    
-                    specialty_results["jobs"].extend(all_jobs)
-                    
-                    # Get top companies
-                    top_companies = self.get_top_companies(keyword)
+                # Analyze all keywords concurrently; gather keeps keyword order
+                keyword_results = await asyncio.gather(*[
+                    self._analyze_keyword(session, specialty, keyword, max_pages)
+                    for keyword in keywords
+                ])
+                for keyword, (jobs, top_companies, visualizations) in zip(keywords, keyword_results):
+                    specialty_results["jobs"].extend(jobs)
                     if top_companies:
-                        self.log(f"Found {len(top_companies)} top companies for '{keyword}'")
                         specialty_results["top_companies"][keyword] = top_companies
-                        
-                        # Visualize top companies
-                        viz_path = self.visualize_top_companies(
-                            top_companies, 
-                            f"Top Companies - {specialty.replace('_', ' ').title()} - {keyword}"
-                        )
-                        if viz_path:
-                            specialty_results["visualizations"].append({
-                                "type": "top_companies",
-                                "keyword": keyword,
-                                "path": viz_path
-                            })
-                    
-                    # Get salary histogram
-                    histogram_data = self.get_histogram(keyword)
-                    if histogram_data and "histogram" in histogram_data:
-                        self.log(f"Got salary histogram data for '{keyword}'")
-                        
-                        # Visualize histogram
-                        viz_path = self.visualize_salary_histogram(
-                            histogram_data,
-                            f"Salary Distribution - {specialty.replace('_', ' ').title()} - {keyword}"
-                        )
-                        if viz_path:
-                            specialty_results["visualizations"].append({
-                                "type": "salary_histogram",
-                                "keyword": keyword,
-                                "path": viz_path
-                            })
-                    
-                    # Get historical data
-                    history_data = self.get_history(keyword)
-                    if history_data and "month" in history_data:
-                        self.log(f"Got historical salary data for '{keyword}'")
-                        
-                        # Visualize historical data
-                        viz_path = self.visualize_historical_data(
-                            history_data,
-                            f"Salary Trends - {specialty.replace('_', ' ').title()} - {keyword}"
-                        )
-                        if viz_path:
-                            specialty_results["visualizations"].append({
-                                "type": "salary_history",
-                                "keyword": keyword,
-                                "path": viz_path
-                            })
-                    
-                time.sleep(2)  # Pause between keywords
-            
-            # Save all jobs for this specialty
-            specialty_jobs = specialty_results["jobs"]
-            if specialty_jobs:
-                self.log(f"Total: {len(specialty_jobs)} jobs for specialty {specialty}")
-                results["job_count"] += len(specialty_jobs)
-                results["specialties"][specialty] = specialty_results
-                results["visualizations"].extend(specialty_results["visualizations"])
+                    specialty_results["visualizations"].extend(visualizations)
+                
+                # Save all jobs for this specialty
+                specialty_jobs = specialty_results["jobs"]
+                if specialty_jobs:
+                    self.log(f"Total: {len(specialty_jobs)} jobs for specialty {specialty}")
+                    results["job_count"] += len(specialty_jobs)
+                    results["specialties"][specialty] = specialty_results
+                    results["visualizations"].extend(specialty_results["visualizations"])
         
         # Save combined results
         all_jobs = []
@@ -654,9 +940,116 @@ class AdzunaAPI:
             
         if all_jobs:
             self.save_jobs_to_csv(all_jobs, "all_jobs")
+            if combined_parquet:
+                self.save_jobs_to_parquet(all_jobs, "all_jobs")
             self.log(f"Total jobs collected across all specialties: {len(all_jobs)}")
             
         return results
+    
+    async def _analyze_keyword(self, session: aiohttp.ClientSession, specialty: str,
+                               keyword: str, max_pages: int) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Fetch jobs, top companies, salary histogram and history for one keyword.
+        
+        Returns:
+            Tuple of (jobs, top companies, visualization entries)
+        """
+        self.log(f"🔎 Analyzing keyword: {keyword}")
+        label = f"{specialty.replace('_', ' ').title()} - {keyword}"
+        visualizations = []
+        
+        # The market-data endpoints don't depend on the search results, so all
+        # four lookups run concurrently
+        all_jobs, top_companies, histogram_data, history_data = await asyncio.gather(
+            self._search_all_pages(session, specialty, keyword, max_pages),
+            self.get_top_companies_async(session, keyword),
+            self.get_histogram_async(session, keyword),
+            self.get_history_async(session, keyword)
+        )
+        
+        self.log(f"Found {len(all_jobs)} jobs for keyword '{keyword}'")
+        if not all_jobs:
+            return all_jobs, [], visualizations
+        
+        # Save jobs for this keyword (keywords run concurrently, so the keyword is
+        # part of the name to keep same-second files from overwriting each other)
+        self.save_jobs_to_csv(all_jobs, f"jobs_{specialty}_{keyword}", 
+                             specialty=specialty, 
+                             country=self.current_country)
+        
+        if top_companies:
+            self.log(f"Found {len(top_companies)} top companies for '{keyword}'")
+            
+            # Visualize top companies
+            viz_path = self.visualize_top_companies(top_companies, f"Top Companies - {label}")
+            if viz_path:
+                visualizations.append({
+                    "type": "top_companies",
+                    "keyword": keyword,
+                    "path": viz_path
+                })
+        
+        if histogram_data and "histogram" in histogram_data:
+            self.log(f"Got salary histogram data for '{keyword}'")
+            
+            # Visualize histogram
+            viz_path = self.visualize_salary_histogram(histogram_data,
+                                                       f"Salary Distribution - {label}")
+            if viz_path:
+                visualizations.append({
+                    "type": "salary_histogram",
+                    "keyword": keyword,
+                    "path": viz_path
+                })
+        
+        if history_data and "month" in history_data:
+            self.log(f"Got historical salary data for '{keyword}'")
+            
+            # Visualize historical data
+            viz_path = self.visualize_historical_data(history_data, f"Salary Trends - {label}")
+            if viz_path:
+                visualizations.append({
+                    "type": "salary_history",
+                    "keyword": keyword,
+                    "path": viz_path
+                })
+        
+        return all_jobs, top_companies, visualizations
+    
+    async def _search_all_pages(self, session: aiohttp.ClientSession, specialty: str,
+                                keyword: str, max_pages: int) -> List[Dict]:
+        """
+        Fetch up to max_pages of search results for a keyword.
+        
+        The first page's "count" tells how many pages actually exist, so the
+        remaining pages are requested concurrently instead of one by one.
+        """
+        results_per_page = 50
+        first = await self.search_jobs_async(session, keyword, page=1,
+                                             results_per_page=results_per_page)
+        jobs = list(first.get("results") or [])
+        if not jobs:
+            return []
+        
+        total = first.get("count")
+        if total is None:
+            # No total reported: only keep going while pages come back full
+            needed_pages = max_pages if len(jobs) >= results_per_page else 1
+        else:
+            needed_pages = min(max_pages, math.ceil(total / results_per_page))
+        
+        pages = await asyncio.gather(*[
+            self.search_jobs_async(session, keyword, page=page,
+                                   results_per_page=results_per_page)
+            for page in range(2, needed_pages + 1)
+        ])
+        
+        for page_results in pages:
+            jobs.extend(page_results.get("results") or [])
+        
+        # Add specialty and keyword info on copies: coalesced requests share
+        # the same response objects across specialties
+        return [{**job, "specialty": specialty, "search_keyword": keyword} for job in jobs]
 
 
 # Main execution
@@ -699,4 +1092,6 @@ if __name__ == "__main__":
     except Exception as e:
         adzuna.log(f"❌ Unexpected error: {str(e)}", "ERROR")
         import traceback
-        traceback.print_exc() 
\ No newline at end of file
+        traceback.print_exc()
+    finally:
+        adzuna.close()
\ No newline at end of file
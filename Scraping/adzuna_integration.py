@@ -5,14 +5,12 @@ This script provides a complete workflow for fetching, storing, and searching jo
 """
 
 import os
+import sys
+import heapq
 import argparse
 import time
 from datetime import datetime
 
-# Import our custom modules
-from adzuna_solution_fixed import AdzunaSolution, JOB_SPECIALTIES, TEST_SPECIALTIES
-from adzuna_vector_store import JobVectorStore
-
 def setup_argparse():
     """Set up command line argument parsing."""
     parser = argparse.ArgumentParser(description='Adzuna Job Search and Vector Store Integration')
@@ -23,17 +21,19 @@ def setup_argparse():
     parser.add_argument('--search', action='store_true',
                         help='Search in the vector database')
     parser.add_argument('--stats', action='store_true',
-                        help='Show statistics about stored jobs')
+                        help='Show statistics about stored jobs (new data is only ingested with --fetch or --search)')
     
     # Fetch options
     parser.add_argument('--test', action='store_true',
                         help='Run in test mode with limited specialties and pages')
     parser.add_argument('--max-pages', type=int, default=2,
                         help='Maximum pages to fetch per keyword')
+    parser.add_argument('--max-concurrent', type=int, default=32,
+                        help='Maximum number of concurrent API requests')
     
     # Search options
-    parser.add_argument('--query', type=str,
-                        help='Search query for finding jobs')
+    parser.add_argument('--query', type=str, nargs='+',
+                        help='Search query for finding jobs (several quoted queries are searched in one batch)')
     parser.add_argument('--remote', action='store_true',
                         help='Search for remote jobs')
     parser.add_argument('--morocco', action='store_true',
@@ -50,6 +50,14 @@ def setup_argparse():
                         help='Directory for output files')
     parser.add_argument('--vector-dir', type=str, default='vector_store',
                         help='Directory for vector store files')
+    parser.add_argument('--batch-size', type=int, default=256,
+                        help='Number of jobs embedded per model call')
+    parser.add_argument('--onnx-model', type=str,
+                        help='Directory of an int8 ONNX encoder export (see onnx_encoder.py)')
+    parser.add_argument('--compile-model', action='store_true',
+                        help='Compile the PyTorch encoder (BetterTransformer + torch.compile) for large ingests')
+    parser.add_argument('--index-type', choices=['auto', 'flat', 'hnsw', 'ivfpq'], default='auto',
+                        help='FAISS index type (auto picks by number of jobs)')
     
     return parser.parse_args()
 
@@ -58,8 +66,16 @@ def log(message):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     print(f"[{timestamp}] {message}")
 
+def log_lines(lines):
+    """Log many lines with one timestamp and a single write to stdout."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    sys.stdout.write("".join(f"[{timestamp}] {line}\n" for line in lines))
+    sys.stdout.flush()
+
 def fetch_jobs(args):
     """Fetch jobs from Adzuna API and store them."""
+    from adzuna_solution_fixed import AdzunaSolution, JOB_SPECIALTIES, TEST_SPECIALTIES
+    
     log("Starting job data collection from Adzuna API")
     
     # Initialize API solution
@@ -70,7 +86,8 @@ def fetch_jobs(args):
     
     # Run the analysis
     start_time = time.time()
-    results = adzuna.run_analysis(specialties, max_pages=args.max_pages)
+    results = adzuna.run_analysis(specialties, max_pages=args.max_pages,
+                                  max_concurrent=args.max_concurrent)
     elapsed = time.time() - start_time
     
     log(f"Job collection completed in {elapsed:.2f} seconds")
@@ -86,52 +103,105 @@ def fetch_jobs(args):
 
 def build_vector_store(args):
     """Build or update the vector store from collected data."""
+    from adzuna_vector_store import JobVectorStore
+    
     log("Building/updating vector database from collected job data")
     
     # Initialize vector store
-    vector_store = JobVectorStore(data_dir=args.output_dir, vector_dir=args.vector_dir)
+    vector_store = JobVectorStore(data_dir=args.output_dir, vector_dir=args.vector_dir,
+                                  onnx_model_dir=args.onnx_model, compile_model=args.compile_model)
+    
+    # With nothing new to ingest, memory-map the saved index and skip the add step
+    up_to_date = not args.fetch and not vector_store.has_new_data()
     
     # Try to load existing database
-    loaded = vector_store.load()
+    loaded = vector_store.load(mmap=up_to_date)
     if loaded:
         log(f"Loaded existing vector store with {len(vector_store.jobs)} jobs")
+    # A missing or unreadable store is rebuilt from the CSV files
+    up_to_date = up_to_date and loaded
     
-    # Add new jobs from directory
-    start_time = time.time()
-    added = vector_store.add_jobs_from_directory()
-    elapsed = time.time() - start_time
+    added = 0
+    if not up_to_date:
+        # Add new jobs from directory
+        start_time = time.time()
+        added = vector_store.add_jobs_from_directory(batch_size=args.batch_size)
+        elapsed = time.time() - start_time
+        
+        if added > 0:
+            log(f"Added {added} new jobs to vector store in {elapsed:.2f} seconds")
+        else:
+            log("No new jobs were added to the vector store")
     
-    if added > 0:
-        log(f"Added {added} new jobs to vector store in {elapsed:.2f} seconds")
-        # Save updates
-        vector_store.save()
-        log("Vector store saved to disk")
-    else:
-        log("No new jobs were added to the vector store")
+    # Switch to an approximate index once the store is large enough
+    rebuilt = vector_store.ensure_index_type(args.index_type)
+    if rebuilt:
+        log(f"Rebuilt vector index as {vector_store.index_type()}")
+    
+    if added > 0 or rebuilt:
+        # Save updates while the caller goes on to search; main() waits for it
+        vector_store.save_in_background()
+        log("Saving vector store to disk in the background")
+    elif loaded and not up_to_date:
+        vector_store.mark_up_to_date()
     
     return vector_store
 
-def show_job_statistics(vector_store):
+def show_job_statistics(stats):
     """Display statistics about jobs in the vector store."""
-    stats = vector_store.get_job_statistics()
-    
     log("\n===== JOB STATISTICS =====")
     log(f"Total jobs in database: {stats['total_jobs']}")
     log(f"Remote jobs: {stats['remote_jobs']} ({stats['remote_jobs'] / max(1, stats['total_jobs']) * 100:.1f}%)")
     log(f"International jobs: {stats['international_jobs']} ({stats['international_jobs'] / max(1, stats['total_jobs']) * 100:.1f}%)")
     
     if 'specialties' in stats and stats['specialties']:
-        log("\nJobs by specialty:")
-        for specialty, count in sorted(stats['specialties'].items(), key=lambda x: x[1], reverse=True):
+        log("\nJobs by specialty (top 50):")
+        for specialty, count in heapq.nlargest(50, stats['specialties'].items(), key=lambda x: x[1]):
             if specialty:  # Skip empty specialty
                 log(f"  {specialty}: {count} jobs")
     
     if 'countries' in stats and stats['countries']:
-        log("\nJobs by source country:")
-        for country, count in sorted(stats['countries'].items(), key=lambda x: x[1], reverse=True):
+        log("\nJobs by source country (top 50):")
+        for country, count in heapq.nlargest(50, stats['countries'].items(), key=lambda x: x[1]):
             if country:  # Skip unknown country
                 log(f"  {country.upper()}: {count} jobs")
 
+def display_results(results):
+    """Display a list of job search results."""
+    if not results:
+        log("No matching jobs found.")
+        return
+    
+    lines = [f"Found {len(results)} matching jobs:\n"]
+    for i, job in enumerate(results, 1):
+        get = job.get
+        score = get('similarity_score', 0)
+        title = get('title', 'Untitled')
+        company = get('company', 'Unknown Company')
+        location = get('location', 'Unknown Location')
+        
+        lines.append(f"{i}. {title} at {company}")
+        lines.append(f"   Location: {location}")
+        lines.append(f"   Similarity: {score:.2f}")
+        
+        # Add indicators for remote/international jobs
+        indicators = []
+        if get('remote_friendly', False):
+            indicators.append("REMOTE")
+        if get('international', False):
+            indicators.append("INTERNATIONAL")
+        if indicators:
+            lines.append(f"   Tags: {', '.join(indicators)}")
+        
+        lines.append("")  # Empty line between results
+    
+    # Large result lists are written in one go; short ones are logged line by line
+    if len(results) > 50:
+        log_lines(lines)
+    else:
+        for line in lines:
+            log(line)
+
 def perform_search(vector_store, args):
     """Perform the requested search operation."""
     if not args.query and not args.keywords and not args.job_title:
@@ -140,50 +210,32 @@ def perform_search(vector_store, args):
     
     log("\n===== SEARCH RESULTS =====")
     
-    results = []
+    queries = args.query or []
+    k = args.results
     
     # Search based on provided criteria
     if args.keywords:
         log(f"Searching for jobs with keywords: {', '.join(args.keywords)}")
-        results = vector_store.search_by_keywords(args.keywords, k=args.results)
+        display_results(vector_store.search_by_keywords(args.keywords, k=k))
     elif args.job_title:
         log(f"Searching for jobs with title similar to: {args.job_title}")
-        results = vector_store.search_by_job_title(args.job_title, k=args.results)
-    elif args.remote and args.query:
-        log(f"Searching for remote jobs matching: {args.query}")
-        results = vector_store.search_remote_jobs(args.query, k=args.results)
-    elif args.morocco and args.query:
-        log(f"Searching for Morocco-relevant jobs matching: {args.query}")
-        results = vector_store.search_morocco_relevant(args.query, k=args.results)
-    elif args.query:
-        log(f"Searching for jobs similar to: {args.query}")
-        results = vector_store.search_similar_jobs(args.query, k=args.results)
-    
-    # Display results
-    if results:
-        log(f"Found {len(results)} matching jobs:\n")
-        for i, job in enumerate(results, 1):
-            score = job.get('similarity_score', 0)
-            title = job.get('title', 'Untitled')
-            company = job.get('company', 'Unknown Company')
-            location = job.get('location', 'Unknown Location')
-            
-            log(f"{i}. {title} at {company}")
-            log(f"   Location: {location}")
-            log(f"   Similarity: {score:.2f}")
-            
-            # Add indicators for remote/international jobs
-            indicators = []
-            if job.get('remote_friendly', False):
-                indicators.append("REMOTE")
-            if job.get('international', False):
-                indicators.append("INTERNATIONAL")
-            if indicators:
-                log(f"   Tags: {', '.join(indicators)}")
-            
-            log("")  # Empty line between results
-    else:
-        log("No matching jobs found.")
+        display_results(vector_store.search_by_job_title(args.job_title, k=k))
+    elif args.remote and queries:
+        for query in queries:
+            log(f"Searching for remote jobs matching: {query}")
+            display_results(vector_store.search_remote_jobs(query, k=k))
+    elif args.morocco and queries:
+        for query in queries:
+            log(f"Searching for Morocco-relevant jobs matching: {query}")
+            display_results(vector_store.search_morocco_relevant(query, k=k))
+    elif len(queries) > 1:
+        # Several plain queries are embedded and searched in one batch
+        for query, results in zip(queries, vector_store.search_batch(queries, k=k)):
+            log(f"Searching for jobs similar to: {query}")
+            display_results(results)
+    elif queries:
+        log(f"Searching for jobs similar to: {queries[0]}")
+        display_results(vector_store.search_similar_jobs(queries[0], k=k))
 
 def main():
     """Main function to run the integration workflow."""
@@ -197,17 +249,31 @@ def main():
     if args.fetch:
         fetch_jobs(args)
     
-    # Build/update vector store (needed for search and stats)
-    if args.search or args.stats:
+    if args.stats and not args.search and not args.fetch:
+        from adzuna_vector_store import JobVectorStore
+        
+        # Statistics alone need neither ingestion nor the model: use the copy saved with the store
+        stats = JobVectorStore.load_statistics(args.vector_dir)
+        if stats is None:
+            vector_store = JobVectorStore(data_dir=args.output_dir, vector_dir=args.vector_dir,
+                                          onnx_model_dir=args.onnx_model)
+            vector_store.load(mmap=True)
+            stats = vector_store.get_job_statistics()
+        show_job_statistics(stats)
+    
+    # Build/update vector store (needed for search, and for stats on fresh data)
+    elif args.search or args.stats:
         vector_store = build_vector_store(args)
         
         # Show statistics if requested
         if args.stats:
-            show_job_statistics(vector_store)
+            show_job_statistics(vector_store.get_job_statistics())
         
         # Perform search if requested
         if args.search:
             perform_search(vector_store, args)
+        
+        vector_store.wait_for_save()
     
     log("Operation completed successfully")
 
@@ -1,10 +1,12 @@
+import asyncio
+import aiohttp
 import requests
 import json
 import os
-import time
 import csv
 import urllib.parse
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 class AdzunaSolution:
     """
@@ -12,6 +14,13 @@ class AdzunaSolution:
     that properly handles search parameters and results filtering.
     """
     
+    # Rate limiting and transient server errors are retried with backoff
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 5
+    # Page size of the analysis searches; a shorter page is the last one
+    RESULTS_PER_PAGE = 50
+    RETRY_BACKOFF = 0.5
+    
     def __init__(self, app_id: str = "e1ad5111", app_key: str = "1ff882c979b3403a7e2c47cfdc6a6578", 
                 output_dir: str = "adzuna_data"):
         """
@@ -29,6 +38,10 @@ class AdzunaSolution:
         self.base_url = "https://api.adzuna.com/v1/api"
         self.output_dir = output_dir
         
+        # Pooled session for the synchronous helpers, so connections are reused
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        
         # Create output directory if it doesn't exist
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
@@ -63,7 +76,7 @@ class AdzunaSolution:
         self.log(f"Calling API: {url}")
         
         try:
-            response = requests.get(url, params=params)
+            response = self.session.get(url, params=params)
             
             if response.status_code == 200:
                 return response.json()
@@ -91,23 +104,8 @@ class AdzunaSolution:
         Returns:
             Dictionary with search results
         """
-        endpoint = f"jobs/{country}/search/{page}"
-        
-        # Prepare parameters
-        params = {
-            "results_per_page": results_per_page,
-            "what": what,  # No URL encoding - let requests handle it properly
-            "sort_by": "relevance"  # Sort by relevance to get best matches first
-        }
-        
-        # Make request
-        data = self._make_request(endpoint, params)
-        if data and "results" in data:
-            jobs = data["results"]
-            total = data.get("count", 0)
-            self.log(f"Found {len(jobs)} jobs (Total: {total}) for '{what}' in {country}")
-            return data
-        return {"results": [], "count": 0}
+        endpoint, params = self._search_params(what, country, page, results_per_page)
+        return self._search_result(self._make_request(endpoint, params), what, country, "standard")
     
     def search_remote_jobs(self, what: str, country: str, page: int = 1, results_per_page: int = 50) -> dict:
         """
@@ -122,23 +120,31 @@ class AdzunaSolution:
         Returns:
             Dictionary with search results
         """
+        endpoint, params = self._search_params(what, country, page, results_per_page, remote=True)
+        return self._search_result(self._make_request(endpoint, params), what, country, "remote")
+    
+    def _search_params(self, what: str, country: str, page: int, results_per_page: int,
+                       remote: bool = False) -> tuple:
+        """Build the endpoint and query parameters for a (remote) job search."""
         endpoint = f"jobs/{country}/search/{page}"
         
-        # Prepare parameters with remote indicators
-        # Use known remote job terms from Adzuna
         params = {
             "results_per_page": results_per_page,
-            "what": what,
-            "where": "remote",  # Add remote location
-            "sort_by": "relevance"
+            "what": what,  # No URL encoding - let the HTTP client handle it properly
+            "sort_by": "relevance"  # Sort by relevance to get best matches first
         }
-        
-        # Make request
-        data = self._make_request(endpoint, params)
+        if remote:
+            # Use known remote job terms from Adzuna
+            params["where"] = "remote"
+        return endpoint, params
+    
+    def _search_result(self, data: dict, what: str, country: str, query_type: str) -> dict:
+        """Normalize a search response, logging the number of jobs found."""
         if data and "results" in data:
             jobs = data["results"]
             total = data.get("count", 0)
-            self.log(f"Found {len(jobs)} remote jobs (Total: {total}) for '{what}' in {country}")
+            label = "remote jobs" if query_type == "remote" else "jobs"
+            self.log(f"Found {len(jobs)} {label} (Total: {total}) for '{what}' in {country}")
             return data
         return {"results": [], "count": 0}
     
@@ -172,6 +178,115 @@ class AdzunaSolution:
         
         return jobs
     
+    async def _make_request_async(self, session: aiohttp.ClientSession,
+                                  semaphore: asyncio.Semaphore, endpoint: str,
+                                  params: dict) -> dict:
+        """
+        Make a request to the Adzuna API without blocking the event loop.
+        
+        Rate-limited (429) and transient server errors are retried with
+        exponential backoff, honouring Retry-After when the API sends it.
+        
+        Args:
+            session: Shared aiohttp session
+            semaphore: Bounds the number of requests in flight
+            endpoint: API endpoint to call
+            params: Query parameters
+            
+        Returns:
+            JSON response or empty dict if request failed
+        """
+        url = f"{self.base_url}/{endpoint}"
+        # aiohttp only accepts string query values
+        query = {key: str(value) for key, value in params.items()}
+        query.update({"app_id": self.app_id, "app_key": self.app_key})
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with semaphore:
+                if attempt == 0:
+                    self.log(f"Calling API: {url}")
+                try:
+                    async with session.get(url, params=query) as response:
+                        if response.status == 200:
+                            return await response.json(content_type=None)
+                        if response.status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                            self.log(f"API error: {response.status} - {await response.text()}", "ERROR")
+                            return {}
+                        retry_after = response.headers.get("Retry-After", "")
+                        status = response.status
+                        
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.log(f"Request exception: {str(e)}", "ERROR")
+                    return {}
+                except json.JSONDecodeError:
+                    self.log(f"Invalid JSON response", "ERROR")
+                    return {}
+            
+            # Back off outside the semaphore so other requests keep flowing
+            backoff = float(retry_after) if retry_after.isdigit() else self.RETRY_BACKOFF * 2 ** attempt
+            self.log(f"API returned {status} for {url}, retrying in {backoff:.1f}s", "WARN")
+            await asyncio.sleep(backoff)
+    
+    async def _fetch_single_async(self, session: aiohttp.ClientSession,
+                                  semaphore: asyncio.Semaphore, keyword: str,
+                                  country: str, page: int, query_type: str) -> list:
+        """
+        Fetch and tag one page of results for a keyword in a country.
+        
+        Args:
+            session: Shared aiohttp session
+            semaphore: Bounds the number of requests in flight
+            keyword: Search query
+            country: Country code
+            page: Page number
+            query_type: "standard" for a regular search, "remote" for a remote search
+            
+        Returns:
+            Tagged jobs (empty list if none were found)
+        """
+        endpoint, params = self._search_params(keyword, country, page, self.RESULTS_PER_PAGE,
+                                               remote=(query_type == "remote"))
+        data = await self._make_request_async(session, semaphore, endpoint, params)
+        search_results = self._search_result(data, keyword, country, query_type)
+        return self.tag_jobs(search_results["results"], country, keyword, query_type)
+    
+    async def _fetch_pages_async(self, session: aiohttp.ClientSession,
+                                 semaphore: asyncio.Semaphore, keyword: str,
+                                 country: str, query_type: str, max_pages: int) -> list:
+        """
+        Fetch the result pages of a keyword in a country, in order.
+        
+        Stops after the first page that is not full, so sparse keywords don't
+        spend API calls on empty pages.
+        
+        Returns:
+            Tagged jobs of all fetched pages
+        """
+        jobs = []
+        for page in range(1, max_pages + 1):
+            page_jobs = await self._fetch_single_async(session, semaphore, keyword,
+                                                       country, page, query_type)
+            jobs.extend(page_jobs)
+            if len(page_jobs) < self.RESULTS_PER_PAGE:
+                break
+        return jobs
+    
+    async def _fetch_all_async(self, tasks: list, max_concurrent: int) -> dict:
+        """
+        Fetch every (keyword, country, query_type, max_pages) task concurrently.
+        
+        Returns:
+            Dictionary mapping each (keyword, country, query_type) to its tagged jobs
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        connector = aiohttp.TCPConnector(limit=max_concurrent, limit_per_host=8)
+        async with aiohttp.ClientSession(connector=connector,
+                                         headers={"Accept": "application/json"}) as session:
+            pages = await asyncio.gather(*[
+                self._fetch_pages_async(session, semaphore, *task) for task in tasks
+            ])
+        return {task[:3]: jobs for task, jobs in zip(tasks, pages)}
+    
     def save_jobs_to_csv(self, jobs: list, filename: str, specialty: str = None) -> str:
         """
         Save jobs to a CSV file.
@@ -258,13 +373,19 @@ class AdzunaSolution:
         self.log(f"Deduplicated {len(jobs)} jobs to {len(deduplicated)} unique jobs")
         return deduplicated
     
-    def run_analysis(self, specialties: dict, max_pages: int = 2) -> dict:
+    def run_analysis(self, specialties: dict, max_pages: int = 2, max_concurrent: int = 32) -> dict:
         """
         Run a comprehensive analysis of job data across multiple countries.
         
+        All (keyword, country) searches run concurrently on one asyncio event
+        loop, since the work is almost entirely waiting on the network; each
+        fetches its pages in turn until one is not full. Results are then
+        aggregated and saved in the usual specialty/keyword order.
+        
         Args:
             specialties: Dictionary mapping specialties to keywords
             max_pages: Maximum pages to fetch per keyword
+            max_concurrent: Maximum number of concurrent API requests
             
         Returns:
             Dictionary with analysis results
@@ -275,6 +396,18 @@ class AdzunaSolution:
             "countries": {}
         }
         
+        # Standard search pages plus one remote search per keyword and country
+        keywords = list(dict.fromkeys(kw for kws in specialties.values() for kw in kws))
+        tasks = [(keyword, country, "standard", max_pages)
+                 for keyword in keywords
+                 for country in self.countries]
+        tasks += [(keyword, country, "remote", 1)
+                  for keyword in keywords
+                  for country in self.countries]
+        
+        self.log(f"Running {len(tasks)} searches, up to {max_concurrent} requests at a time")
+        fetched = asyncio.run(self._fetch_all_async(tasks, max_concurrent))
+        
         # For each specialty
         for specialty, keywords in specialties.items():
             self.log(f"\n🔍 Analyzing specialty: {specialty.replace('_', ' ').title()}")
@@ -288,34 +421,10 @@ class AdzunaSolution:
                 self.log(f"🔎 Analyzing keyword: {keyword}")
                 keyword_jobs = []
                 
-                # Try each country
+                # Collect each country's pages in order, then its remote results
                 for country in self.countries:
-                    country_jobs = []
-                    
-                    # Standard search
-                    self.log(f"  Searching in {country} for '{keyword}'")
-                    for page in range(1, max_pages + 1):
-                        search_results = self.search_jobs(keyword, country, page)
-                        if "results" in search_results and search_results["results"]:
-                            jobs = search_results["results"]
-                            tagged_jobs = self.tag_jobs(jobs, country, keyword, "standard")
-                            country_jobs.extend(tagged_jobs)
-                            
-                            # If we got fewer results than asked for, no need for more pages
-                            if len(jobs) < 50:
-                                break
-                        else:
-                            break
-                            
-                        time.sleep(1)  # Pause to avoid rate limiting
-                    
-                    # Remote search for the same keyword
-                    self.log(f"  Searching remote jobs in {country} for '{keyword}'")
-                    search_results = self.search_remote_jobs(keyword, country)
-                    if "results" in search_results and search_results["results"]:
-                        jobs = search_results["results"]
-                        tagged_jobs = self.tag_jobs(jobs, country, keyword, "remote")
-                        country_jobs.extend(tagged_jobs)
+                    country_jobs = (fetched[(keyword, country, "standard")]
+                                    + fetched[(keyword, country, "remote")])
                     
                     # Log country results
                     self.log(f"  Found {len(country_jobs)} jobs in {country} for '{keyword}'")
@@ -325,8 +434,6 @@ class AdzunaSolution:
                     if country not in results["countries"]:
                         results["countries"][country] = 0
                     results["countries"][country] += len(country_jobs)
-                    
-                    time.sleep(2)  # Pause between countries
                 
                 # Deduplicate jobs for this keyword
                 unique_keyword_jobs = self.deduplicate_jobs(keyword_jobs)
@@ -344,8 +451,6 @@ class AdzunaSolution:
                     }
                     
                     specialty_results["jobs"].extend(unique_keyword_jobs)
-                
-                time.sleep(2)  # Pause between keywords
             
             # Save jobs for this specialty
             unique_specialty_jobs = self.deduplicate_jobs(specialty_results["jobs"])
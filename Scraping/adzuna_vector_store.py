@@ -1,12 +1,14 @@
 import faiss
+import hashlib
 import numpy as np
 import pickle
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Union, Tuple, Any
-from sentence_transformers import SentenceTransformer
 import pandas as pd
-from tqdm import tqdm
+from embed_cache import EmbeddingCache
 
 class JobVectorStore:
     """
@@ -14,10 +16,19 @@ class JobVectorStore:
     This enables efficient similarity search and advanced querying of job data.
     """
     
+    # Store sizes from which "auto" switches to an approximate index
+    HNSW_MIN_JOBS = 10_000
+    IVFPQ_MIN_JOBS = 1_000_000
+    # Number of texts from which encoding is sharded over a pool of worker processes
+    MULTI_PROCESS_MIN_TEXTS = 2000
+    
     def __init__(self, 
                  model_name: str = "paraphrase-multilingual-MiniLM-L12-v2", 
                  data_dir: str = "adzuna_data",
-                 vector_dir: str = "vector_store"):
+                 vector_dir: str = "vector_store",
+                 use_embedding_cache: bool = True,
+                 onnx_model_dir: str = None,
+                 compile_model: bool = False):
         """
         Initialize JobVectorStore.
         
@@ -25,6 +36,11 @@ class JobVectorStore:
             model_name: Name of the sentence-transformer model for generating embeddings
             data_dir: Directory where CSV job data is stored
             vector_dir: Directory to store vector indices and metadata
+            use_embedding_cache: Reuse embeddings of previously seen job texts
+            onnx_model_dir: Directory of an int8 ONNX export of the model (see
+                onnx_encoder.py); encodes with ONNX Runtime instead of PyTorch
+            compile_model: Speed up the PyTorch encoder with BetterTransformer and
+                torch.compile (worth it for large ingests, not for a few queries)
         """
         self.data_dir = data_dir
         self.vector_dir = vector_dir
@@ -34,43 +50,189 @@ class JobVectorStore:
             os.makedirs(vector_dir)
             
         # Load embedding model
-        print(f"Loading embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name)
+        if onnx_model_dir:
+            from onnx_encoder import OnnxSentenceEncoder
+            print(f"Loading ONNX embedding model from {onnx_model_dir}")
+            self.model = OnnxSentenceEncoder(onnx_model_dir)
+            model_name = f"{model_name}_onnx_int8"
+        else:
+            # Imported here so that reading saved statistics does not load torch
+            from sentence_transformers import SentenceTransformer
+            print(f"Loading embedding model: {model_name}")
+            self.model = SentenceTransformer(model_name)
+        self._compiled = False
+        if compile_model and not onnx_model_dir:
+            self._compile_model()
         self.vector_dim = self.model.get_sentence_embedding_dimension()
         print(f"Model loaded with vector dimension: {self.vector_dim}")
         
-        # Initialize FAISS index
-        self.index = faiss.IndexFlatL2(self.vector_dim)  # L2 distance (Euclidean)
+        # Embeddings of already-seen job texts, one cache file per model
+        self.embedding_cache = None
+        if use_embedding_cache:
+            cache_name = "embeddings_" + model_name.replace("/", "_")
+            self.embedding_cache = EmbeddingCache(vector_dir, self.vector_dim, cache_name)
+        
+        # Initialize FAISS index (exact cosine search over half-precision unit vectors)
+        self.index = self._create_index("flat", None)
+        self._index_mmapped = False  # index memory-mapped read-only by load(mmap=True)
+        self._save_thread = None
         
         # Storage for job data
         self.jobs = []
         self.job_ids_map = {}  # Maps FAISS index positions to job indices in self.jobs
         
-    def _create_job_vector(self, job: Dict[str, Any]) -> np.ndarray:
+        # Content hashes of the jobs in the store, used to skip duplicate postings
+        self._seen = set()
+        self._seen_count = 0  # len(self.jobs) when self._seen was last in sync
+        
+        # Per-job columns (remote, international, specialty, country) for statistics
+        self._reset_columns()
+        
+        # Guards the lazily synced duplicate filter and statistics columns, which
+        # a background save() updates while the caller may be reading statistics
+        self._sync_lock = threading.Lock()
+        
+    def _job_text(self, job: Dict[str, Any]) -> str:
         """
-        Create a vector embedding for a job listing.
+        Build the text representation of a job that gets embedded.
         
         Args:
             job: Job listing dictionary
             
         Returns:
-            Vector embedding as numpy array
+            Text combining the important job fields
         """
-        # Create a rich text representation combining important job fields
         text = f"Title: {job.get('title', '')} "
         text += f"Company: {job.get('company', '')} "
         text += f"Location: {job.get('location', '')} "
         text += f"Description: {job.get('description', '')}"
+        return text
+    
+    def _compile_model(self) -> None:
+        """Fuse the encoder's attention kernels and compile it, falling back to eager mode"""
+        try:
+            from optimum.bettertransformer import BetterTransformer
+            self.model[0].auto_model = BetterTransformer.transform(self.model[0].auto_model,
+                                                                   keep_original_model=False)
+            print("Converted encoder to BetterTransformer")
+        except Exception as e:
+            print(f"BetterTransformer not applied: {str(e)}")
+        
+        eager_model = self.model[0].auto_model
+        try:
+            import torch
+            # Batches vary in length, so compile for dynamic shapes
+            self.model[0].auto_model = torch.compile(eager_model, mode='reduce-overhead',
+                                                     fullgraph=False, dynamic=True)
+            self._compiled = True
+            print("Compiled encoder with torch.compile")
+        except Exception as e:
+            print(f"torch.compile failed, using eager model: {str(e)}")
+            self.model[0].auto_model = eager_model
+    
+    @staticmethod
+    def _job_key(job: Dict[str, Any]) -> bytes:
+        """
+        Content hash identifying a job posting across pages and countries.
+        
+        Args:
+            job: Job listing dictionary
+            
+        Returns:
+            SHA-1 digest of the title, company and location
+        """
+        text = '\0'.join(str(job.get(field, '')) for field in ('title', 'company', 'location'))
+        return hashlib.sha1(text.encode('utf-8')).digest()
+    
+    def _sync_seen(self) -> None:
+        """Rebuild the duplicate filter if self.jobs was changed outside add_jobs_*."""
+        with self._sync_lock:
+            if self._seen_count != len(self.jobs):
+                self._seen = {self._job_key(job) for job in self.jobs}
+                self._seen_count = len(self.jobs)
+    
+    def _create_job_vector(self, job: Dict[str, Any]) -> np.ndarray:
+        """
+        Create a vector embedding for a job listing.
+        
+        Args:
+            job: Job listing dictionary
+            
+        Returns:
+            Vector embedding as numpy array
+        """
+        return self._create_job_vectors([job])[0]
+    
+    def _create_job_vectors(self, jobs: List[Dict[str, Any]], batch_size: int = 256) -> np.ndarray:
+        """
+        Create vector embeddings for many job listings in batched model calls.
+        
+        Texts found in the embedding cache are not re-encoded. SentenceTransformer.encode
+        sorts its input by length before batching, so each batch is only padded
+        to its own longest text.
+        
+        Args:
+            jobs: Job listing dictionaries
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            Array of shape (len(jobs), vector_dim)
+        """
+        texts = [self._job_text(job) for job in jobs]
+        cache = self.embedding_cache
+        if cache is None:
+            return self._encode(texts, batch_size)
+        
+        keys = [cache.key(text) for text in texts]
+        # First position of each distinct text that is not cached yet
+        missing = {}
+        for i, key in enumerate(keys):
+            if key not in cache and key not in missing:
+                missing[key] = i
+        if missing:
+            print(f"Encoding {len(missing)} new texts ({len(texts) - len(missing)} cached or repeated)")
+            vectors = self._encode([texts[i] for i in missing.values()], batch_size)
+            for key, vector in zip(missing, vectors):
+                cache.put(key, vector)
+        
+        return np.stack([cache.get(key) for key in keys])
+    
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed search queries as L2-normalized float32 vectors."""
+        query_vectors = np.ascontiguousarray(self.model.encode(queries, batch_size=64), dtype='float32')
+        faiss.normalize_L2(query_vectors)
+        return query_vectors
+    
+    def _encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """
+        Encode texts with the sentence-transformer model.
         
-        # Generate embedding
-        return self.model.encode([text])[0]
+        Large corpora are split over one worker process per CPU core (or per GPU)
+        with SentenceTransformer's multi-process pool; the ONNX encoder, compiled
+        models (which cannot be sent to worker processes) and small batches use a
+        single in-process call.
+        """
+        if (len(texts) > self.MULTI_PROCESS_MIN_TEXTS and not self._compiled
+                and hasattr(self.model, 'start_multi_process_pool')):
+            # None lets sentence-transformers use every visible GPU
+            devices = None if self.model.device.type == 'cuda' else ['cpu'] * (os.cpu_count() or 1)
+            pool = self.model.start_multi_process_pool(target_devices=devices)
+            try:
+                return self.model.encode_multi_process(texts, pool, batch_size=batch_size,
+                                                       chunk_size=5000)
+            finally:
+                self.model.stop_multi_process_pool(pool)
+        
+        return self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True,
+                                 show_progress_bar=len(texts) > batch_size)
     
-    def add_jobs_from_csv(self, csv_path: str) -> int:
+    def add_jobs_from_csv(self, csv_path: str, batch_size: int = 256) -> int:
         """
         Add jobs from a CSV file to the vector store.
         
         Args:
             csv_path: Path to CSV file containing job data
+            batch_size: Number of jobs embedded per model call
             
         Returns:
             Number of jobs added
@@ -81,59 +243,68 @@ class JobVectorStore:
             jobs_df = pd.read_csv(csv_path)
             print(f"Found {len(jobs_df)} jobs in CSV")
             
-            return self.add_jobs_from_dataframe(jobs_df)
+            return self.add_jobs_from_dataframe(jobs_df, batch_size)
             
         except Exception as e:
             print(f"Error loading CSV: {str(e)}")
             return 0
     
-    def add_jobs_from_dataframe(self, jobs_df: pd.DataFrame) -> int:
+    def add_jobs_from_dataframe(self, jobs_df: pd.DataFrame, batch_size: int = 256) -> int:
         """
         Add jobs from a pandas DataFrame to the vector store.
         
         Args:
             jobs_df: DataFrame containing job data
+            batch_size: Number of jobs embedded per model call
             
         Returns:
             Number of jobs added
         """
-        # Get current index size
-        current_index = len(self.jobs)
-        added = 0
-        
-        # Convert DataFrame to list of dicts
-        jobs_to_add = jobs_df.to_dict('records')
+        # Convert DataFrame to list of dicts, dropping postings already in the store
+        self._sync_seen()
+        jobs_to_add = []
+        duplicates = 0
+        for job in jobs_df.to_dict('records'):
+            key = self._job_key(job)
+            if key in self._seen:
+                duplicates += 1
+                continue
+            self._seen.add(key)
+            jobs_to_add.append(job)
         
-        # Create vectors for each job
-        vectors = []
-        valid_jobs = []
+        if duplicates:
+            print(f"Skipped {duplicates} duplicate jobs")
+        if not jobs_to_add:
+            print("No jobs were added")
+            return 0
         
-        print("Creating embeddings for jobs...")
-        for job in tqdm(jobs_to_add):
-            try:
-                vector = self._create_job_vector(job)
-                vectors.append(vector)
-                valid_jobs.append(job)
-                
-                # Map the FAISS index position to the job index in self.jobs
-                self.job_ids_map[current_index + added] = current_index + added
-                
-                added += 1
-            except Exception as e:
-                print(f"Error creating embedding for job: {str(e)}")
+        print(f"Creating embeddings for {len(jobs_to_add)} jobs...")
+        try:
+            job_vectors = np.ascontiguousarray(self._create_job_vectors(jobs_to_add, batch_size),
+                                               dtype='float32')
+            # Unit vectors make the inner-product index score cosine similarity
+            faiss.normalize_L2(job_vectors)
+        except Exception as e:
+            print(f"Error creating embeddings for jobs: {str(e)}")
+            self._seen_count = -1  # the keys added above were never stored
+            return 0
         
-        if added > 0:
-            # Convert to numpy array and add to FAISS index
-            job_vectors = np.array(vectors).astype('float32')
-            self.index.add(job_vectors)
-            
-            # Store job data
-            self.jobs.extend(valid_jobs)
-            
-            print(f"Added {added} jobs to vector store")
-        else:
-            print("No jobs were added")
-            
+        # Map the FAISS index positions to the job indices in self.jobs
+        current_index = len(self.jobs)
+        added = len(jobs_to_add)
+        for position in range(current_index, current_index + added):
+            self.job_ids_map[position] = position
+        
+        if self._index_mmapped:
+            # A memory-mapped index is read-only; copy it into RAM before adding
+            self.index = faiss.clone_index(self.index)
+            self._set_search_params(self.index)
+            self._index_mmapped = False
+        self.index.add(job_vectors)
+        self.jobs.extend(jobs_to_add)
+        self._seen_count = len(self.jobs)
+        
+        print(f"Added {added} jobs to vector store")
         return added
     
     def search_similar_jobs(self, 
@@ -157,39 +328,13 @@ class JobVectorStore:
         
         try:
             # Create query vector
-            query_vector = self.model.encode([query])[0].reshape(1, -1).astype('float32')
+            query_vector = self._encode_queries([query])
             
             # Search in FAISS
             distances, indices = self.index.search(query_vector, k if not filter_fn else min(k*5, len(self.jobs)))
             
-            # Get job data for results
-            results = []
-            for i, (dist, idx) in enumerate(zip(distances[0], indices[0])):
-                # Skip invalid indices (can happen if index was modified)
-                if idx < 0 or idx >= len(self.jobs):
-                    continue
-                    
-                # Get the job using the mapping
-                job_id = self.job_ids_map.get(idx)
-                if job_id is None or job_id >= len(self.jobs):
-                    continue
-                    
-                job = self.jobs[job_id].copy()
-                
-                # Add distance score (convert to similarity score)
-                job['similarity_score'] = 1.0 / (1.0 + dist)
-                
-                # Apply filter if provided
-                if filter_fn and not filter_fn(job):
-                    continue
-                    
-                results.append(job)
-                
-                # Stop if we have enough results after filtering
-                if len(results) >= k:
-                    break
-            
             # If we got results, return them
+            results = self._collect_results(distances[0], indices[0], k, filter_fn)
             if results:
                 return results
             
@@ -201,6 +346,83 @@ class JobVectorStore:
             print(f"Error in vector search: {str(e)}")
             # Fallback to simple text search
             return self._fallback_search(query, k, filter_fn)
+    
+    def search_batch(self, queries: List[str], k: int = 10) -> List[List[Dict[str, Any]]]:
+        """
+        Search for jobs similar to several queries at once.
+        
+        All queries are embedded in one model call and searched with a single
+        FAISS call, which is much faster than searching them one by one.
+        
+        Args:
+            queries: Search query texts
+            k: Number of results to return per query
+            
+        Returns:
+            One list of similar jobs (with similarity scores) per query
+        """
+        if not self.jobs:
+            print("Vector store is empty")
+            return [[] for _ in queries]
+        
+        try:
+            query_vectors = self._encode_queries(queries)
+            distances, indices = self.index.search(query_vectors, k)
+        except Exception as e:
+            print(f"Error in vector search: {str(e)}")
+            return [self._fallback_search(query, k) for query in queries]
+        
+        results = []
+        for query, dist_row, idx_row in zip(queries, distances, indices):
+            query_results = self._collect_results(dist_row, idx_row, k)
+            if not query_results:
+                print(f"No results from vector search for '{query}', using fallback")
+                query_results = self._fallback_search(query, k)
+            results.append(query_results)
+        return results
+    
+    def _collect_results(self, distances: np.ndarray, indices: np.ndarray, k: int,
+                         filter_fn: callable = None) -> List[Dict[str, Any]]:
+        """
+        Turn one row of FAISS search output into scored job dictionaries.
+        
+        Args:
+            distances: Scores (inner products or L2 distances) returned by the index for one query
+            indices: Index positions returned by the index for one query
+            k: Number of results to return
+            filter_fn: Optional function to filter results
+            
+        Returns:
+            Up to k matching jobs with similarity scores
+        """
+        cosine = self.index.metric_type == faiss.METRIC_INNER_PRODUCT
+        results = []
+        for dist, idx in zip(distances, indices):
+            # Skip invalid indices (can happen if index was modified)
+            if idx < 0 or idx >= len(self.jobs):
+                continue
+                
+            # Get the job using the mapping
+            job_id = self.job_ids_map.get(idx)
+            if job_id is None or job_id >= len(self.jobs):
+                continue
+                
+            job = self.jobs[job_id].copy()
+            
+            # Inner products of unit vectors are cosine similarities; older
+            # L2 indexes return distances, converted to a similarity score
+            job['similarity_score'] = float(dist) if cosine else 1.0 / (1.0 + dist)
+            
+            # Apply filter if provided
+            if filter_fn and not filter_fn(job):
+                continue
+                
+            results.append(job)
+            
+            # Stop if we have enough results after filtering
+            if len(results) >= k:
+                break
+        return results
             
     def _fallback_search(self, query: str, k: int, filter_fn: callable = None) -> List[Dict[str, Any]]:
         """
@@ -330,12 +552,15 @@ class JobVectorStore:
             
         return self.search_similar_jobs(query, k, morocco_filter)
     
-    def add_jobs_from_directory(self, directory: str = None) -> int:
+    def add_jobs_from_directory(self, directory: str = None, batch_size: int = 256) -> int:
         """
         Add jobs from all CSV files in a directory.
         
+        All files are read first so the jobs are embedded in one batched pass.
+        
         Args:
             directory: Directory containing CSV files (defaults to data_dir)
+            batch_size: Number of jobs embedded per model call
             
         Returns:
             Total number of jobs added
@@ -347,58 +572,198 @@ class JobVectorStore:
             print(f"Directory not found: {directory}")
             return 0
             
-        total_added = 0
+        filepaths = [os.path.join(directory, filename)
+                     for filename in sorted(os.listdir(directory)) if filename.endswith('.csv')]
+        
+        # pandas' C parser releases the GIL while tokenizing, so files are read concurrently
+        frames = []
+        with ThreadPoolExecutor(max_workers=min(8, len(filepaths) or 1)) as executor:
+            for filepath, jobs_df in zip(filepaths, executor.map(self._read_csv, filepaths)):
+                print(f"Loading jobs from {filepath}")
+                if jobs_df is not None:
+                    frames.append(jobs_df)
         
-        for filename in os.listdir(directory):
-            if filename.endswith('.csv'):
-                filepath = os.path.join(directory, filename)
-                added = self.add_jobs_from_csv(filepath)
-                total_added += added
+        total_added = 0
+        if frames:
+            total_added = self.add_jobs_from_dataframe(pd.concat(frames, ignore_index=True), batch_size)
                 
         print(f"Added a total of {total_added} jobs from {directory}")
         return total_added
     
+    @staticmethod
+    def _read_csv(filepath: str) -> pd.DataFrame:
+        """Read one job CSV, or return None if it cannot be parsed."""
+        try:
+            return pd.read_csv(filepath, engine='c')
+        except Exception as e:
+            print(f"Error loading CSV {filepath}: {str(e)}")
+            return None
+    
+    def index_type(self) -> str:
+        """Kind of the current FAISS index: "flat", "hnsw" or "ivfpq"."""
+        if isinstance(self.index, faiss.IndexHNSW):
+            return "hnsw"
+        if isinstance(self.index, faiss.IndexIVF):
+            return "ivfpq"
+        return "flat"
+    
+    def ensure_index_type(self, index_type: str = "auto") -> bool:
+        """
+        Rebuild the FAISS index as the requested type if it is not already.
+        
+        Exact (flat) search scans every vector per query; HNSW graphs search in
+        roughly logarithmic time and IVF-PQ additionally compresses the vectors,
+        at the cost of a small loss in recall.
+        
+        Args:
+            index_type: "flat", "hnsw", "ivfpq", or "auto" to pick by store size
+            
+        Returns:
+            True if the index was rebuilt
+        """
+        count = self.index.ntotal
+        if index_type == "auto":
+            if count >= self.IVFPQ_MIN_JOBS:
+                index_type = "ivfpq"
+            elif count >= self.HNSW_MIN_JOBS:
+                index_type = "hnsw"
+            else:
+                index_type = self.index_type()
+        
+        if (index_type == self.index_type() and self._is_compact()
+                and self.index.metric_type == faiss.METRIC_INNER_PRODUCT):
+            return False
+        
+        print(f"Rebuilding {self.index_type()} index with {count} vectors as {index_type}")
+        vectors = np.ascontiguousarray(self._index_vectors(), dtype='float32')
+        # Vectors from older L2 indexes were stored unnormalized
+        faiss.normalize_L2(vectors)
+        self.index = self._create_index(index_type, vectors)
+        self.index.add(vectors)
+        self._index_mmapped = False
+        return True
+    
+    def _create_index(self, index_type: str, vectors: np.ndarray) -> faiss.Index:
+        """
+        Create an empty FAISS index of the given type, trained on vectors if needed.
+        
+        All index types use the inner-product metric over L2-normalized vectors,
+        so search scores are cosine similarities. Flat and HNSW indexes store
+        vectors as float16: search over them is memory-bandwidth bound, so
+        halving the bytes read roughly doubles throughput, with a negligible
+        effect on similarity scores.
+        
+        Args:
+            index_type: "flat", "hnsw" or "ivfpq"
+            vectors: Vectors the index will hold (used to train IVF-PQ; may be None otherwise)
+            
+        Returns:
+            FAISS index ready for add()
+        """
+        d = self.vector_dim
+        if index_type == "ivfpq":
+            nlist = int(np.sqrt(len(vectors)))
+            m = 16 if d % 16 == 0 else 8
+            # PQ needs 256 training points per codebook; IVF wants ~39 per list
+            if len(vectors) >= max(256, 39 * nlist) and d % m == 0:
+                index = faiss.IndexIVFPQ(faiss.IndexFlatIP(d), d, nlist, m, 8,
+                                         faiss.METRIC_INNER_PRODUCT)
+                index.train(vectors)
+                self._set_search_params(index)
+                return index
+            print("Not enough vectors to train IVF-PQ, using HNSW instead")
+            index_type = "hnsw"
+        
+        if index_type == "hnsw":
+            index = faiss.IndexHNSWSQ(d, faiss.ScalarQuantizer.QT_fp16, 32,
+                                      faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            self._set_search_params(index)
+            return index
+        
+        return faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_fp16,
+                                          faiss.METRIC_INNER_PRODUCT)
+    
+    def _is_compact(self) -> bool:
+        """Whether the index stores vectors in a compressed form (not float32)."""
+        storage = self.index
+        if isinstance(storage, faiss.IndexHNSW):
+            storage = faiss.downcast_index(storage.storage)
+        return isinstance(storage, (faiss.IndexScalarQuantizer, faiss.IndexIVFPQ))
+    
+    def _set_search_params(self, index: faiss.Index) -> None:
+        """Set query-time accuracy/speed parameters, which are not all persisted."""
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = 64
+        elif isinstance(index, faiss.IndexIVF):
+            index.nprobe = 16
+    
+    def _index_vectors(self) -> np.ndarray:
+        """Read all vectors back out of the current FAISS index."""
+        if isinstance(self.index, faiss.IndexIVF):
+            self.index.make_direct_map()
+        return self.index.reconstruct_n(0, self.index.ntotal)
+    
+    def _reset_columns(self) -> None:
+        """Clear the per-job statistics columns."""
+        self._remote = np.zeros(0, dtype=bool)
+        self._international = np.zeros(0, dtype=bool)
+        self._specialty_codes = np.zeros(0, dtype=np.int32)
+        self._country_codes = np.zeros(0, dtype=np.int32)
+        self._specialty_vocab = {}  # specialty -> code, in order of first appearance
+        self._country_vocab = {}
+        self._columns_count = 0  # number of jobs the columns cover
+    
+    def _sync_columns(self) -> None:
+        """Append statistics columns for jobs added to self.jobs since the last sync (lock held)."""
+        if self._columns_count > len(self.jobs):
+            self._reset_columns()
+        new_jobs = self.jobs[self._columns_count:]
+        if not new_jobs:
+            return
+        
+        n = len(new_jobs)
+        specialties, countries = self._specialty_vocab, self._country_vocab
+        self._remote = np.concatenate([self._remote, np.fromiter(
+            (bool(job.get('remote_friendly', False)) for job in new_jobs), dtype=bool, count=n)])
+        self._international = np.concatenate([self._international, np.fromiter(
+            (bool(job.get('international', False)) for job in new_jobs), dtype=bool, count=n)])
+        self._specialty_codes = np.concatenate([self._specialty_codes, np.fromiter(
+            (specialties.setdefault(job.get('specialty', 'unknown'), len(specialties)) for job in new_jobs),
+            dtype=np.int32, count=n)])
+        self._country_codes = np.concatenate([self._country_codes, np.fromiter(
+            (countries.setdefault(job.get('source_country', 'unknown'), len(countries)) for job in new_jobs),
+            dtype=np.int32, count=n)])
+        self._columns_count = len(self.jobs)
+    
+    @staticmethod
+    def _count_codes(codes: np.ndarray, vocab: Dict[Any, int]) -> Dict[Any, int]:
+        """Count the jobs per category, skipping empty category values."""
+        counts = np.bincount(codes, minlength=len(vocab))
+        return {value: int(count) for value, count in zip(vocab, counts) if value and count}
+    
     def get_job_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about the jobs in the vector store.
         
+        Counts are NumPy reductions over per-job columns kept alongside self.jobs,
+        which are only extended for jobs added since the previous call.
+        
         Returns:
             Dictionary with statistics
         """
         if not self.jobs:
             return {"total_jobs": 0}
-            
-        specialties = {}
-        countries = {}
-        remote_count = 0
-        international_count = 0
         
-        for job in self.jobs:
-            # Count by specialty
-            specialty = job.get('specialty', 'unknown')
-            if specialty:
-                specialties[specialty] = specialties.get(specialty, 0) + 1
-                
-            # Count by country
-            country = job.get('source_country', 'unknown')
-            if country:
-                countries[country] = countries.get(country, 0) + 1
-                
-            # Count remote jobs
-            if job.get('remote_friendly', False):
-                remote_count += 1
-                
-            # Count international jobs
-            if job.get('international', False):
-                international_count += 1
-                
-        return {
-            "total_jobs": len(self.jobs),
-            "specialties": specialties,
-            "countries": countries,
-            "remote_jobs": remote_count,
-            "international_jobs": international_count
-        }
+        with self._sync_lock:
+            self._sync_columns()
+            return {
+                "total_jobs": self._columns_count,
+                "specialties": self._count_codes(self._specialty_codes, self._specialty_vocab),
+                "countries": self._count_codes(self._country_codes, self._country_vocab),
+                "remote_jobs": int(np.count_nonzero(self._remote)),
+                "international_jobs": int(np.count_nonzero(self._international))
+            }
     
     def save(self, base_filename: str = "job_vector_store") -> bool:
         """
@@ -411,14 +776,27 @@ class JobVectorStore:
             True if successful
         """
         try:
-            # Save FAISS index
+            # Save FAISS index (via a temporary file, as the old one may be memory-mapped)
             index_path = os.path.join(self.vector_dir, f"{base_filename}.index")
-            faiss.write_index(self.index, index_path)
+            faiss.write_index(self.index, f"{index_path}.tmp")
+            os.replace(f"{index_path}.tmp", index_path)
             
             # Save job data and mapping
             data_path = os.path.join(self.vector_dir, f"{base_filename}.pkl")
-            with open(data_path, 'wb') as f:
-                pickle.dump((self.jobs, self.job_ids_map), f)
+            self._dump_pickle((self.jobs, self.job_ids_map), data_path)
+            
+            # Save the duplicate filter
+            self._sync_seen()
+            self._dump_pickle(self._seen, os.path.join(self.vector_dir, "seen.pkl"))
+            
+            # Save the statistics so --stats can skip loading the store
+            stats_path = os.path.join(self.vector_dir, f"{base_filename}_stats.json")
+            with open(f"{stats_path}.tmp", 'w') as f:
+                json.dump(self.get_job_statistics(), f)
+            os.replace(f"{stats_path}.tmp", stats_path)
+            
+            if self.embedding_cache is not None:
+                self.embedding_cache.save()
                 
             print(f"Vector store saved to {self.vector_dir}/{base_filename}.*")
             return True
@@ -427,12 +805,98 @@ class JobVectorStore:
             print(f"Error saving vector store: {str(e)}")
             return False
     
-    def load(self, base_filename: str = "job_vector_store") -> bool:
+    def save_in_background(self, base_filename: str = "job_vector_store") -> threading.Thread:
+        """
+        Start save() in a background thread so callers can keep searching.
+        
+        Every file is written to a temporary path and renamed into place, so an
+        interrupted save leaves the previous store intact. Call wait_for_save()
+        before exiting.
+        
+        Args:
+            base_filename: Base filename for saved files
+            
+        Returns:
+            The thread running the save
+        """
+        self.wait_for_save()
+        self._save_thread = threading.Thread(target=self.save, args=(base_filename,), daemon=True)
+        self._save_thread.start()
+        return self._save_thread
+    
+    def wait_for_save(self) -> None:
+        """Block until a save started by save_in_background() has finished."""
+        if self._save_thread is not None:
+            self._save_thread.join()
+            self._save_thread = None
+    
+    @staticmethod
+    def _dump_pickle(obj: Any, path: str) -> None:
+        """Pickle obj to path atomically (temporary file + rename)."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def load_statistics(vector_dir: str, base_filename: str = "job_vector_store") -> Dict[str, Any]:
+        """
+        Read the statistics written by save() without loading the model or index.
+        
+        Args:
+            vector_dir: Directory containing the saved vector store
+            base_filename: Base filename for saved files
+            
+        Returns:
+            Dictionary with statistics, or None if there is no up-to-date copy
+        """
+        stats_path = os.path.join(vector_dir, f"{base_filename}_stats.json")
+        data_path = os.path.join(vector_dir, f"{base_filename}.pkl")
+        try:
+            # Stores saved before the statistics file existed have only the pickle
+            if os.path.getmtime(stats_path) < os.path.getmtime(data_path):
+                return None
+            with open(stats_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def has_new_data(self, directory: str = None, base_filename: str = "job_vector_store") -> bool:
+        """
+        Check whether any CSV file in a directory is newer than the saved index.
+        
+        Args:
+            directory: Directory containing CSV files (defaults to data_dir)
+            base_filename: Base filename for saved files
+            
+        Returns:
+            True if there is no saved index or a CSV was modified after it
+        """
+        index_path = os.path.join(self.vector_dir, f"{base_filename}.index")
+        if not os.path.exists(index_path):
+            return True
+        directory = directory or self.data_dir
+        if not os.path.exists(directory):
+            return False
+        
+        index_mtime = os.path.getmtime(index_path)
+        return any(entry.name.endswith('.csv') and entry.stat().st_mtime > index_mtime
+                   for entry in os.scandir(directory))
+    
+    def mark_up_to_date(self, base_filename: str = "job_vector_store") -> None:
+        """Record that the CSV files were ingested without changes to the saved index."""
+        index_path = os.path.join(self.vector_dir, f"{base_filename}.index")
+        if os.path.exists(index_path):
+            os.utime(index_path)
+    
+    def load(self, base_filename: str = "job_vector_store", mmap: bool = False) -> bool:
         """
         Load the vector store from disk.
         
         Args:
             base_filename: Base filename for saved files
+            mmap: Memory-map the FAISS index read-only instead of reading it into
+                RAM; only the pages touched by searches are loaded
             
         Returns:
             True if successful
@@ -447,17 +911,45 @@ class JobVectorStore:
                 return False
                 
             # Load FAISS index
-            self.index = faiss.read_index(index_path)
+            self.index = None
+            if mmap:
+                try:
+                    self.index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+                except RuntimeError as e:
+                    # Not every index type can be memory-mapped
+                    print(f"Could not memory-map the index, reading it into memory: {str(e)}")
+            self._index_mmapped = self.index is not None
+            if self.index is None:
+                self.index = faiss.read_index(index_path)
+            self._set_search_params(self.index)
             
             # Load job data and mapping
             with open(data_path, 'rb') as f:
                 self.jobs, self.job_ids_map = pickle.load(f)
+            with self._sync_lock:
+                self._reset_columns()
+            
+            # Load the duplicate filter (rebuilt from the jobs if missing)
+            seen_path = os.path.join(self.vector_dir, "seen.pkl")
+            self._seen, self._seen_count = set(), -1
+            if os.path.exists(seen_path):
+                with open(seen_path, 'rb') as f:
+                    self._seen = pickle.load(f)
+                self._seen_count = len(self.jobs)
+            self._sync_seen()
                 
             print(f"Loaded vector store with {len(self.jobs)} jobs")
             return True
             
         except Exception as e:
             print(f"Error loading vector store: {str(e)}")
+            # Start from an empty store, so the caller can rebuild it from the CSVs
+            self.index = self._create_index("flat", None)
+            self._index_mmapped = False
+            self.jobs, self.job_ids_map = [], {}
+            self._seen, self._seen_count = set(), 0
+            with self._sync_lock:
+                self._reset_columns()
             return False
 
 # Example usage
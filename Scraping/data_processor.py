@@ -516,7 +516,7 @@ def main():
     if hasattr(vector_store, 'index') and vector_store.index:
         vector_store.index = None
         # Reinitialize the index
-        vector_store.index = faiss.IndexFlatL2(vector_store.vector_dim)
+        vector_store.index = faiss.IndexFlatIP(vector_store.vector_dim)
     
     # Add processed jobs to vector store
     log(f"Adding {len(processed_df)} processed jobs to vector store")
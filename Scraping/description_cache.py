@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class DescriptionCache:
+    """
+    Job descriptions keyed by job ID, persisted in SQLite across runs.
+
+    A small in-memory LRU of recently used descriptions sits in front of the
+    database, so memory stays bounded however many jobs are scraped. The
+    database uses WAL journaling, so several threads or processes can read it
+    while one writes.
+    """
+
+    def __init__(self, db_path: str = "job_cache.db", hot_size: int = 1024):
+        """
+        Initialize DescriptionCache.
+
+        Args:
+            db_path: SQLite database file
+            hot_size: Number of descriptions kept in memory
+        """
+        self.db_path = db_path
+        self.hot_size = hot_size
+        self._hot: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database, once per process (connections must not cross a fork)."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS desc "
+                         "(job_id TEXT PRIMARY KEY, description TEXT, ts INTEGER)")
+            self._conn, self._conn_pid = conn, os.getpid()
+            self._hot.clear()
+        return self._conn
+
+    def _remember(self, job_id: str, description: str) -> None:
+        """Put a description at the front of the in-memory LRU (lock held)."""
+        self._hot[job_id] = description
+        self._hot.move_to_end(job_id)
+        if len(self._hot) > self.hot_size:
+            self._hot.popitem(last=False)
+
+    def get(self, job_id: str) -> Optional[str]:
+        """Return the cached description of a job, or None."""
+        with self._lock:
+            conn = self._connection()
+            if job_id in self._hot:
+                self._hot.move_to_end(job_id)
+                return self._hot[job_id]
+            row = conn.execute("SELECT description FROM desc WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            self._remember(job_id, row[0])
+            return row[0]
+
+    def put(self, job_id: str, description: str) -> None:
+        """Store the description of a job."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("INSERT OR REPLACE INTO desc (job_id, description, ts) VALUES (?, ?, ?)",
+                         (job_id, description, int(time.time())))
+            conn.commit()
+            self._remember(job_id, description)
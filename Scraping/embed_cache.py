@@ -0,0 +1,99 @@
+import hashlib
+import os
+import pickle
+from typing import Dict, List
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    On-disk cache of text embeddings keyed by a hash of the embedded text.
+
+    Vectors live in a single .npy matrix that is memory-mapped on load, with
+    a pickled dict mapping each text hash to its row. New vectors are kept in
+    memory until save() appends them to the matrix.
+    """
+
+    def __init__(self, cache_dir: str, dim: int, name: str = "embeddings"):
+        """
+        Initialize EmbeddingCache.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            dim: Dimension of the cached vectors
+            name: Base filename; use one per embedding model
+        """
+        self.dim = dim
+        self.vectors_path = os.path.join(cache_dir, f"{name}.npy")
+        self.index_path = os.path.join(cache_dir, f"{name}_index.pkl")
+
+        self._index: Dict[bytes, int] = {}
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._pending: List[np.ndarray] = []
+
+        if os.path.exists(self.vectors_path) and os.path.exists(self.index_path):
+            try:
+                vectors = np.load(self.vectors_path, mmap_mode='r')
+                with open(self.index_path, 'rb') as f:
+                    index = pickle.load(f)
+                if vectors.ndim == 2 and vectors.shape[1] == dim and len(index) == len(vectors):
+                    self._vectors, self._index = vectors, index
+                else:
+                    print(f"Ignoring embedding cache at {self.vectors_path}: shape mismatch")
+            except Exception as e:
+                print(f"Error loading embedding cache: {str(e)}")
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """Cache key for a text."""
+        return hashlib.sha1(text.encode('utf-8')).digest()
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: bytes) -> np.ndarray:
+        """Return the cached vector for a key."""
+        row = self._index[key]
+        stored = len(self._vectors)
+        return self._vectors[row] if row < stored else self._pending[row - stored]
+
+    def put(self, key: bytes, vector: np.ndarray) -> None:
+        """Add a vector to the cache (kept in memory until save())."""
+        if key in self._index:
+            return
+        self._index[key] = len(self._vectors) + len(self._pending)
+        self._pending.append(np.asarray(vector, dtype=np.float32))
+
+    def save(self) -> bool:
+        """
+        Append pending vectors to the on-disk matrix.
+
+        Returns:
+            True if successful
+        """
+        if not self._pending:
+            return True
+        try:
+            vectors = np.concatenate([np.asarray(self._vectors), np.stack(self._pending)])
+            # Release the memory map before replacing the file underneath it
+            self._vectors = vectors
+
+            tmp_path = f"{self.vectors_path}.tmp.npy"
+            np.save(tmp_path, vectors)
+            os.replace(tmp_path, self.vectors_path)
+
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(self._index, f)
+            os.replace(tmp_path, self.index_path)
+
+            self._pending = []
+            return True
+
+        except Exception as e:
+            print(f"Error saving embedding cache: {str(e)}")
+            return False
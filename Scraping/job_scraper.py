@@ -5,27 +5,44 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
 from webdriver_manager.chrome import ChromeDriverManager
+import asyncio
+import aiohttp
+import lxml.etree
+import lxml.html
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
+import gzip
+import gc
+import hashlib
 import os
 import time
 import random
 import concurrent.futures
+import multiprocessing
+import multiprocessing.util
 import threading
 import queue
+import zlib
 from datetime import datetime
+from urllib.parse import urljoin
 import sys
+from description_cache import DescriptionCache
 from selenium.common.exceptions import (
     TimeoutException, 
-    NoSuchElementException, 
     WebDriverException, 
     StaleElementReferenceException
 )
 
-# Thread local storage for WebDriver instances
-thread_local = threading.local()
+# WebDriver of a Selenium worker process, created by init_worker
+_worker_driver = None
+# chromedriver binary, resolved once per process by get_chromedriver_path
+_chromedriver_path = None
 
 # Imports keywords from external file if available
 try:
+    from keywords_config import keywords_by_specialty
     print("Importing keywords from external file")
 except ImportError:
     # Fallback to internal keywords configuration
@@ -49,7 +66,7 @@ except ImportError:
 
 # Configuration
 location = "Maroc"
-output_file = "indeed_jobs_detailed.csv"
+output_file = "indeed_jobs_detailed.csv.gz"
 MAX_RETRIES = 3
 PAGE_LOAD_TIMEOUT = 25
 WAIT_BETWEEN_REQUESTS_MIN = 2
@@ -57,19 +74,67 @@ WAIT_BETWEEN_REQUESTS_MAX = 5
 CAPTCHA_CHECK_DELAY = 15  # Time to wait if a captcha is detected
 MAX_WORKERS = 3  # Number of parallel workers for scraping
 MAX_PAGES_PER_KEYWORD = 5  # Maximum number of pages to scrape per keyword
-RATE_LIMIT_PER_MINUTE = 20  # Maximum requests per minute
-MEMORY_EFFICIENT = True  # Whether to use memory-efficient mode
+RATE_LIMIT_PER_MINUTE = 20  # Maximum requests per minute (starting rate of the adaptive HTTP path)
+MEMORY_EFFICIENT = True  # Whether to free per-page objects and collect garbage while scraping
+SAVE_BATCH_SIZE = 32  # Rows written to the CSV file per batch
+SAVE_FLUSH_INTERVAL = 2  # Maximum seconds a fetched job waits before being written
+DESCRIPTION_CACHE_DB = "job_cache.db"  # SQLite file persisting fetched descriptions
+SEARCH_BASE_URL = "https://ma.indeed.com/emplois"
+RESULTS_PER_PAGE = 10  # Indeed's "start" offset step between result pages
+HTTP_CONCURRENCY = MAX_WORKERS * 10  # Maximum number of HTTP requests in flight
+GOVERNOR_INTERVAL = 30  # Seconds between adjustments of the HTTP request rate
+GOVERNOR_FAIL_LOW = 0.05  # Failure rate under which the rate may grow
+GOVERNOR_FAIL_HIGH = 0.2  # Failure rate over which the rate is halved
+GOVERNOR_RATE_STEP = 5  # Requests per minute added to the HTTP rate at each increase
+GOVERNOR_MIN_RATE = 5  # Bounds of the adaptive HTTP rate, in requests per minute
+GOVERNOR_MAX_RATE = 60
+HTTP_TIMEOUT = 25
+DESCRIPTION_WORKERS = 8  # Concurrent description fetches per keyword (threads or coroutines)
+SEARCH_QUEUE_SIZE = 64  # Parsed jobs waiting for their description, per keyword
 
-# Shared state for rate limiting
-last_requests = []
-rate_limit_lock = threading.Lock()
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15"
+]
+
+# Subresources a text scraper never needs, blocked in Chrome via the DevTools protocol
+BLOCKED_URL_PATTERNS = [
+    "*.css", "*.woff*", "*.ttf", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico", "*.mp4",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*", "*facebook*"
+]
+
+# Unions of alternative XPaths, so each check is a single query
+CAPTCHA_XPATH = ("//div[contains(text(), 'captcha')] | //iframe[contains(@src, 'captcha')]"
+                 " | //iframe[contains(@src, 'recaptcha')] | //div[contains(@class, 'captcha')]")
+DESCRIPTION_FALLBACK_XPATH = ("//*[contains(@class, 'jobsearch-jobDescriptionText')]"
+                              " | //div[contains(@class, 'description')] | //div[contains(@id, 'description')]")
+NEXT_PAGE_XPATH = "//a[@data-testid='pagination-page-next'] | //a[contains(@aria-label, 'Next')]"
+captcha_xpath = lxml.etree.XPath(CAPTCHA_XPATH)  # precompiled for parsed pages
+description_fallback_xpath = lxml.etree.XPath(DESCRIPTION_FALLBACK_XPATH)
+
+# Token bucket for rate limiting; Selenium worker processes each get a share of the limit
+rate_limit_per_minute = RATE_LIMIT_PER_MINUTE
+rate_limit_tokens = float(RATE_LIMIT_PER_MINUTE)
+rate_limit_refilled = time.monotonic()
+rate_limit_cond = threading.Condition()
 
 # Queue for job data collection
 job_data_queue = queue.Queue()
 
-# Cache for job descriptions to avoid fetching the same job multiple times
-job_description_cache = {}
-job_cache_lock = threading.Lock()
+# Cache for job descriptions to avoid fetching the same job multiple times,
+# in this run and in later ones
+description_cache = DescriptionCache(DESCRIPTION_CACHE_DB)
+
+# Pooled session shared by all description fetch threads, so TCP/TLS connections
+# are kept alive; rate limiting and transient server errors are retried with backoff
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=MAX_WORKERS,
+    pool_maxsize=max(MAX_WORKERS * 4, DESCRIPTION_WORKERS),
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
 
 def get_timestamp():
     """Get current timestamp in a readable format."""
@@ -81,22 +146,41 @@ def log_message(message, level="INFO"):
     print(f"[{timestamp}] [{level}] {message}")
 
 def check_rate_limit():
-    """Check and enforce rate limiting."""
-    with rate_limit_lock:
-        current_time = time.time()
-        # Remove requests older than 60 seconds
-        global last_requests
-        last_requests = [t for t in last_requests if current_time - t < 60]
-        
-        # Check if we've exceeded our rate limit
-        if len(last_requests) >= RATE_LIMIT_PER_MINUTE:
-            sleep_time = 60 - (current_time - last_requests[0])
-            if sleep_time > 0:
-                log_message(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds", "WARN")
-                time.sleep(sleep_time)
-        
-        # Add current request to the list
-        last_requests.append(time.time())
+    """
+    Check and enforce rate limiting.
+    
+    Takes one token from a bucket refilled at rate_limit_per_minute tokens per
+    minute. While waiting for a token the lock is released, so other threads
+    can still take tokens as they become available.
+    """
+    global rate_limit_tokens, rate_limit_refilled
+    with rate_limit_cond:
+        while True:
+            now = time.monotonic()
+            refill_rate = rate_limit_per_minute / 60
+            rate_limit_tokens = min(rate_limit_per_minute,
+                                    rate_limit_tokens + (now - rate_limit_refilled) * refill_rate)
+            rate_limit_refilled = now
+            if rate_limit_tokens >= 1:
+                rate_limit_tokens -= 1
+                return
+            
+            sleep_time = (1 - rate_limit_tokens) / refill_rate
+            log_message(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds", "WARN")
+            rate_limit_cond.wait(sleep_time)
+
+def get_chromedriver_path():
+    """
+    Resolve the chromedriver binary once and reuse it for every driver setup.
+    
+    ChromeDriverManager().install() checks the driver cache on disk (and may ask
+    the network for the latest version) on every call, so driver restarts after
+    a WebDriverException would pay for it again.
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
 
 def setup_driver():
     """Set up the Chrome driver with appropriate options."""
@@ -109,13 +193,7 @@ def setup_driver():
     options.add_argument("--disable-dev-shm-usage")
     
     # Randomize user agent
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15"
-    ]
-    options.add_argument(f"user-agent={random.choice(user_agents)}")
+    options.add_argument(f"user-agent={random.choice(USER_AGENTS)}")
     
     # Performance optimizations
     options.add_argument("--disable-extensions")
@@ -128,8 +206,8 @@ def setup_driver():
     # Enable disk cache for better performance
     options.add_argument("--disk-cache-size=50000000")  # 50MB cache
     
-    # Use eager page load strategy (faster)
-    options.page_load_strategy = 'eager'
+    # Don't wait for any load event: callers wait for the elements they need
+    options.page_load_strategy = 'none'
     
     # Disable images for faster page loads
     prefs = {
@@ -145,9 +223,13 @@ def setup_driver():
     }
     options.add_experimental_option("prefs", prefs)
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
     driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
     
+    # Stylesheets, fonts, media and trackers are not even downloaded
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
     # Stealth mode to avoid bot detection
     stealth(driver,
             languages=["fr-FR", "fr"],
@@ -159,11 +241,39 @@ def setup_driver():
     
     return driver
 
-def get_thread_driver():
-    """Get or create a thread-local WebDriver instance."""
-    if not hasattr(thread_local, "driver"):
-        thread_local.driver = setup_driver()
-    return thread_local.driver
+def init_worker(worker_count, chromedriver_path=None):
+    """
+    Initialize a Selenium worker process: start its browser and claim its
+    share of the rate limit.
+    
+    Args:
+        worker_count: Number of worker processes sharing the rate limit
+        chromedriver_path: chromedriver binary already resolved by the parent
+    """
+    global _worker_driver, _chromedriver_path, rate_limit_per_minute, rate_limit_tokens
+    _chromedriver_path = chromedriver_path
+    rate_limit_per_minute = max(1, RATE_LIMIT_PER_MINUTE // worker_count)
+    rate_limit_tokens = min(rate_limit_tokens, rate_limit_per_minute)
+    _worker_driver = setup_driver()
+    # Pool workers leave through os._exit, which skips atexit but not multiprocessing finalizers
+    multiprocessing.util.Finalize(None, quit_worker_driver, exitpriority=10)
+
+def get_worker_driver():
+    """Get the worker process's WebDriver, creating it if needed."""
+    global _worker_driver
+    if _worker_driver is None:
+        _worker_driver = setup_driver()
+    return _worker_driver
+
+def quit_worker_driver():
+    """Quit the worker process's WebDriver, if any."""
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except:
+            pass
+        _worker_driver = None
 
 def random_sleep(min_time=WAIT_BETWEEN_REQUESTS_MIN, max_time=WAIT_BETWEEN_REQUESTS_MAX):
     """Sleep for a random time to avoid detection."""
@@ -173,37 +283,32 @@ def random_sleep(min_time=WAIT_BETWEEN_REQUESTS_MIN, max_time=WAIT_BETWEEN_REQUE
 def check_for_captcha(driver):
     """Check if a captcha is present and wait if needed."""
     try:
-        captcha_indicators = [
-            "//div[contains(text(), 'captcha')]",
-            "//iframe[contains(@src, 'captcha')]",
-            "//iframe[contains(@src, 'recaptcha')]",
-            "//div[contains(@class, 'captcha')]"
-        ]
-        
-        for indicator in captcha_indicators:
-            if driver.find_elements(By.XPATH, indicator):
-                log_message("Captcha détecté! Veuillez résoudre le captcha manuellement.", "WARN")
-                log_message(f"Attente de {CAPTCHA_CHECK_DELAY} secondes...", "INFO")
-                time.sleep(CAPTCHA_CHECK_DELAY)
-                return True
+        if driver.find_elements(By.XPATH, CAPTCHA_XPATH):
+            log_message("Captcha détecté! Veuillez résoudre le captcha manuellement.", "WARN")
+            log_message(f"Attente de {CAPTCHA_CHECK_DELAY} secondes...", "INFO")
+            time.sleep(CAPTCHA_CHECK_DELAY)
+            return True
         return False
     except:
         return False
 
-def safe_find_element(driver, by, value, wait_time=10, default="Non spécifié"):
-    """Safely find an element, return default value if not found."""
-    try:
-        element = WebDriverWait(driver, wait_time).until(
-            EC.presence_of_element_located((by, value))
-        )
-        return element.text.strip()
-    except (TimeoutException, NoSuchElementException, StaleElementReferenceException):
-        return default
+def wait_for_search_results(driver, timeout=15):
+    """
+    Wait until either layout of a search result page is present (raises TimeoutException).
+    
+    Both selectors are polled by one wait, so a page in the alternative layout
+    does not first sit out the full timeout of the primary one.
+    """
+    WebDriverWait(driver, timeout).until(EC.any_of(
+        EC.presence_of_element_located((By.ID, "mosaic-provider-jobcards")),
+        EC.presence_of_element_located((By.CSS_SELECTOR, ".jobsearch-ResultsList"))
+    ))
 
 def get_job_description(driver, job_link, job_id=None):
     """Get job description from the job detail page."""
-    if job_id and job_id in job_description_cache:
-        return job_description_cache[job_id]
+    cached = description_cache.get(job_id) if job_id else None
+    if cached is not None:
+        return cached
         
     description = "Non spécifié"
     try:
@@ -219,134 +324,422 @@ def get_job_description(driver, job_link, job_id=None):
         if check_for_captcha(driver):
             return "CAPTCHA détecté - veuillez réessayer plus tard"
         
+        # One wait for the description under any of its selectors
         try:
-            description = safe_find_element(driver, By.ID, "jobDescriptionText", wait_time=10)
-        except:
-            # Try alternative selectors
-            selectors = [
-                (By.CLASS_NAME, "jobsearch-jobDescriptionText"),
-                (By.XPATH, "//div[contains(@class, 'description')]"),
-                (By.XPATH, "//div[contains(@id, 'description')]")
-            ]
-            
-            for selector_type, selector in selectors:
-                try:
-                    description_elem = driver.find_element(selector_type, selector)
-                    description = description_elem.text.strip()
-                    if description:
-                        break
-                except:
-                    continue
+            WebDriverWait(driver, 10).until(EC.any_of(
+                EC.presence_of_element_located((By.ID, "jobDescriptionText")),
+                EC.presence_of_element_located((By.XPATH, DESCRIPTION_FALLBACK_XPATH))
+            ))
+            # One page_source round-trip instead of one per selector and element
+            description = parse_job_description(driver.page_source)
+        except (TimeoutException, StaleElementReferenceException):
+            pass
         
         # Cache the result
         if job_id:
-            with job_cache_lock:
-                job_description_cache[job_id] = description
+            description_cache.put(job_id, description)
                 
     except Exception as e:
         log_message(f"Erreur lors de l'obtention de la description: {str(e)}", "ERROR")
     
     return description
 
-def extract_job_data(job, specialty, keyword):
-    """Extract data from a job listing element safely."""
-    job_data = {
-        "specialty": specialty,
-        "keyword": keyword,
-        "title": "Non spécifié",
-        "company": "Non spécifié",
-        "salary": "Non spécifié",
-        "summary": "Non spécifié",
-        "description": "Non spécifié",
-        "job_link": "Non spécifié",
-        "job_id": f"{int(time.time())}-{random.randint(1000, 9999)}"  # Generate a unique ID
-    }
+def get_search_url(keyword, page_number=1):
+    """Build the Indeed search URL for a keyword and result page."""
+    search_url = f"{SEARCH_BASE_URL}?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
+    if page_number > 1:
+        search_url += f"&start={(page_number - 1) * RESULTS_PER_PAGE}"
+    return search_url
+
+def get_job_id(job_data):
+    """
+    Stable ID of a job, so the same posting found under several keywords
+    (or in a later run) hits the description cache.
     
-    try:
-        # Use try/except for each attribute to prevent one failure from skipping the job
-        try:
-            if job.find_elements(By.TAG_NAME, "h2"):
-                job_data["title"] = job.find_element(By.TAG_NAME, "h2").text.strip()
-        except (StaleElementReferenceException, NoSuchElementException):
-            pass
+    Indeed's "jk" job key is used when the link has one; otherwise the link,
+    or for jobs without a link the title and company, are hashed.
+    """
+    job_link = job_data["job_link"]
+    if "jk=" in job_link:
+        return job_link.split("jk=")[1].split("&")[0]
+    if job_link == "Non spécifié":
+        job_link = f"{job_data['title']}\0{job_data['company']}"
+    return hashlib.blake2b(job_link.encode("utf-8"), digest_size=12).hexdigest()
+
+def element_text(root, selector):
+    """Whitespace-normalized text of the first element matching a CSS selector, or None."""
+    elements = root.cssselect(selector)
+    if not elements:
+        return None
+    return " ".join(elements[0].text_content().split()) or None
+
+def as_tree(page):
+    """Parse page HTML, or return it unchanged if it is already a parsed lxml tree."""
+    return lxml.html.fromstring(page) if isinstance(page, str) else page
+
+def is_captcha_page(tree):
+    """Check a parsed page for the same captcha markers as check_for_captcha."""
+    return bool(captcha_xpath(tree))
+
+def parse_search_page(page, specialty, keyword):
+    """
+    Extract the job cards of a search result page (HTML or parsed tree).
+    
+    Returns:
+        (jobs_data, next_page_url): one dictionary per job card that has a title,
+        and the absolute URL of the next result page (None on the last page)
+    """
+    tree = as_tree(page)
+    cards = tree.cssselect("div.job_seen_beacon") or tree.cssselect(".jobsearch-ResultsList > li")
+    
+    jobs_data = []
+    for card in cards:
+        job_data = {
+            "specialty": specialty,
+            "keyword": keyword,
+            "title": element_text(card, "h2") or "Non spécifié",
+            "company": element_text(card, "[data-testid='company-name']") or "Non spécifié",
+            "salary": element_text(card, ".salary-snippet-container") or "Non spécifié",
+            "summary": element_text(card, ".job-snippet") or "Non spécifié",
+            "description": "Non spécifié",
+            "job_link": "Non spécifié"
+        }
         
-        try:
-            if job.find_elements(By.CSS_SELECTOR, "[data-testid='company-name']"):
-                job_data["company"] = job.find_element(By.CSS_SELECTOR, "[data-testid='company-name']").text.strip()
-        except (StaleElementReferenceException, NoSuchElementException):
-            pass
+        links = card.cssselect("a[href]")
+        if links:
+            job_data["job_link"] = urljoin(SEARCH_BASE_URL, links[0].get("href"))
+        job_data["job_id"] = get_job_id(job_data)
         
-        try:
-            if job.find_elements(By.CLASS_NAME, "salary-snippet-container"):
-                job_data["salary"] = job.find_element(By.CLASS_NAME, "salary-snippet-container").text.strip()
-        except (StaleElementReferenceException, NoSuchElementException):
-            pass
-            
-        try:
-            if job.find_elements(By.CLASS_NAME, "job-snippet"):
-                job_data["summary"] = job.find_element(By.CLASS_NAME, "job-snippet").text.strip()
-        except (StaleElementReferenceException, NoSuchElementException):
-            pass
+        if job_data["title"] != "Non spécifié":
+            jobs_data.append(job_data)
+    
+    next_links = (tree.cssselect("a[data-testid='pagination-page-next']")
+                  or tree.xpath("//a[contains(@aria-label, 'Next')]"))
+    next_page_url = None
+    if next_links and next_links[0].get("href"):
+        next_page_url = urljoin(SEARCH_BASE_URL, next_links[0].get("href"))
+    return jobs_data, next_page_url
+
+def parse_job_description(page):
+    """Extract the description text of a job detail page (HTML or parsed tree)."""
+    tree = as_tree(page)
+    elements = tree.cssselect("#jobDescriptionText") or description_fallback_xpath(tree)
+    for element in elements:
+        lines = (line.strip() for line in element.itertext())
+        description = "\n".join(line for line in lines if line)
+        if description:
+            return description
+    return "Non spécifié"
+
+class AsyncRateLimiter:
+    """
+    Token bucket for the HTTP path, refilled at rate_per_minute tokens per minute.
+    
+    Coroutines wait for a token with asyncio.sleep, so no thread is held while
+    they wait (check_rate_limit would block a thread of the default executor,
+    which aiohttp also needs for DNS resolution). The lock is fair, so tokens
+    are handed out in the order they were asked for.
+    """
+    
+    def __init__(self, rate_per_minute):
+        """
+        Initialize AsyncRateLimiter.
         
-        try:
-            if job.find_elements(By.CSS_SELECTOR, "a"):
-                job_data["job_link"] = job.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-                
-                # Try to extract job ID from URL
-                try:
-                    if "jk=" in job_data["job_link"]:
-                        job_id = job_data["job_link"].split("jk=")[1].split("&")[0]
-                        job_data["job_id"] = job_id
-                except:
-                    pass
-        except (StaleElementReferenceException, NoSuchElementException):
-            pass
+        Args:
+            rate_per_minute: Requests allowed per minute
+        """
+        self.rate_per_minute = rate_per_minute
+        self.tokens = float(rate_per_minute)
+        self.refilled = time.monotonic()
+        self.throttled = False  # whether a request had to wait for a token
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for a token and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill_rate = self.rate_per_minute / 60
+                self.tokens = min(self.rate_per_minute, self.tokens + (now - self.refilled) * refill_rate)
+                self.refilled = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                self.throttled = True
+                await asyncio.sleep((1 - self.tokens) / refill_rate)
+
+class RequestGovernor:
+    """
+    Throttle for HTTP requests whose rate adapts to how Indeed responds.
+    
+    Each request takes a token from the rate limiter, then one of max_in_flight
+    slots. The rate is what binds, so that is what adapts: every
+    GOVERNOR_INTERVAL seconds the failure rate (refused requests, captchas,
+    timeouts) of the last interval is checked. The rate grows by
+    GOVERNOR_RATE_STEP requests per minute if requests had to wait for a token
+    and almost none failed, and is halved if too many failed, so a healthy
+    server gets more requests and a blocking one quickly gets fewer.
+    """
+    
+    def __init__(self, max_in_flight, rate_limiter):
+        """
+        Initialize RequestGovernor.
+        
+        Args:
+            max_in_flight: Maximum number of requests in flight
+            rate_limiter: AsyncRateLimiter whose rate is adjusted
+        """
+        self.rate_limiter = rate_limiter
+        self.success = 0
+        self.fail = 0
+        self.window_start = time.monotonic()
+        self._slots = asyncio.Semaphore(max_in_flight)
+    
+    async def __aenter__(self):
+        await self.rate_limiter.acquire()
+        await self._slots.acquire()
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._slots.release()
+    
+    def record(self, ok):
+        """Count the outcome of a request and adjust the rate once per interval."""
+        if ok:
+            self.success += 1
+        else:
+            self.fail += 1
+        
+        now = time.monotonic()
+        if now - self.window_start < GOVERNOR_INTERVAL:
+            return
+        limiter = self.rate_limiter
+        fail_rate = self.fail / (self.success + self.fail)
+        if fail_rate > GOVERNOR_FAIL_HIGH and limiter.rate_per_minute > GOVERNOR_MIN_RATE:
+            limiter.rate_per_minute = max(GOVERNOR_MIN_RATE, limiter.rate_per_minute // 2)
+            log_message(f"Taux d'échec {fail_rate:.0%}: {limiter.rate_per_minute} requêtes HTTP par minute", "WARN")
+        elif fail_rate < GOVERNOR_FAIL_LOW and limiter.throttled and limiter.rate_per_minute < GOVERNOR_MAX_RATE:
+            limiter.rate_per_minute = min(GOVERNOR_MAX_RATE, limiter.rate_per_minute + GOVERNOR_RATE_STEP)
+            log_message(f"Taux d'échec {fail_rate:.0%}: {limiter.rate_per_minute} requêtes HTTP par minute", "INFO")
+        self.success = self.fail = 0
+        limiter.throttled = False
+        self.window_start = now
+
+async def fetch_html(session, semaphore, url):
+    """
+    Fetch a page over plain HTTP.
+    
+    Returns:
+        The parsed page, or None if Indeed refused the request or answered with a captcha
+    """
+    try:
+        async with semaphore:
+            async with session.get(url, headers={"User-Agent": random.choice(USER_AGENTS)}) as response:
+                if response.status != 200:
+                    log_message(f"HTTP {response.status} pour {url}", "WARN")
+                    semaphore.record(False)
+                    return None
+                html = await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log_message(f"Erreur HTTP pour {url}: {str(e)}", "ERROR")
+        semaphore.record(False)
+        return None
+    
+    # Parsed once here; callers extract jobs or descriptions from the same tree
+    tree = lxml.html.fromstring(html)
+    if is_captcha_page(tree):
+        log_message(f"Captcha détecté pour {url}", "WARN")
+        semaphore.record(False)
+        return None
+    semaphore.record(True)
+    return tree
+
+async def fetch_search(session, semaphore, keyword, page_number):
+    """Fetch and parse one Indeed search result page, or None if blocked."""
+    return await fetch_html(session, semaphore, get_search_url(keyword, page_number))
+
+async def fetch_description(session, semaphore, job_link, job_id=None):
+    """Fetch and extract a job description over HTTP, using the description cache."""
+    cached = description_cache.get(job_id) if job_id else None
+    if cached is not None:
+        return cached
+    
+    tree = await fetch_html(session, semaphore, job_link)
+    if tree is None:
+        return "CAPTCHA détecté - veuillez réessayer plus tard"
+    
+    description = parse_job_description(tree)
+    if job_id:
+        description_cache.put(job_id, description)
+    return description
+
+def rows_for_specialties(job_data, specialties):
+    """One copy of a job per specialty its keyword belongs to."""
+    if len(specialties) == 1:
+        return [job_data]
+    return [dict(job_data, specialty=specialty) for specialty in specialties]
+
+async def scrape_keyword_http(session, semaphore, specialties, keyword):
+    """
+    Scrape jobs for a keyword with plain HTTP requests instead of a browser.
+    
+    A producer paginates the search results and queues each job as soon as its
+    page is parsed, while DESCRIPTION_WORKERS consumers fetch the descriptions,
+    so the next search page is fetched while the previous page's descriptions
+    are still downloading. A keyword shared by several specialties is scraped
+    once, and each job is saved once per specialty.
     
+    Returns:
+        The jobs found, or None if the first search page was blocked and the
+        keyword should be scraped with Selenium instead
+    """
+    log_message(f"Scraping HTTP pour '{keyword}' ({', '.join(specialties)})", "INFO")
+    search_queue = asyncio.Queue(maxsize=SEARCH_QUEUE_SIZE)
+    job_listings = []
+    first_page_blocked = False
+    
+    async def produce():
+        nonlocal first_page_blocked
+        for page_number in range(1, MAX_PAGES_PER_KEYWORD + 1):
+            tree = await fetch_search(session, semaphore, keyword, page_number)
+            if tree is None:
+                first_page_blocked = page_number == 1
+                return
+            
+            jobs_data, next_page_url = parse_search_page(tree, specialties[0], keyword)
+            if not jobs_data:
+                log_message("Aucune offre trouvée sur cette page.", "WARN")
+                return
+            log_message(f"'{keyword}' page {page_number}: {len(jobs_data)} offres", "INFO")
+            
+            for job_data in jobs_data:
+                await search_queue.put(job_data)
+            if not next_page_url:
+                return
+    
+    async def consume():
+        while True:
+            job_data = await search_queue.get()
+            try:
+                if job_data["job_link"] != "Non spécifié":
+                    job_data["description"] = await fetch_description(
+                        session, semaphore, job_data["job_link"], job_data["job_id"])
+                for row in rows_for_specialties(job_data, specialties):
+                    job_data_queue.put(row)
+                    job_listings.append(row)
+            except Exception as e:
+                log_message(f"Erreur lors du traitement d'une offre: {str(e)}", "ERROR")
+            finally:
+                search_queue.task_done()
+    
+    consumers = [asyncio.create_task(consume()) for _ in range(DESCRIPTION_WORKERS)]
+    try:
+        await produce()
+        await search_queue.join()
+    finally:
+        for consumer in consumers:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+    
+    if first_page_blocked:
+        return None
+    log_message(f"Terminé pour '{keyword}' - {len(job_listings)} offres trouvées", "INFO")
+    return job_listings
+
+async def scrape_keywords_http(tasks):
+    """
+    Scrape all (specialties, keyword) tasks concurrently over HTTP.
+    
+    Returns:
+        Dictionary mapping each task to its jobs (None if it was blocked)
+    """
+    # Starts at the configured rate and grows while Indeed answers normally
+    semaphore = RequestGovernor(HTTP_CONCURRENCY, AsyncRateLimiter(rate_limit_per_minute))
+    connector = aiohttp.TCPConnector(limit=HTTP_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT)
+    headers = {"Accept-Language": "fr-FR,fr;q=0.9"}
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        results = await asyncio.gather(*[
+            scrape_keyword_http(session, semaphore, specialties, keyword) for specialties, keyword in tasks
+        ], return_exceptions=True)
+    
+    task_jobs = {}
+    for (specialties, keyword), jobs in zip(tasks, results):
+        if isinstance(jobs, Exception):
+            log_message(f"Erreur HTTP pour le mot-clé '{keyword}': {str(jobs)}", "ERROR")
+            jobs = None
+        task_jobs[(specialties, keyword)] = jobs
+    return task_jobs
+
+def fetch_description_http(job_link, job_id=None):
+    """
+    Fetch and extract a job description with requests instead of the browser.
+    
+    Returns:
+        The description, or None if Indeed refused the request or answered with a captcha
+    """
+    cached = description_cache.get(job_id) if job_id else None
+    if cached is not None:
+        return cached
+    
+    check_rate_limit()
+    try:
+        response = http_session.get(job_link, headers={"User-Agent": random.choice(USER_AGENTS)},
+                                    timeout=HTTP_TIMEOUT)
+        if response.status_code != 200:
+            return None
+        tree = lxml.html.fromstring(response.text)
+        if is_captcha_page(tree):
+            return None
+        description = parse_job_description(tree)
     except Exception as e:
-        log_message(f"Erreur lors de l'extraction des données: {str(e)}", "ERROR")
+        log_message(f"Erreur HTTP pour {job_link}: {str(e)}", "ERROR")
+        return None
     
-    return job_data
+    if job_id:
+        description_cache.put(job_id, description)
+    return description
 
 def process_job_listings(jobs_data, driver, specialty, keyword):
-    """Process job listings to get detailed information."""
+    """
+    Process job listings to get detailed information.
+    
+    The descriptions of the whole page are fetched concurrently over HTTP, so the
+    browser stays on the result page. Only descriptions refused over HTTP are
+    loaded in the browser, which does not navigate back afterwards.
+    
+    Returns:
+        (results, left_results_page), where left_results_page tells whether the
+        browser is now on a job detail page
+    """
     results = []
     total = len(jobs_data)
+    with_links = [job_data for job_data in jobs_data if job_data.get("job_link") != "Non spécifié"]
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DESCRIPTION_WORKERS) as executor:
+        descriptions = list(executor.map(fetch_description_http,
+                                         [job_data["job_link"] for job_data in with_links],
+                                         [job_data.get("job_id") for job_data in with_links]))
+    
+    left_results_page = False
+    for job_data, description in zip(with_links, descriptions):
+        if description is None:
+            # Refused over HTTP: load it in the browser instead
+            left_results_page = True
+            description = get_job_description(driver, job_data["job_link"], job_data.get("job_id"))
+        job_data["description"] = description
     
     for i, job_data in enumerate(jobs_data):
-        try:
-            log_message(f"Traitement de l'offre {i+1}/{total}: {job_data.get('title')} | {job_data.get('company')}", "INFO")
-            
-            if job_data.get("job_link") != "Non spécifié":
-                current_url = driver.current_url
-                job_data["description"] = get_job_description(
-                    driver, 
-                    job_data["job_link"], 
-                    job_data.get("job_id")
-                )
-                
-                # Go back to search results only if needed
-                if i < total - 1:  # Don't navigate back for the last job
-                    driver.get(current_url)
-                    random_sleep(1, 2)  # Shorter wait between job details
-            
-            results.append(job_data)
-            
-            # Add to the global queue for progressive saving
-            job_data_queue.put(job_data)
-            
-        except Exception as e:
-            log_message(f"Erreur lors du traitement d'une offre: {str(e)}", "ERROR")
-            continue
+        log_message(f"Traitement de l'offre {i+1}/{total}: {job_data.get('title')} | {job_data.get('company')}", "INFO")
+        results.append(job_data)
     
-    return results
+    return results, left_results_page
 
 def scrape_jobs_for_keyword(specialty, keyword):
     """Scrape jobs for a given keyword and specialty."""
     log_message(f"Scraping pour '{keyword}' ({specialty})", "INFO")
-    driver = get_thread_driver()
+    driver = get_worker_driver()
     
-    base_url = "https://ma.indeed.com/emplois"
-    search_url = f"{base_url}?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
+    search_url = get_search_url(keyword)
     job_listings = []
     retry_count = 0
     
@@ -374,62 +767,45 @@ def scrape_jobs_for_keyword(specialty, keyword):
                     
                     # Wait for job cards to load
                     try:
-                        WebDriverWait(driver, 15).until(
-                            EC.presence_of_element_located((By.ID, "mosaic-provider-jobcards"))
-                        )
+                        wait_for_search_results(driver)
                     except TimeoutException:
-                        # Try alternative element
-                        try:
-                            WebDriverWait(driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, ".jobsearch-ResultsList"))
-                            )
-                        except TimeoutException:
-                            log_message("Timeout en attendant les résultats de recherche.", "WARN")
-                            break
+                        log_message("Timeout en attendant les résultats de recherche.", "WARN")
+                        break
                     
-                    # Get all job listings at once
-                    jobs = driver.find_elements(By.CLASS_NAME, "job_seen_beacon")
-                    if not jobs:
-                        # Try alternative selectors
-                        jobs = driver.find_elements(By.CSS_SELECTOR, ".jobsearch-ResultsList > li")
+                    # Parse the whole result list from one page_source snapshot
+                    # instead of querying every field of every card over WebDriver
+                    jobs_data, next_page_url = parse_search_page(driver.page_source, specialty, keyword)
                     
-                    if not jobs:
+                    if not jobs_data:
                         log_message("Aucune offre trouvée sur cette page.", "WARN")
                         break
                     
-                    log_message(f"Trouvé {len(jobs)} offres sur cette page", "INFO")
-                    
-                    # First extract all job data without visiting detail pages
-                    jobs_data = []
-                    for job in jobs:
-                        try:
-                            job_data = extract_job_data(job, specialty, keyword)
-                            if job_data.get("title") != "Non spécifié":
-                                jobs_data.append(job_data)
-                        except StaleElementReferenceException:
-                            log_message("Élément périmé, passe au suivant", "WARN")
-                            continue
-                        except Exception as e:
-                            log_message(f"Erreur sur une offre: {str(e)}", "ERROR")
-                            continue
+                    log_message(f"Trouvé {len(jobs_data)} offres sur cette page", "INFO")
                     
                     # Process job details
-                    processed_jobs = process_job_listings(jobs_data, driver, specialty, keyword)
+                    processed_jobs, left_results_page = process_job_listings(jobs_data, driver, specialty, keyword)
                     job_listings.extend(processed_jobs)
                     
-                    # Memory optimization: clear the page DOM if needed
-                    if MEMORY_EFFICIENT and page_number < MAX_PAGES_PER_KEYWORD:
-                        driver.execute_script("document.body.innerHTML = '';")
+                    # Memory optimization: the browser drops the old DOM on navigation by
+                    # itself; what piles up is this process's per-page objects
+                    jobs_data = processed_jobs = None
+                    if MEMORY_EFFICIENT and page_number % 5 == 0:
+                        gc.collect()
                     
                     # Check if we should go to the next page
-                    if page_number < MAX_PAGES_PER_KEYWORD:
+                    if page_number < MAX_PAGES_PER_KEYWORD and left_results_page:
+                        # The browser is on a detail page: rather than going back to
+                        # click "next", load the next result page directly
+                        if not next_page_url:
+                            log_message("Dernière page atteinte.", "INFO")
+                            break
+                        driver.get(next_page_url)
+                        random_sleep(2, 4)
+                    elif page_number < MAX_PAGES_PER_KEYWORD:
                         # Try to go to next page
                         try:
-                            next_buttons = driver.find_elements(By.CSS_SELECTOR, "a[data-testid='pagination-page-next']")
-                            if not next_buttons:
-                                # Try alternative selector
-                                next_buttons = driver.find_elements(By.XPATH, "//a[contains(@aria-label, 'Next')]")
-                            
+                            # Both selectors in one query
+                            next_buttons = driver.find_elements(By.XPATH, NEXT_PAGE_XPATH)
                             if not next_buttons:
                                 log_message("Dernière page atteinte.", "INFO")
                                 break
@@ -438,6 +814,8 @@ def scrape_jobs_for_keyword(specialty, keyword):
                             driver.execute_script("arguments[0].scrollIntoView(true);", next_btn)
                             random_sleep(1, 2)
                             driver.execute_script("arguments[0].click();", next_btn)
+                            # Without a load event to wait for, wait until the old page is gone
+                            WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(EC.staleness_of(next_btn))
                             random_sleep(2, 4)  # Shorter wait for page transition
                         except Exception as e:
                             log_message(f"Dernière page atteinte ou erreur de navigation: {str(e)}", "WARN")
@@ -470,12 +848,8 @@ def scrape_jobs_for_keyword(specialty, keyword):
                 return job_listings
             
             log_message("Réinitialisation du WebDriver et nouvelle tentative...", "INFO")
-            try:
-                driver.quit()
-            except:
-                pass
-            thread_local.driver = setup_driver()
-            driver = thread_local.driver
+            quit_worker_driver()
+            driver = get_worker_driver()
             random_sleep(5, 10)  # Shorter wait before retry
             
         except Exception as e:
@@ -488,72 +862,134 @@ def scrape_jobs_for_keyword(specialty, keyword):
     log_message(f"Terminé pour '{keyword}' - {len(job_listings)} offres trouvées", "INFO")
     return job_listings
 
+def output_has_rows():
+    """
+    Check whether the output file already holds rows (and thus a header).
+    
+    The whole file is decompressed: a run killed before closing its gzip member
+    leaves a stream with no end marker, and anything appended after it would be
+    unreadable. Such a file is moved aside and a new one started.
+    """
+    if not os.path.isfile(output_file):
+        return False
+    has_rows = False
+    try:
+        with gzip.open(output_file, "rb") as existing:
+            # Read in chunks, the file can be large
+            while existing.read(1 << 20):
+                has_rows = True
+        return has_rows
+    except (EOFError, OSError, zlib.error) as e:
+        damaged_file = f"{output_file}.damaged-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        os.replace(output_file, damaged_file)
+        log_message(f"Fichier '{output_file}' tronqué ({e}), déplacé vers '{damaged_file}'", "WARN")
+        return False
+
 def save_jobs_worker():
-    """Worker thread to save jobs from the queue to CSV file."""
-    first_save = not os.path.isfile(output_file)
+    """
+    Worker thread to save jobs from the queue to the gzipped CSV file.
+    
+    The file stays open for the whole run and rows are written in batches of
+    SAVE_BATCH_SIZE, or after SAVE_FLUSH_INTERVAL seconds, whichever comes first.
+    Jobs are marked done in the queue once their batch has been written. Each
+    run appends a new gzip member, which gzip readers (and pandas) read as one
+    continuous file.
+    """
+    fieldnames = ["specialty", "keyword", "title", "company", "salary", "summary", "description"]
+    batch = []
     
     try:
-        while True:
-            # Try to get a job from the queue with a timeout
-            try:
-                job_data = job_data_queue.get(timeout=1)
-            except queue.Empty:
-                # No jobs available, check if program is shutting down
-                if getattr(threading.current_thread(), "stop_flag", False):
-                    break
-                continue
+        # A gzip file is never empty on disk, even without any row in it
+        first_save = not output_has_rows()
+        # Fast compression level: CPU cost is negligible next to network waits
+        with gzip.open(output_file, "at", newline="", encoding="utf-8", compresslevel=1) as f:
+            # 'job_id' and 'job_link' are not saved
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            last_flush = time.monotonic()
             
-            try:
-                with open(output_file, "a", newline="", encoding="utf-8") as f:
-                    fieldnames = ["specialty", "keyword", "title", "company", "salary", "summary", "description"]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    
-                    if first_save:
-                        writer.writeheader()
-                        first_save = False
-                    
-                    # Remove 'job_id' and 'job_link' from data before saving
-                    save_data = {k: v for k, v in job_data.items() if k in fieldnames}
-                    writer.writerow(save_data)
-            except Exception as e:
-                log_message(f"Erreur lors de l'écriture dans le fichier CSV: {str(e)}", "ERROR")
-            finally:
-                job_data_queue.task_done()
+            while True:
+                # Try to get a job from the queue with a timeout
+                try:
+                    batch.append(job_data_queue.get(timeout=1))
+                except queue.Empty:
+                    pass
+                stopping = getattr(threading.current_thread(), "stop_flag", False)
+                
+                if batch and (stopping or len(batch) >= SAVE_BATCH_SIZE
+                              or time.monotonic() - last_flush >= SAVE_FLUSH_INTERVAL):
+                    try:
+                        if first_save:
+                            writer.writeheader()
+                            first_save = False
+                        writer.writerows(batch)
+                        f.flush()
+                    except Exception as e:
+                        log_message(f"Erreur lors de l'écriture dans le fichier CSV: {str(e)}", "ERROR")
+                    finally:
+                        for _ in batch:
+                            job_data_queue.task_done()
+                        batch = []
+                        last_flush = time.monotonic()
+                
+                # Shut down once the program is stopping and the queue is drained
+                if stopping and not batch and job_data_queue.empty():
+                    break
     except Exception as e:
         log_message(f"Erreur dans le thread de sauvegarde: {str(e)}", "ERROR")
 
-def scrape_with_pool(specialty, keywords):
-    """Scrape jobs using a thread pool for better performance."""
-    results = []
+def scrape_with_pool(tasks):
+    """
+    Scrape jobs for all (specialties, keyword) tasks of the run.
+    
+    Tasks are first scraped concurrently over plain HTTP; only those whose
+    search pages are blocked (captcha or refused request) fall back to a pool
+    of processes, each driving its own Selenium browser. The pool is created
+    once for the whole run, so each browser is started once and reused for
+    every task it picks up. Selenium jobs are copied for each of the keyword's
+    specialties and queued for saving here, in the parent process.
+    
+    Yields:
+        (specialties, keyword, jobs) for each task, as soon as it is finished
+    """
+    blocked = []
+    for (specialties, keyword), jobs in asyncio.run(scrape_keywords_http(tasks)).items():
+        if jobs is None:
+            blocked.append((specialties, keyword))
+        else:
+            yield specialties, keyword, jobs
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    if not blocked:
+        return
+    log_message(f"Recherche HTTP bloquée pour {len(blocked)} mot(s)-clé(s), passage à Selenium", "WARN")
+    
+    # Spawned (not forked) so workers don't inherit the parent's threads and locks
+    with concurrent.futures.ProcessPoolExecutor(max_workers=MAX_WORKERS,
+                                                mp_context=multiprocessing.get_context("spawn"),
+                                                initializer=init_worker,
+                                                initargs=(MAX_WORKERS, get_chromedriver_path())) as executor:
         # Create a dictionary of futures to specialty/keyword pairs
-        future_to_keyword = {
-            executor.submit(scrape_jobs_for_keyword, specialty, keyword): keyword
-            for keyword in keywords
+        future_to_task = {
+            executor.submit(scrape_jobs_for_keyword, specialties[0], keyword): (specialties, keyword)
+            for specialties, keyword in blocked
         }
         
-        for future in concurrent.futures.as_completed(future_to_keyword):
-            keyword = future_to_keyword[future]
+        for future in concurrent.futures.as_completed(future_to_task):
+            specialties, keyword = future_to_task[future]
             try:
-                jobs = future.result()
-                results.extend(jobs)
-                log_message(f"Terminé: {keyword} - {len(jobs)} offres", "INFO")
+                jobs = [row for job_data in future.result()
+                        for row in rows_for_specialties(job_data, specialties)]
+                for job_data in jobs:
+                    job_data_queue.put(job_data)
             except Exception as e:
                 log_message(f"Erreur pour le mot-clé '{keyword}': {str(e)}", "ERROR")
-    
-    return results
+                continue
+            yield specialties, keyword, jobs
 
 def cleanup_resources():
-    """Clean up all WebDriver instances and resources."""
-    # Close all WebDriver instances
-    for thread in threading.enumerate():
-        if hasattr(thread, '_target') and thread._target == scrape_jobs_for_keyword:
-            if hasattr(thread_local, "driver"):
-                try:
-                    thread_local.driver.quit()
-                except:
-                    pass
+    """Clean up WebDriver instances and resources."""
+    # Worker processes quit their own browsers on exit; this covers a driver
+    # created in the current process
+    quit_worker_driver()
 
 def main():
     """Main function to run the scraper."""
@@ -568,26 +1004,32 @@ def main():
     all_jobs = []
     
     try:
-        # Process specialties one by one
+        # All keywords of all specialties are scheduled at once, so the browsers
+        # (if needed) are started once for the whole run; pacing between
+        # requests is left to the rate limiter. A keyword listed under several
+        # specialties is searched once and its jobs saved under each of them.
+        keyword_specialties = {}
         for specialty, keywords in keywords_by_specialty.items():
-            log_message(f"Traitement de la spécialité: {specialty}", "INFO")
-            
-            # Use thread pool to scrape jobs for each keyword in parallel
-            specialty_jobs = scrape_with_pool(specialty, keywords)
-            all_jobs.extend(specialty_jobs)
-            
-            log_message(f"Spécialité {specialty} terminée. {len(specialty_jobs)} offres trouvées.", "INFO")
-            
-            # Add longer pause between specialties
-            pause_time = random.uniform(5, 10)
-            log_message(f"Pause de {pause_time:.1f} secondes avant la prochaine spécialité...", "INFO")
-            time.sleep(pause_time)
+            for keyword in keywords:
+                specialties = keyword_specialties.setdefault(keyword, [])
+                if specialty not in specialties:
+                    specialties.append(specialty)
+        tasks = [(tuple(specialties), keyword) for keyword, specialties in keyword_specialties.items()]
+        log_message(f"{len(tasks)} mots-clés distincts dans {len(keywords_by_specialty)} spécialités", "INFO")
         
-        # Signal the save thread to stop and wait for queue to be empty
+        # Results are consumed as each keyword finishes, not once all are done
+        specialty_counts = {}
+        for done, (specialties, keyword, jobs) in enumerate(scrape_with_pool(tasks), 1):
+            all_jobs.extend(jobs)
+            for job_data in jobs:
+                specialty_counts[job_data["specialty"]] = specialty_counts.get(job_data["specialty"], 0) + 1
+            log_message(f"Terminé ({done}/{len(tasks)}): {keyword} - {len(jobs)} offres", "INFO")
+        for specialty in keywords_by_specialty:
+            log_message(f"Spécialité {specialty} terminée. {specialty_counts.get(specialty, 0)} offres trouvées.", "INFO")
+        
+        # Wait for the queue to be empty (the save thread is stopped below)
         log_message("Attente de la fin des sauvegardes...", "INFO")
         job_data_queue.join()
-        setattr(save_thread, "stop_flag", True)
-        save_thread.join(timeout=10)
         
         # Final summary
         duration = time.time() - start_time
@@ -600,6 +1042,11 @@ def main():
         log_message(f"Erreur dans le processus principal: {str(e)}", "ERROR")
         
     finally:
+        # Stop the save thread on every path, so it closes the gzip member;
+        # the daemon thread would otherwise die with the file left truncated
+        setattr(save_thread, "stop_flag", True)
+        save_thread.join(timeout=10)
+        
         # Clean up resources
         cleanup_resources()
 
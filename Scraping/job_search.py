@@ -4,8 +4,9 @@ Job Search CLI - Query the vector database for job listings
 """
 
 import argparse
+import heapq
+import operator
 import sys
-from adzuna_vector_store import JobVectorStore
 
 def setup_argparse():
     """Setup command line argument parsing."""
@@ -45,16 +46,18 @@ def setup_argparse():
     
     return parser.parse_args()
 
-def display_job(job, full=False):
-    """Display a job with appropriate formatting."""
+def format_job(job, full=False):
+    """Format a job for display, as a list of output lines."""
     title = job.get('title', 'Untitled')
     company = job.get('company', 'Unknown Company')
     location = job.get('location', 'Location not specified')
     score = job.get('similarity_score', 0)
     
-    print(f"\n{title} at {company}")
-    print(f"Location: {location}")
-    print(f"Similarity Score: {score:.2f}")
+    lines = [
+        f"\n{title} at {company}",
+        f"Location: {location}",
+        f"Similarity Score: {score:.2f}",
+    ]
     
     # Add tags
     tags = []
@@ -63,34 +66,43 @@ def display_job(job, full=False):
     if job.get('international', False):
         tags.append("INTERNATIONAL")
     if tags:
-        print(f"Tags: {', '.join(tags)}")
+        lines.append(f"Tags: {', '.join(tags)}")
     
     # Show specialty and source if available
     if 'specialty' in job and job['specialty']:
-        print(f"Specialty: {job['specialty']}")
+        lines.append(f"Specialty: {job['specialty']}")
     if 'source_country' in job and job['source_country']:
-        print(f"Source: {job['source_country'].upper()}")
+        lines.append(f"Source: {job['source_country'].upper()}")
     
     # Show full details if requested
     if full:
         if 'salary_min' in job and job['salary_min']:
-            print(f"Salary Range: {job['salary_min']} - {job['salary_max']}")
+            lines.append(f"Salary Range: {job['salary_min']} - {job['salary_max']}")
         if 'description' in job and job['description']:
-            print("\nDescription:")
-            print("------------")
+            lines.append("\nDescription:")
+            lines.append("------------")
             description = job['description']
             # Truncate long descriptions
             if len(description) > 500:
                 description = description[:500] + "..."
-            print(description)
+            lines.append(description)
         if 'redirect_url' in job and job['redirect_url']:
-            print(f"\nURL: {job['redirect_url']}")
+            lines.append(f"\nURL: {job['redirect_url']}")
     
-    print("-" * 50)
+    lines.append("-" * 50)
+    return lines
+
+def display_jobs(jobs, full=False):
+    """Display jobs with appropriate formatting, in a single write."""
+    lines = [line for job in jobs for line in format_job(job, full)]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     args = setup_argparse()
     
+    # Imported after parsing, so --help and usage errors don't load numpy/pandas/faiss
+    from adzuna_vector_store import JobVectorStore
+    
     # Initialize vector store
     try:
         vector_store = JobVectorStore(
@@ -111,20 +123,21 @@ def main():
     # Show stats if requested
     if args.stats:
         stats = vector_store.get_job_statistics()
+        total = max(1, stats['total_jobs'])
         print("\n=== JOB STATISTICS ===")
         print(f"Total jobs: {stats['total_jobs']}")
-        print(f"Remote jobs: {stats['remote_jobs']} ({stats['remote_jobs']/max(1, stats['total_jobs'])*100:.1f}%)")
-        print(f"International jobs: {stats['international_jobs']} ({stats['international_jobs']/max(1, stats['total_jobs'])*100:.1f}%)")
+        print(f"Remote jobs: {stats['remote_jobs']} ({stats['remote_jobs']/total*100:.1f}%)")
+        print(f"International jobs: {stats['international_jobs']} ({stats['international_jobs']/total*100:.1f}%)")
         
         if 'specialties' in stats and stats['specialties']:
             print("\nTop Specialties:")
-            for specialty, count in sorted(stats['specialties'].items(), key=lambda x: x[1], reverse=True)[:5]:
+            for specialty, count in heapq.nlargest(5, stats['specialties'].items(), key=operator.itemgetter(1)):
                 if specialty:
                     print(f"  {specialty}: {count} jobs")
         
         if 'countries' in stats and stats['countries']:
             print("\nJobs by Source Country:")
-            for country, count in sorted(stats['countries'].items(), key=lambda x: x[1], reverse=True):
+            for country, count in sorted(stats['countries'].items(), key=operator.itemgetter(1), reverse=True):
                 if country:
                     print(f"  {country.upper()}: {count} jobs")
         
@@ -161,8 +174,7 @@ def main():
     # Display results
     if results:
         print(f"\nFound {len(results)} matching jobs:")
-        for job in results:
-            display_job(job, args.full)
+        display_jobs(results, args.full)
     elif args.query or args.keywords:
         print("No matching jobs found.")
 
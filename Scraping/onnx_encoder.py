@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+ONNX Runtime sentence encoder for the job vector store.
+
+Running this module exports a sentence-transformer model to ONNX and writes an
+int8 dynamically-quantized copy next to it; OnnxSentenceEncoder then serves
+that model on CPU as a drop-in replacement for SentenceTransformer.encode.
+
+Export requirements: pip install "optimum[onnxruntime]"
+"""
+
+import os
+import argparse
+from typing import List, Union
+
+import numpy as np
+import onnxruntime as ort
+from transformers import AutoTokenizer
+
+QUANTIZED_MODEL_FILE = "model_int8.onnx"
+
+
+class OnnxSentenceEncoder:
+    """
+    Mean-pooled sentence embeddings from an ONNX transformer model.
+
+    Mirrors the parts of the SentenceTransformer API used by JobVectorStore
+    (encode and get_sentence_embedding_dimension).
+    """
+
+    def __init__(self, model_dir: str, model_file: str = QUANTIZED_MODEL_FILE,
+                 max_length: int = 128):
+        """
+        Initialize OnnxSentenceEncoder.
+
+        Args:
+            model_dir: Directory holding the ONNX model and its tokenizer files
+            model_file: ONNX file to load from model_dir
+            max_length: Maximum number of tokens per text
+        """
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(os.path.join(model_dir, model_file), options,
+                                            providers=["CPUExecutionProvider"])
+        self._input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self._dim = self.session.get_outputs()[0].shape[-1]
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self._dim
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32,
+               convert_to_numpy: bool = True, show_progress_bar: bool = False,
+               normalize_embeddings: bool = False) -> np.ndarray:
+        """
+        Encode texts into mean-pooled embeddings.
+
+        All texts are tokenized in one call up front, then sorted by token
+        count so each batch is only padded to its own longest text; the
+        output keeps the input order.
+
+        Args:
+            sentences: Text or list of texts
+            batch_size: Number of texts per forward pass
+            convert_to_numpy: Accepted for API compatibility (always numpy)
+            show_progress_bar: Accepted for API compatibility (ignored)
+            normalize_embeddings: L2-normalize the embeddings
+
+        Returns:
+            Array of shape (len(sentences), dim), or (dim,) for a single text
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        encoded = self.tokenizer(texts, padding=False, truncation=True, max_length=self.max_length)
+        input_ids = encoded["input_ids"]
+        token_type_ids = encoded.get("token_type_ids")
+        lengths = np.fromiter((len(ids) for ids in input_ids), dtype=np.int64, count=len(texts))
+        pad_id = self.tokenizer.pad_token_id or 0
+
+        embeddings = np.empty((len(texts), self._dim), dtype=np.float32)
+        order = np.argsort(lengths, kind="stable")
+        for start in range(0, len(texts), batch_size):
+            batch = order[start:start + batch_size]
+            width = int(lengths[batch].max())
+
+            # Pad the pre-tokenized ids into dense arrays for this batch
+            ids = np.full((len(batch), width), pad_id, dtype=np.int64)
+            types = np.zeros((len(batch), width), dtype=np.int64)
+            for row, i in enumerate(batch):
+                ids[row, :lengths[i]] = input_ids[i]
+                if token_type_ids is not None:
+                    types[row, :lengths[i]] = token_type_ids[i]
+            mask = (np.arange(width) < lengths[batch][:, None]).astype(np.int64)
+
+            inputs = {"input_ids": ids, "attention_mask": mask, "token_type_ids": types}
+            feeds = {name: inputs[name] for name in self._input_names}
+            token_embeddings = self.session.run(None, feeds)[0]
+
+            weights = mask[..., None].astype(np.float32)
+            summed = (token_embeddings * weights).sum(axis=1)
+            embeddings[batch] = summed / np.clip(weights.sum(axis=1), 1e-9, None)
+
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+
+def export_encoder(model_name: str, output_dir: str) -> str:
+    """
+    Export a sentence-transformer model to ONNX and quantize it to int8.
+
+    Args:
+        model_name: Hugging Face model name
+        output_dir: Directory for the ONNX models and tokenizer files
+
+    Returns:
+        Path to the quantized model
+    """
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    print(f"Exporting {model_name} to ONNX")
+    model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+    model.save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(output_dir)
+
+    quantized_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+    print(f"Quantizing weights to int8: {quantized_path}")
+    quantize_dynamic(os.path.join(output_dir, "model.onnx"), quantized_path,
+                     weight_type=QuantType.QInt8)
+    return quantized_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the job embedding model to int8 ONNX')
+    parser.add_argument('--model', type=str,
+                        default='sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2',
+                        help='Sentence-transformer model to export')
+    parser.add_argument('--output-dir', type=str, default='encoder_onnx',
+                        help='Directory for the exported model')
+    args = parser.parse_args()
+
+    export_encoder(args.model, args.output_dir)
+    print(f"Done. Use it with: adzuna_integration.py --onnx-model {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
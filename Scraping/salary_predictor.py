@@ -6,7 +6,7 @@ This module provides salary prediction functionality based on job parameters
 using a machine learning model trained on job data.
 
 Usage:
-    from salary_predictor import predict_job_salary
+    from salary_predictor import predict_job_salary, predict_job_salaries
     
     # Predict a salary
     predicted_salary = predict_job_salary(
@@ -18,15 +18,35 @@ Usage:
         job_type="full_time",
         skills_count=5
     )
+    
+    # Predict salaries for a list of jobs with one model call
+    predicted_salaries = predict_job_salaries([
+        {"title": "Data Scientist", "dept_category": "Data Science", "experience_years": 2},
+        {"title": "Senior Accountant", "dept_category": "Finance & Accounting", "location": "Rabat"},
+    ])
 """
 
 import os
+import re
+import json
+import hashlib
+import functools
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import joblib
 import pandas as pd
 import numpy as np
 import logging
 from typing import Dict, Any, Tuple, Union, List, Optional
 
+# Aho-Corasick finds every keyword of a table in one pass over the text
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +57,11 @@ logger = logging.getLogger(__name__)
 # Path to the model file
 MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
                          "adzuna_data/models/salary_predictor.pkl")
+# LightGBM-native export of the same model: booster text file + preprocessing parameters
+NATIVE_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "adzuna_data/models/salary_predictor.lgb")
+ENCODER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "adzuna_data/models/salary_predictor_encoder.json")
 
 # Department categories mapping for standardization
 DEPARTMENT_CATEGORIES = {
@@ -76,34 +101,301 @@ LOCATION_ADJUSTMENTS = {
 # Department default
 DEFAULT_DEPARTMENT = "General"
 
+# Number of raw model predictions kept, keyed by their feature values
+PREDICTION_CACHE_SIZE = 4096
+# Batches of at least this many jobs extract their features in worker processes
+PARALLEL_BATCH_SIZE = 100000
+PARALLEL_CHUNK_SIZE = 10000
+
+# Model input columns, in the order extract_job_features returns them
+_FEATURE_ORDER = ('dept_category', 'job_type', 'experience_years', 'is_remote', 'is_hybrid', 'is_fulltime',
+                  'is_contract', 'skills_count', 'is_senior', 'is_junior', 'is_manager')
+_FEATURE_INDEX = {column: i for i, column in enumerate(_FEATURE_ORDER)}
+
+# Seniority model features are substring matches on the lowercased title, as
+# in the features the model was trained on; whole words would shift them
+SENIOR_PATTERN = re.compile(r'senior|lead|sr|principal')
+JUNIOR_PATTERN = re.compile(r'junior|assistant|jr|entry')
+MANAGER_PATTERN = re.compile(r'manager|director|head|chief')
+
+# Fallback title keywords, matched against whole words of the title (with common inflections)
+SENIOR_TERMS = frozenset({'senior', 'lead', 'leads', 'leader', 'sr', 'principal'})
+JUNIOR_TERMS = frozenset({'junior', 'assistant', 'assistants', 'assistante', 'jr', 'entry'})
+MANAGER_TERMS = frozenset({'manager', 'managers', 'director', 'directors', 'head', 'chief'})
+MID_LEVEL_TERMS = frozenset({'mid', 'developer', 'developers', 'engineer', 'engineers'})
+DATA_ROLE_TERMS = frozenset({'data', 'ai', 'intelligence'})
+WORD_PATTERN = re.compile(r'[^\W\d_]+')
+
+def _title_words(title: str) -> frozenset:
+    """Lowercased words of a job title"""
+    return frozenset(WORD_PATTERN.findall(title.lower()))
+
+@functools.lru_cache(maxsize=4096)
+def _title_seniority_features(title: str) -> Tuple[int, int, int]:
+    """(is_senior, is_junior, is_manager) model features of a job title"""
+    title_lower = title.lower()
+    return (
+        1 if SENIOR_PATTERN.search(title_lower) else 0,
+        1 if JUNIOR_PATTERN.search(title_lower) else 0,
+        1 if MANAGER_PATTERN.search(title_lower) else 0,
+    )
+
+@functools.lru_cache(maxsize=4096)
+def _detect_title_tier(title: str) -> Tuple[int, int, int, int, bool]:
+    """(is_senior, is_junior, is_manager, is_mid_level, is_data_role) fallback tiers of a job title"""
+    words = _title_words(title)
+    return (
+        int(bool(words & SENIOR_TERMS)),
+        int(bool(words & JUNIOR_TERMS)),
+        int(bool(words & MANAGER_TERMS)),
+        int(bool(words & MID_LEVEL_TERMS)),
+        bool(words & DATA_ROLE_TERMS or {'machine', 'learning'} <= words),
+    )
+
+def _build_automaton(table: Dict[str, Any]):
+    """Compile the keys of a keyword table into an Aho-Corasick automaton"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    # Each key keeps its position in the table, so the earliest entry still wins
+    for priority, (key, value) in enumerate(table.items()):
+        automaton.add_word(key, (priority, value))
+    automaton.make_automaton()
+    return automaton
+
+def _first_match(automaton, table: Dict[str, Any], text: str, default: Any) -> Any:
+    """Value of the first key of the table (in table order) contained in text"""
+    if automaton is not None:
+        best = None
+        for _, match in automaton.iter(text):
+            if best is None or match[0] < best[0]:
+                best = match
+        return best[1] if best is not None else default
+    
+    for key, value in table.items():
+        if key in text:
+            return value
+    return default
+
+_department_automaton = _build_automaton(DEPARTMENT_CATEGORIES)
+_location_automaton = _build_automaton(LOCATION_ADJUSTMENTS)
+
 def load_model():
     """Load the salary prediction model"""
     try:
-        return joblib.load(MODEL_PATH)
+        # Array attributes stay backed by the file, so processes share them through the page cache
+        return joblib.load(MODEL_PATH, mmap_mode='r')
     except Exception as e:
         logger.error(f"Error loading salary prediction model: {e}")
         return None
 
-# Load the model at module import time
-_model = load_model()
+def build_fast_path(model) -> Optional[Dict[str, Any]]:
+    """
+    Unpack a fitted preprocessor + regressor pipeline for single-row prediction.
+    
+    Going through the pipeline costs a DataFrame and the ColumnTransformer
+    machinery per call, which dominates the predict time of one row. The
+    StandardScaler means/scales and the OneHotEncoder categories are read once
+    here, so a row can be encoded straight into a float array and passed to the
+    regressor.
+    
+    Returns:
+        Encoding plan, or None if the pipeline layout is not the expected one
+        (predictions then go through the full pipeline)
+    """
+    try:
+        from sklearn.preprocessing import StandardScaler, OneHotEncoder
+        
+        preprocessor = model.named_steps['preprocessor']
+        regressor = model.named_steps['regressor']
+        numeric_blocks = []
+        categorical_columns = []
+        width = 0
+        for name, transformer, columns in preprocessor.transformers_:
+            if isinstance(transformer, str) and transformer == 'drop':
+                continue
+            if isinstance(transformer, StandardScaler):
+                mean = transformer.mean_ if transformer.with_mean else np.zeros(len(columns))
+                scale = transformer.scale_ if transformer.with_std else np.ones(len(columns))
+                numeric_blocks.append((list(columns), width, np.asarray(mean, dtype=np.float64),
+                                       np.asarray(scale, dtype=np.float64)))
+                width += len(columns)
+            elif (isinstance(transformer, OneHotEncoder) and transformer.handle_unknown == 'ignore'
+                  and transformer.drop_idx_ is None and not getattr(transformer, '_infrequent_enabled', False)):
+                for column, categories in zip(columns, transformer.categories_):
+                    categorical_columns.append((column, {category: width + i for i, category in enumerate(categories)}))
+                    width += len(categories)
+            else:
+                return None
+        
+        if width != regressor.n_features_in_:
+            return None
+        return {
+            'regressor': regressor,
+            'numeric_blocks': numeric_blocks,
+            'categorical_columns': categorical_columns,
+            'width': width,
+        }
+    except Exception as e:
+        logger.warning(f"Using the full prediction pipeline: {e}")
+        return None
+
+# The model is loaded on first prediction, not at import time
+_model = None
+_fast_path = None
+_num_iteration = None  # trees used per prediction (None for all)
+_model_loaded = False
+_model_lock = threading.Lock()
+# Encoded row reused across predictions, one per thread
+_row_buffers = threading.local()
+# Raw model predictions by feature tuple, least recently used first
+_prediction_cache: "OrderedDict[tuple, float]" = OrderedDict()
+_prediction_cache_lock = threading.Lock()
+
+def _model_digest() -> Optional[str]:
+    """Hash of the pickled model, tying a native export to the model it came from"""
+    if not os.path.exists(MODEL_PATH):
+        return None
+    with open(MODEL_PATH, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def export_native_model(model, num_iteration: Optional[int] = None) -> bool:
+    """
+    Save a LightGBM pipeline in LightGBM's native format next to the pickle
+    
+    The booster goes to a text model file and the preprocessing parameters
+    (scaler means/scales, one-hot positions) to JSON, so predictions can be
+    served without unpickling the sklearn pipeline. Stale exports are removed
+    when the model can't be exported.
+    
+    Args:
+        model: Fitted preprocessor + regressor pipeline
+        num_iteration: Number of trees used per prediction (None for all)
+        
+    Returns:
+        True if the native files were written
+    """
+    fast_path = build_fast_path(model)
+    booster = getattr(fast_path['regressor'], 'booster_', None) if fast_path else None
+    if booster is None or not all(isinstance(category, str)
+                                  for _, index in fast_path['categorical_columns'] for category in index):
+        for path in (NATIVE_MODEL_PATH, ENCODER_PATH):
+            if os.path.exists(path):
+                os.remove(path)
+        return False
+    
+    booster.save_model(NATIVE_MODEL_PATH)
+    encoder = {
+        'numeric_blocks': [[columns, start, mean.tolist(), scale.tolist()]
+                           for columns, start, mean, scale in fast_path['numeric_blocks']],
+        'categorical_columns': [[column, index] for column, index in fast_path['categorical_columns']],
+        'width': fast_path['width'],
+        'num_iteration': num_iteration,
+        'model_digest': _model_digest(),
+    }
+    with open(ENCODER_PATH, 'w', encoding='utf-8') as f:
+        json.dump(encoder, f, ensure_ascii=False)
+    return True
+
+def _read_encoder() -> Optional[Dict[str, Any]]:
+    """Encoder JSON of the native export, or None if it doesn't belong to the current pickled model"""
+    try:
+        if not os.path.exists(ENCODER_PATH):
+            return None
+        with open(ENCODER_PATH, 'r', encoding='utf-8') as f:
+            encoder = json.load(f)
+        # File times can't be trusted after a checkout, the content can
+        if encoder.get('model_digest') != _model_digest():
+            return None
+        return encoder
+    except Exception as e:
+        logger.warning(f"Could not read the native model encoder: {e}")
+        return None
+
+def load_native_model(encoder: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Load the LightGBM-native export as a fast path
+    
+    Args:
+        encoder: Encoder JSON already read with _read_encoder (read here if None)
+    
+    Returns:
+        Fast path using the native booster, or None if there is no export of
+        the current pickled model or LightGBM is not installed
+    """
+    try:
+        encoder = encoder or _read_encoder()
+        if encoder is None or not os.path.exists(NATIVE_MODEL_PATH):
+            return None
+        
+        import lightgbm
+        
+        return {
+            'regressor': lightgbm.Booster(model_file=NATIVE_MODEL_PATH),
+            'numeric_blocks': [(columns, start, np.asarray(mean, dtype=np.float64), np.asarray(scale, dtype=np.float64))
+                               for columns, start, mean, scale in encoder['numeric_blocks']],
+            'categorical_columns': [(column, index) for column, index in encoder['categorical_columns']],
+            'width': encoder['width'],
+        }
+    except Exception as e:
+        logger.warning(f"Could not load native salary model, using the pickled one: {e}")
+        return None
+
+def _get_model():
+    """Load the model (and its fast path) on first use; None if it is unavailable"""
+    global _model, _fast_path, _num_iteration, _model_loaded
+    if not _model_loaded:
+        with _model_lock:
+            if not _model_loaded:
+                # The tree cut recorded with the export applies to every load path,
+                # so a job gets the same prediction whichever model is used
+                encoder = _read_encoder()
+                _num_iteration = encoder.get('num_iteration') if encoder else None
+                # The native export skips unpickling the whole sklearn pipeline
+                _fast_path = load_native_model(encoder)
+                if _fast_path is not None:
+                    _model = _fast_path['regressor']
+                else:
+                    _model = load_model()
+                    _fast_path = build_fast_path(_model) if _model is not None else None
+                _model_loaded = True
+    return _model
+
+def _encode_features(features_list: List[Tuple]) -> np.ndarray:
+    """Encode extracted features, one row per job, the way the pipeline's preprocessor does."""
+    if len(features_list) == 1:
+        rows = getattr(_row_buffers, 'row', None)
+        if rows is None:
+            rows = _row_buffers.row = np.empty((1, _fast_path['width']), dtype=np.float64)
+        rows.fill(0.0)
+    else:
+        rows = np.zeros((len(features_list), _fast_path['width']), dtype=np.float64)
+    
+    for columns, start, mean, scale in _fast_path['numeric_blocks']:
+        positions = [_FEATURE_INDEX[column] for column in columns]
+        values = np.array([[features[p] for p in positions] for features in features_list], dtype=np.float64)
+        rows[:, start:start + len(columns)] = (values - mean) / scale
+    
+    # Unknown categories stay all-zero, like handle_unknown='ignore'
+    for column, index in _fast_path['categorical_columns']:
+        p = _FEATURE_INDEX[column]
+        for i, features in enumerate(features_list):
+            position = index.get(features[p])
+            if position is not None:
+                rows[i, position] = 1.0
+    return rows
 
 def standardize_department(department_text: str) -> str:
     """Convert department text to standard category"""
     if not department_text:
         return DEFAULT_DEPARTMENT
         
-    department_text = department_text.lower()
-    
-    # Try direct match first
-    for key, category in DEPARTMENT_CATEGORIES.items():
-        if key in department_text:
-            return category
-    
     # Default category if no match
-    return DEFAULT_DEPARTMENT
+    return _first_match(_department_automaton, DEPARTMENT_CATEGORIES,
+                        department_text.lower(), DEFAULT_DEPARTMENT)
 
-def extract_job_features(job_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract features from a job dict for prediction"""
+def extract_job_features(job_data: Dict[str, Any]) -> Tuple:
+    """Extract features from a job dict for prediction, as a tuple in _FEATURE_ORDER"""
     # Get basic data
     title = job_data.get('title', '')
     dept_category = job_data.get('dept_category', '')
@@ -125,34 +417,19 @@ def extract_job_features(job_data: Dict[str, Any]) -> Dict[str, Any]:
     # Check for skills count
     skills_count = int(job_data.get('skills_count', 5))
     
-    # Pre-computed flags for title seniority
-    is_senior = int(job_data.get('is_senior', 0))
-    is_junior = int(job_data.get('is_junior', 0))
-    is_manager = int(job_data.get('is_manager', 0))
-    
-    # If flags not provided, infer from title
-    if not any([is_senior, is_junior, is_manager]):
-        title_lower = title.lower()
-        is_senior = 1 if any(term in title_lower for term in ['senior', 'lead', 'sr', 'principal']) else 0
-        is_junior = 1 if any(term in title_lower for term in ['junior', 'assistant', 'jr', 'entry']) else 0
-        is_manager = 1 if any(term in title_lower for term in ['manager', 'director', 'head', 'chief']) else 0
-    
-    # Create feature dict
-    features = {
-        'dept_category': [dept_category],
-        'job_type': [job_type],
-        'experience_years': [experience_years],
-        'is_remote': [is_remote],
-        'is_hybrid': [is_hybrid],
-        'is_fulltime': [is_fulltime],
-        'is_contract': [is_contract],
-        'skills_count': [skills_count],
-        'is_senior': [is_senior],
-        'is_junior': [is_junior],
-        'is_manager': [is_manager]
-    }
+    # Trust pre-computed seniority flags; infer from the title only if none are provided
+    if 'is_senior' in job_data or 'is_junior' in job_data or 'is_manager' in job_data:
+        is_senior = int(job_data.get('is_senior', 0))
+        is_junior = int(job_data.get('is_junior', 0))
+        is_manager = int(job_data.get('is_manager', 0))
+    else:
+        is_senior, is_junior, is_manager = _title_seniority_features(title)
     
-    logger.info(f"Extracted features: {features}")
+    # Create feature row
+    features = (dept_category, job_type, experience_years, is_remote, is_hybrid, is_fulltime,
+                is_contract, skills_count, is_senior, is_junior, is_manager)
+    
+    logger.debug("Extracted features: %s", features)
     return features
 
 def predict_job_salary(**kwargs) -> Dict[str, Any]:
@@ -176,90 +453,170 @@ def predict_job_salary(**kwargs) -> Dict[str, Any]:
     Returns:
         Dictionary with predicted salary range and confidence score
     """
+    return predict_job_salaries([kwargs])[0]
+
+def predict_job_salaries(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Predict salaries for several jobs with a single model call
+    
+    Args:
+        jobs: Job attribute dicts, with the same keys as predict_job_salary's arguments
+        
+    Returns:
+        One dictionary with predicted salary range and confidence score per job
+    """
+    if not jobs:
+        return []
+    
     # Check if model is available
-    if _model is None:
+    if _get_model() is None:
         logger.warning("Salary prediction model not available, using fallback")
-        return _fallback_prediction(
-            kwargs.get('title', ''),
-            kwargs.get('experience_years', 0),
-            kwargs.get('location', None),
-            kwargs.get('is_senior', 0),
-            kwargs.get('is_manager', 0)
-        )
+        return [_fallback_for(job) for job in jobs]
     
     # Extract features for prediction
-    features = extract_job_features(kwargs)
+    features_list = _extract_all_features(jobs)
     
     # Make prediction
     try:
-        df = pd.DataFrame(features)
-        prediction = _model.predict(df)[0]
+        predictions = _predict_cached(features_list)
         
         # Determine range and confidence
         confidence = 0.85
         # For LightGBM model, we have slightly tighter ranges
-        min_salary = int(prediction * 0.85)
-        max_salary = int(prediction * 1.15)
+        min_salaries = np.trunc(predictions * 0.85)
+        max_salaries = np.trunc(predictions * 1.15)
         
-        # Apply location adjustment if available
-        location = kwargs.get('location')
-        if location:
-            location_adjustment = _get_location_adjustment(location)
-            min_salary = int(min_salary * location_adjustment)
-            max_salary = int(max_salary * location_adjustment)
-            prediction = int(prediction * location_adjustment)
+        # Apply location adjustment if available (1.0 without a location)
+        location_adjustments = np.array([_get_location_adjustment(job.get('location')) for job in jobs])
+        min_salaries = np.trunc(min_salaries * location_adjustments).astype(int)
+        max_salaries = np.trunc(max_salaries * location_adjustments).astype(int)
+        predictions = np.trunc(predictions * location_adjustments).astype(int)
         
-        return {
-            'min': min_salary,
-            'max': max_salary,
-            'predicted': int(prediction),
-            'currency': 'MAD',
-            'confidence': confidence
-        }
+        return [
+            {
+                'min': int(min_salary),
+                'max': int(max_salary),
+                'predicted': int(prediction),
+                'currency': 'MAD',
+                'confidence': confidence
+            }
+            for min_salary, max_salary, prediction in zip(min_salaries, max_salaries, predictions)
+        ]
         
     except Exception as e:
         logger.error(f"Error predicting salary: {e}")
-        return _fallback_prediction(
-            kwargs.get('title', ''),
-            kwargs.get('experience_years', 0),
-            kwargs.get('location', None),
-            kwargs.get('is_senior', 0),
-            kwargs.get('is_manager', 0)
-        )
+        return [_fallback_for(job) for job in jobs]
+
+def _extract_chunk(jobs: List[Dict[str, Any]]) -> List[Tuple]:
+    """Extract features for a chunk of jobs (runs in a worker process)"""
+    return [extract_job_features(job) for job in jobs]
+
+def _extract_all_features(jobs: List[Dict[str, Any]]) -> List[Tuple]:
+    """
+    Extract features for a batch of jobs, in the order given
+    
+    Extraction is pure Python, so threads would only take turns on the GIL.
+    Large batches (e.g. a nightly re-score) are split over worker processes
+    instead; smaller ones aren't worth the cost of starting them. As with any
+    spawned process, the calling script needs an ``if __name__ == "__main__"``
+    guard.
+    """
+    workers = os.cpu_count() or 1
+    if len(jobs) < PARALLEL_BATCH_SIZE or workers < 2:
+        return _extract_chunk(jobs)
+    
+    chunks = [jobs[i:i + PARALLEL_CHUNK_SIZE] for i in range(0, len(jobs), PARALLEL_CHUNK_SIZE)]
+    try:
+        # spawn, as forking a process that has run LightGBM's OpenMP threads can hang
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return [features for chunk in executor.map(_extract_chunk, chunks) for features in chunk]
+    except Exception as e:
+        logger.warning(f"Parallel feature extraction failed, extracting serially: {e}")
+        return _extract_chunk(jobs)
+
+def _predict_raw(features_list: List[Tuple]) -> np.ndarray:
+    """Run the model on extracted features, one prediction per job"""
+    # Trailing trees dropped at export time, see update_salary_model.py --num-iteration
+    options = {'num_iteration': _num_iteration} if _num_iteration else {}
+    if _fast_path is not None:
+        predictions = _fast_path['regressor'].predict(_encode_features(features_list), **options)
+    else:
+        df = pd.DataFrame(features_list, columns=list(_FEATURE_ORDER))
+        predictions = _model.predict(df, **options)
+    return np.asarray(predictions, dtype=np.float64)
+
+def _predict_cached(features_list: List[Tuple]) -> np.ndarray:
+    """
+    Model predictions for extracted features, reusing earlier results
+    
+    Job titles repeat a lot, so identical feature sets are common. Only the
+    feature sets not seen recently go to the model, in a single call. Location
+    is not a model feature, so jobs differing only by location share an entry.
+    """
+    predictions = np.empty(len(features_list), dtype=np.float64)
+    missing = {}
+    with _prediction_cache_lock:
+        for i, key in enumerate(features_list):
+            cached = _prediction_cache.get(key)
+            if cached is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                _prediction_cache.move_to_end(key)
+                predictions[i] = cached
+    
+    if missing:
+        computed = _predict_raw([features_list[rows[0]] for rows in missing.values()])
+        with _prediction_cache_lock:
+            for (key, rows), prediction in zip(missing.items(), computed):
+                predictions[rows] = prediction
+                _prediction_cache[key] = float(prediction)
+                if len(_prediction_cache) > PREDICTION_CACHE_SIZE:
+                    _prediction_cache.popitem(last=False)
+    return predictions
+
+def _fallback_for(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Fallback prediction from a job attribute dict"""
+    return _fallback_prediction(
+        job.get('title', ''),
+        job.get('experience_years', 0),
+        job.get('location', None),
+        job.get('is_senior', 0),
+        job.get('is_manager', 0)
+    )
 
+@functools.lru_cache(maxsize=4096)
 def _get_location_adjustment(location: str) -> float:
-    """Get salary adjustment factor based on location"""
+    """Get salary adjustment factor based on location (job locations repeat a lot, so results are cached)"""
     if not location:
         return 1.0
-        
     location = location.lower()
     
-    # Check for exact city matches
-    for city, adjustment in LOCATION_ADJUSTMENTS.items():
-        if city in location:
-            return adjustment
+    # A plain city name is a direct lookup
+    adjustment = LOCATION_ADJUSTMENTS.get(location)
+    if adjustment is not None:
+        return adjustment
     
-    # Default adjustment if no match
-    return 1.0
+    # Otherwise search city names in the text; default adjustment if no match
+    return _first_match(_location_automaton, LOCATION_ADJUSTMENTS, location, 1.0)
 
 def _fallback_prediction(title: str, experience_years: float, location: str = None, is_senior: int = 0, is_manager: int = 0) -> Dict[str, Any]:
     """Fallback prediction when model is unavailable"""
     # Base salary by experience and title
     base_salary = 0
-    title_lower = title.lower()
+    title_senior, _, title_manager, title_mid_level, data_role = _detect_title_tier(title)
     
     # Use is_senior and is_manager if provided
-    if is_manager == 1 or any(term in title_lower for term in ['manager', 'director', 'chief', 'head']):
+    if is_manager == 1 or title_manager:
         base_salary = 75000
-    elif is_senior == 1 or any(term in title_lower for term in ['senior', 'lead']) or experience_years > 5:
+    elif is_senior == 1 or title_senior or experience_years > 5:
         base_salary = 60000
-    elif any(term in title_lower for term in ['mid', 'developer', 'engineer']) or experience_years > 2:
+    elif title_mid_level or experience_years > 2:
         base_salary = 40000
     else:
         base_salary = 30000
     
     # Adjust for data/ML roles
-    if any(term in title_lower for term in ['data', 'machine learning', 'ai', 'intelligence']):
+    if data_role:
         base_salary *= 1.15
     
     # Adjust for location
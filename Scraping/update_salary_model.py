@@ -7,10 +7,14 @@ It extracts features from the job listings, trains a new model, and saves it to
 
 Usage:
     python update_salary_model.py [--verbose] [--test-ratio=0.2]
+    python update_salary_model.py --export-native [--num-iteration=N]
 
 Options:
     --verbose       Print detailed information during training
     --test-ratio    Ratio of data to use for testing (default: 0.2)
+    --export-native Only re-export the current model in LightGBM native format
+    --num-iteration Trees used per prediction in the native export, checked
+                    against the data to stay within the predicted range (default: all)
 """
 
 import os
@@ -31,6 +35,7 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import xgboost as xgb
 import lightgbm as lgb
 import catboost as cb
+from salary_predictor import export_native_model
 
 # Configure logging
 logging.basicConfig(
@@ -49,6 +54,9 @@ MODELS_DIR = os.path.join(DATA_DIR, "models")
 MODEL_PATH = os.path.join(MODELS_DIR, "salary_predictor.pkl")
 OLD_MODEL_PATH = os.path.join(MODELS_DIR, "salary_predictor_old.pkl")
 
+# Largest relative change truncating trees may cause (the predictor reports a ±15% range)
+TRUNCATION_TOLERANCE = 0.15
+
 # Department categories for standardization
 DEPARTMENT_CATEGORIES = {
     "it": "IT & Technology",
@@ -77,6 +85,10 @@ def parse_args():
     parser.add_argument('--verbose', action='store_true', help='Print detailed information')
     parser.add_argument('--test-ratio', type=float, default=0.2, 
                         help='Ratio of data to use for testing (default: 0.2)')
+    parser.add_argument('--export-native', action='store_true',
+                        help='Only re-export the current model in LightGBM native format')
+    parser.add_argument('--num-iteration', type=int, default=None,
+                        help='With --export-native, number of trees used per prediction (default: all)')
     return parser.parse_args()
 
 def standardize_department(text):
@@ -501,6 +513,22 @@ def train_model(data, test_ratio=0.2, verbose=False):
     
     return best_model
 
+def check_truncation(model, data, num_iteration):
+    """Check that predicting with the first num_iteration trees stays within tolerance."""
+    X = data.drop('salary', axis=1)
+    y = data['salary']
+    regressor = model.named_steps['regressor']
+    X_encoded = model.named_steps['preprocessor'].transform(X)
+    
+    full = regressor.predict(X_encoded)
+    truncated = regressor.predict(X_encoded, num_iteration=num_iteration)
+    max_change = np.max(np.abs(truncated - full) / np.abs(full))
+    
+    logger.info(f"Trees: {regressor.booster_.num_trees()} -> {num_iteration}")
+    logger.info(f"MAE: {mean_absolute_error(y, full):.2f} -> {mean_absolute_error(y, truncated):.2f}")
+    logger.info(f"Largest prediction change: {max_change * 100:.1f}%")
+    return max_change <= TRUNCATION_TOLERANCE
+
 def save_model(model):
     """Save the trained model to disk."""
     if model is None:
@@ -516,6 +544,10 @@ def save_model(model):
         # Save new model
         joblib.dump(model, MODEL_PATH)
         logger.info(f"Saved new model to {MODEL_PATH}")
+        
+        # Native export loads much faster in salary_predictor (LightGBM models only)
+        if export_native_model(model):
+            logger.info("Exported model in LightGBM native format")
         return True
     
     except Exception as e:
@@ -531,6 +563,19 @@ def main():
     if verbose:
         logger.setLevel(logging.DEBUG)
     
+    if args.export_native:
+        model = joblib.load(MODEL_PATH)
+        if args.num_iteration:
+            data = load_and_process_data(verbose)
+            if data is None or not check_truncation(model, data, args.num_iteration):
+                logger.error(f"Keeping {args.num_iteration} trees changes predictions too much. Exiting.")
+                return 1
+        if not export_native_model(model, args.num_iteration):
+            logger.error("Current model can't be exported in LightGBM native format")
+            return 1
+        logger.info("Exported model in LightGBM native format")
+        return 0
+    
     logger.info("=" * 60)
     logger.info(f"Starting salary model update at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     